@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad, DIAS_SEMANA
+from src.eventos import RegistroNulo
+
+# GENERADORES DE DATOS SINTETICOS REPRODUCIBLES (MISMA SEMILLA, MISMOS DATOS)
+
+SEMILLA = 2025
+INICIO = datetime(2025, 1, 6, 8, 0)  # LUNES
+TURNOS_POR_DIA = 20                  # 08:00 A 18:00 CADA 30 MINUTOS
+ESPECIALIDADES = ("cardiologia", "pediatria", "traumatologia", "dermatologia", "clinica medica", "neurologia")
+NOMBRES = ("María", "Juan", "José", "Ana", "Carlos", "Lucía", "Sofía", "Martín", "Valentina", "Mateo", "Camila", "Diego")
+APELLIDOS = ("González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez", "García", "Sánchez", "Romero", "Sosa")
+
+
+def generar_pacientes(cantidad: int, semilla: int = SEMILLA) -> list[Paciente]:
+    azar = random.Random(semilla)
+    return [
+        Paciente(
+            f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}",
+            str(10_000_000 + i),
+            f"{azar.randint(1, 28):02d}/{azar.randint(1, 12):02d}/{azar.randint(1940, 2020)}"
+        )
+        for i in range(cantidad)
+    ]
+
+
+def generar_medicos(cantidad: int) -> list[Medico]:
+    # TODOS ATIENDEN DE LUNES A VIERNES: CUALQUIER DIA HABIL ES UN TURNO VALIDO
+    return [
+        Medico(f"Dr. Medico {i}", f"MN{100_000 + i}", [Especialidad(ESPECIALIDADES[i % len(ESPECIALIDADES)], list(DIAS_SEMANA[:5]))])
+        for i in range(cantidad)
+    ]
+
+
+def horario(posicion: int) -> datetime:
+    # posicion-ESIMO TURNO DE UN MEDICO, SALTEANDO FINES DE SEMANA
+    dia, turno = divmod(posicion, TURNOS_POR_DIA)
+    semana, dia_habil = divmod(dia, 5)
+    return INICIO + timedelta(days=semana * 7 + dia_habil, minutes=30 * turno)
+
+
+def generar_turnos(pacientes: list[Paciente], medicos: list[Medico], cantidad: int, desde: int = 0, semilla: int = SEMILLA) -> list[tuple]:
+    # FILAS (dni, matricula, especialidad, fecha_hora) SIN SUPERPOSICIONES: EL TURNO i ES DEL MEDICO
+    # i % M EN SU HORARIO i // M. desde PERMITE GENERAR MAS TURNOS SIN PISAR LOS ANTERIORES
+    azar = random.Random(semilla + desde)
+    filas = []
+    for i in range(desde, desde + cantidad):
+        medico = medicos[i % len(medicos)]
+        filas.append((
+            azar.choice(pacientes).obtener_dni(),
+            medico.obtener_matricula(),
+            medico.obtener_especialidades()[0].obtener_especialidad(),
+            horario(i // len(medicos))
+        ))
+    return filas
+
+
+def armar_clinica(pacientes: list[Paciente], medicos: list[Medico], turnos: list[tuple]) -> Clinica:
+    clinica = Clinica({}, {}, [], {}, registro=RegistroNulo())
+    clinica.agregar_medicos_lote(medicos)
+    clinica.agregar_pacientes_lote(pacientes)
+    clinica.agendar_turnos_lote(turnos)
+    return clinica
@@ -0,0 +1,57 @@
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+
+CANTIDAD = 20_000
+DIAS = ["lunes", "miercoles", "viernes"]
+
+
+def bytes_por_objeto(crear, cantidad: int = CANTIDAD) -> float:
+    # BYTES RETENIDOS POR OBJETO (OBJETO + ATRIBUTOS NUEVOS), SIN CONTAR LOS DATOS DE ENTRADA
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = [crear(i) for i in range(cantidad)]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    lista = sys.getsizeof(objetos)
+    return (despues - antes - lista) / cantidad
+
+
+def medir(nombre: str, crear) -> float:
+    por_objeto = bytes_por_objeto(crear)
+    print(f"{nombre:<14} {por_objeto:>8.1f} bytes/objeto")
+    return por_objeto
+
+
+def main() -> None:
+    nombres = [f"Paciente {i}" for i in range(CANTIDAD)]
+    dnis = [str(10_000_000 + i) for i in range(CANTIDAD)]
+    matriculas = [f"MN{100_000 + i}" for i in range(CANTIDAD)]
+    fechas = [datetime(2025, 1, 6, 8, 0) + timedelta(minutes=30 * i) for i in range(CANTIDAD)]
+    # DIAS Y ESPECIALIDADES LLEGAN COMO TEXTO NUEVO EN CADA FILA, COMO AL LEER UN ARCHIVO
+    dias_por_fila = [[d.upper().lower() for d in DIAS] for _ in range(CANTIDAD)]
+
+    paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+    medico = Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", DIAS)])
+    medicamentos = ["Aspirina"]
+
+    print(f"Python {sys.version.split()[0]} - {CANTIDAD} objetos por clase")
+    medir("Especialidad", lambda i: Especialidad("cardiologia", dias_por_fila[i]))
+    medir("Paciente", lambda i: Paciente(nombres[i], dnis[i], "01/01/1990"))
+    medir("Medico", lambda i: Medico(nombres[i], matriculas[i], [medico.obtener_especialidades()[0]]))
+    medir("Turno", lambda i: Turno(paciente, medico, fechas[i], "cardiologia"))
+    medir("Receta", lambda i: Receta(paciente, medico, medicamentos, fechas[i]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datos import generar_pacientes, generar_medicos, generar_turnos, armar_clinica
+from memoria_objetos import bytes_por_objeto
+from src.clinica import Clinica
+from src.eventos import RegistroNulo
+from src.paciente import Paciente
+from src.turno import Turno
+
+# USO:
+#   python benchmarks/suite.py                         CORRE Y COMPARA CONTRA LA LINEA DE BASE
+#   python benchmarks/suite.py --guardar-base          CORRE Y REEMPLAZA LA LINEA DE BASE
+#   python benchmarks/suite.py --escalas chica,grande --salida resultados.json
+# SALE CON CODIGO 1 SI ALGUNA METRICA EMPEORA MAS QUE LA TOLERANCIA RESPECTO DE LA BASE.
+# TODAS LAS METRICAS SON "MENOR ES MEJOR": MICROSEGUNDOS POR OPERACION O BYTES POR OBJETO
+
+ESCALAS = {
+    # (PACIENTES, MEDICOS, TURNOS)
+    "chica": (1_000, 50, 5_000),
+    "mediana": (10_000, 200, 50_000),
+    "grande": (100_000, 1_000, 500_000),
+}
+ESCALAS_POR_DEFECTO = ("chica", "mediana")
+OPERACIONES = 2_000
+REPETICIONES = 3
+TOLERANCIA = 0.25
+# LAS METRICAS DE FRACCIONES DE MICROSEGUNDO VARIAN MUCHO EN TERMINOS RELATIVOS: POR DEBAJO
+# DE ESTA DIFERENCIA ABSOLUTA NO SE CONSIDERA REGRESION
+MARGEN_ABSOLUTO = 0.5
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+
+def cronometrar(preparar, ejecutar, operaciones: int) -> float:
+    # MICROSEGUNDOS POR OPERACION: EL MEJOR DE VARIOS INTENTOS, CADA UNO CON SU PROPIO ESTADO
+    # (LAS OPERACIONES QUE MODIFICAN LA CLINICA NO SE PUEDEN REPETIR SOBRE LA MISMA)
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        estado = preparar()
+        gc.collect()
+        inicio = time.perf_counter()
+        ejecutar(estado)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1e6 / operaciones
+
+
+def medir_escala(nombre: str) -> dict[str, float]:
+    cantidad_pacientes, cantidad_medicos, cantidad_turnos = ESCALAS[nombre]
+    pacientes = generar_pacientes(cantidad_pacientes)
+    medicos = generar_medicos(cantidad_medicos)
+    turnos = generar_turnos(pacientes, medicos, cantidad_turnos)
+    # TURNOS NUEVOS, POSTERIORES A LOS YA CARGADOS
+    nuevos = generar_turnos(pacientes, medicos, OPERACIONES, desde=cantidad_turnos)
+    dnis = [fila[0] for fila in nuevos]
+    resultados = {}
+
+    def clinica_cargada():
+        return armar_clinica(pacientes, medicos, turnos)
+
+    def agendar(clinica):
+        for fila in nuevos:
+            clinica.agendar_turno(*fila)
+    resultados["agendar_turno_us"] = cronometrar(clinica_cargada, agendar, OPERACIONES)
+
+    clinica = clinica_cargada()
+
+    def validar_duplicado(_):
+        for _, matricula, _, fecha_hora in turnos[:OPERACIONES]:
+            clinica.validar_turno_duplicado(matricula, fecha_hora)
+    resultados["validar_turno_duplicado_us"] = cronometrar(lambda: None, validar_duplicado, OPERACIONES)
+
+    def emitir(clinica):
+        for fila in nuevos:
+            clinica.emitir_receta(fila[0], fila[1], ["Ibuprofeno 400"])
+    resultados["emitir_receta_us"] = cronometrar(clinica_cargada, emitir, OPERACIONES)
+
+    for fila in nuevos:
+        clinica.emitir_receta(fila[0], fila[1], ["Ibuprofeno 400"])
+
+    def obtener_historias(_):
+        for dni in dnis:
+            clinica.obtener_historia_clinica_por_DNI(dni)
+    resultados["obtener_historia_clinica_us"] = cronometrar(lambda: None, obtener_historias, OPERACIONES)
+
+    # CARGA MASIVA: ALTAS EN LOTE Y TODOS LOS TURNOS DE LA ESCALA
+    def carga_masiva(clinica):
+        clinica.agregar_medicos_lote(medicos)
+        clinica.agregar_pacientes_lote(pacientes)
+        clinica.agendar_turnos_lote(turnos)
+    resultados["carga_masiva_por_turno_us"] = cronometrar(lambda: Clinica({}, {}, [], {}, registro=RegistroNulo()), carga_masiva, cantidad_turnos)
+
+    # MEMORIA POR OBJETO CON DATOS DE ENTRADA NUEVOS EN CADA FILA, COMO AL LEER UN ARCHIVO
+    nombres = [p.obtener_nombre().upper().title() for p in pacientes]
+    paciente, medico = pacientes[0], medicos[0]
+    resultados["memoria_paciente_bytes"] = bytes_por_objeto(lambda i: Paciente(nombres[i], str(20_000_000 + i), "01/01/1990"), cantidad_pacientes)
+    resultados["memoria_turno_bytes"] = bytes_por_objeto(lambda i: Turno(paciente, medico, turnos[i][3], "cardiologia"), cantidad_turnos)
+
+    return resultados
+
+
+def comparar(actuales: dict[str, float], base: dict[str, float], tolerancia: float) -> list[str]:
+    regresiones = []
+    for metrica, valor in sorted(actuales.items()):
+        anterior = base.get(metrica)
+        if anterior is None:
+            print(f"{metrica:<46} {valor:>12.2f}   (sin base)")
+            continue
+        cambio = valor / anterior - 1 if anterior else 0.0
+        marca = "REGRESION" if cambio > tolerancia and valor - anterior > MARGEN_ABSOLUTO else ""
+        print(f"{metrica:<46} {valor:>12.2f} {anterior:>12.2f} {cambio:>+8.1%}  {marca}")
+        if marca:
+            regresiones.append(metrica)
+    return regresiones
+
+
+def main(argumentos: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos críticos de Clinica")
+    parser.add_argument("--escalas", default=",".join(ESCALAS_POR_DEFECTO), help="escalas separadas por coma: " + ", ".join(ESCALAS))
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--base", default=LINEA_BASE, help="línea de base contra la que comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="empeoramiento máximo aceptado (0.25 = 25%%)")
+    parser.add_argument("--guardar-base", action="store_true", help="reemplaza la línea de base con esta corrida")
+    opciones = parser.parse_args(argumentos)
+
+    escalas = [e.strip() for e in opciones.escalas.split(",") if e.strip()]
+    desconocidas = [e for e in escalas if e not in ESCALAS]
+    if desconocidas:
+        parser.error(f"escalas desconocidas: {', '.join(desconocidas)}")
+
+    metricas = {}
+    for escala in escalas:
+        print(f"escala {escala}: {ESCALAS[escala][0]} pacientes, {ESCALAS[escala][1]} médicos, {ESCALAS[escala][2]} turnos", file=sys.stderr)
+        for metrica, valor in medir_escala(escala).items():
+            metricas[f"{escala}.{metrica}"] = round(valor, 3)
+
+    resultado = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "metricas": metricas,
+    }
+    if opciones.salida:
+        with open(opciones.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2, sort_keys=True)
+
+    if opciones.guardar_base:
+        with open(opciones.base, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2, sort_keys=True)
+        print(f"línea de base guardada en {opciones.base}")
+        return 0
+
+    base = {}
+    if os.path.exists(opciones.base):
+        with open(opciones.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)["metricas"]
+    regresiones = comparar(metricas, base, opciones.tolerancia)
+    if regresiones:
+        print(f"{len(regresiones)} métricas empeoraron más de {opciones.tolerancia:.0%}: {', '.join(regresiones)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
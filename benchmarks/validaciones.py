@@ -0,0 +1,50 @@
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.validaciones import normalizar_dni, normalizar_matricula, validar_dnis
+
+CANTIDAD = 100_000
+REPETICIONES = 5
+
+
+# VALIDACION ANTERIOR (re.sub / re.match CON EL PATRON COMO TEXTO EN CADA LLAMADA)
+def dni_anterior(dni: str) -> str:
+    dni_limpio = re.sub(r'[.\s]', '', dni)
+    if not re.match(r'^\d{7,8}$', dni_limpio):
+        raise ValueError(dni)
+    return dni_limpio
+
+
+def matricula_anterior(matricula: str) -> str:
+    matricula_limpia = matricula.strip().upper()
+    if not re.match(r'^M[NP]\d{4,6}$', matricula_limpia):
+        raise ValueError(matricula)
+    return matricula_limpia
+
+
+def medir(nombre: str, funcion) -> float:
+    segundos = min(timeit.repeat(funcion, number=1, repeat=REPETICIONES))
+    print(f"{nombre:<32} {segundos * 1e9 / CANTIDAD:>8.1f} ns/valor")
+    return segundos
+
+
+def main() -> None:
+    dnis = [str(10_000_000 + i) for i in range(CANTIDAD)]
+    dnis_con_puntos = [f"{d[:2]}.{d[2:5]}.{d[5:]}" for d in dnis]
+    matriculas = [f"MN{100_000 + i}" for i in range(CANTIDAD)]
+
+    medir("dni anterior", lambda: [dni_anterior(d) for d in dnis])
+    medir("dni normalizado", lambda: [normalizar_dni(d) for d in dnis])
+    medir("dni normalizado (lote)", lambda: validar_dnis(dnis))
+    medir("dni con puntos anterior", lambda: [dni_anterior(d) for d in dnis_con_puntos])
+    medir("dni con puntos", lambda: [normalizar_dni(d) for d in dnis_con_puntos])
+    medir("matricula anterior", lambda: [matricula_anterior(m) for m in matriculas])
+    medir("matricula normalizada", lambda: [normalizar_matricula(m) for m in matriculas])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, date
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -9,6 +9,9 @@ try:
     from src.paciente import Paciente
     from src.medico import Medico
     from src.especialidad import Especialidad
+    from src.repositorio_sqlite import RepositorioSQLite
+    from src.reportes import utilizacion_por_medico, demanda_por_especialidad
+    from src.renderizado import linea_paciente, linea_medico, linea_turno, linea_receta
     from src.excepciones import *
 except ImportError:
     print("❌ Error: No se pueden importar los módulos necesarios")
@@ -18,6 +21,9 @@ except ImportError:
     print("- src/medico.py")
     print("- src/especialidad.py")
     print("- src/excepciones.py")
+    print("- src/repositorio_sqlite.py")
+    print("- src/reportes.py")
+    print("- src/renderizado.py")
     sys.exit(1)
 
 class CLI:
@@ -68,9 +74,10 @@ class CLI:
             print("1. Agregar Paciente")
             print("2. Listar Pacientes")
             print("3. Ver Historia Clínica")
+            print("4. Buscar Paciente por Nombre")
             print("0. Volver")
             
-            opcion = self.solicitar_opcion(3)
+            opcion = self.solicitar_opcion(4)
             
             if opcion == 1:
                 self.agregar_paciente()
@@ -78,6 +85,8 @@ class CLI:
                 self.listar_pacientes()
             elif opcion == 3:
                 self.ver_historia_clinica()
+            elif opcion == 4:
+                self.buscar_paciente()
             elif opcion == 0:
                 break
             
@@ -116,13 +125,30 @@ class CLI:
         print("\n📋 Lista de Pacientes")
         print("-" * 30)
         
-        pacientes = self.clinica.obtener_pacientes()
+        prefijo = input("Filtrar por nombre (vacío = todos): ").strip() or None
+        self.mostrar_paginas(
+            lambda cursor: self.clinica.paginar_pacientes(cursor, prefijo_nombre=prefijo),
+            linea_paciente,
+            "No hay pacientes registrados"
+        )
+    
+    def buscar_paciente(self):
+        """Busca pacientes por nombre o apellido (parcial o con errores de tipeo)."""
+        print("\n🔎 Buscar Paciente")
+        print("-" * 20)
+        
+        texto = input("Nombre o apellido: ").strip()
+        if not texto:
+            print("❌ Ingrese al menos una letra")
+            return
+        
+        pacientes = self.clinica.buscar_pacientes(texto)
         if not pacientes:
-            print("No hay pacientes registrados")
+            print("No se encontraron pacientes")
             return
         
         for i, paciente in enumerate(pacientes, 1):
-            print(f"{i}. {paciente.obtener_nombre()} - DNI: {paciente.obtener_dni()}")
+            print(f"{i}. {linea_paciente(paciente)}")
     
     def ver_historia_clinica(self):
         """Muestra historia clínica de un paciente."""
@@ -133,10 +159,32 @@ class CLI:
         historia = self.clinica.obtener_historia_clinica_por_DNI(dni)
         
         if historia:
-            print(historia)
+            # DE LO MAS RECIENTE A LO MAS ANTIGUO, UNA PAGINA POR VEZ
+            for pagina in range(1, historia.cantidad_paginas() + 1):
+                if pagina > 1 and input("Enter = ver anteriores, 0 = terminar: ").strip() == "0":
+                    break
+                print(historia.renderizar(pagina))
         else:
             print(f"❌ No se encontró historia para DNI: {dni}")
     
+    def mostrar_paginas(self, obtener_pagina, formatear, mensaje_vacio: str):
+        """Muestra un listado de a una página por vez, pidiendo confirmación para seguir."""
+        cursor = None
+        numero = 0
+        while True:
+            pagina = obtener_pagina(cursor)
+            if numero == 0 and not pagina:
+                print(mensaje_vacio)
+                return
+            for elemento in pagina:
+                numero += 1
+                print(f"{numero}. {formatear(elemento)}")
+            if not pagina.hay_mas():
+                return
+            if input("Enter = siguiente página, 0 = terminar: ").strip() == "0":
+                return
+            cursor = pagina.obtener_cursor()
+    
     # === GESTIÓN DE MÉDICOS ===
     
     def menu_medicos(self):
@@ -209,13 +257,12 @@ class CLI:
         print("\n📋 Lista de Médicos")
         print("-" * 30)
         
-        medicos = self.clinica.obtener_medicos()
-        if not medicos:
-            print("No hay médicos registrados")
-            return
-        
-        for i, medico in enumerate(medicos, 1):
-            print(f"{i}. {medico.obtener_nombre()} - Matrícula: {medico.obtener_matricula()}")
+        especialidad = input("Filtrar por especialidad (vacío = todas): ").strip() or None
+        self.mostrar_paginas(
+            lambda cursor: self.clinica.paginar_medicos(cursor, especialidad=especialidad),
+            linea_medico,
+            "No hay médicos registrados"
+        )
     
     # === GESTIÓN DE TURNOS ===
     
@@ -270,10 +317,18 @@ class CLI:
         print("\n📋 Lista de Turnos")
         print("-" * 30)
         
-        turnos = self.clinica.obtener_turnos()
-        if not turnos:
-            print("No hay turnos registrados")
+        try:
+            desde, hasta = self.solicitar_rango_fechas()
+        except ValueError:
+            print("❌ Formato de fecha incorrecto")
             return
+        matricula = input("Filtrar por matrícula (vacío = todos): ").strip().upper() or None
+        
+        self.mostrar_paginas(
+            lambda cursor: self.clinica.paginar_turnos(cursor, desde=desde, hasta=hasta, matricula=matricula),
+            linea_turno,
+            "No hay turnos registrados"
+        )
     
     # === GESTIÓN DE RECETAS ===
     
@@ -338,15 +393,87 @@ class CLI:
         historia = self.clinica.obtener_historia_clinica_por_DNI(dni)
         
         if historia:
-            recetas = historia.obtener_recetas()
-            if recetas:
-                for i, receta in enumerate(recetas, 1):
-                    print(f"{i}. {receta}")
-            else:
+            hay_recetas = False
+            for i, receta in enumerate(historia.iterar_recetas(), 1):
+                hay_recetas = True
+                print(f"{i}. {linea_receta(receta, con_paciente=False)}")
+            if not hay_recetas:
                 print("❌ No hay recetas para este paciente")
         else:
             print(f"❌ No se encontró historia para DNI: {dni}")
     
+    # === REPORTES ===
+    
+    def menu_reportes(self):
+        """Menú de reportes."""
+        while True:
+            self.limpiar_pantalla()
+            self.mostrar_header()
+            print("\n📊 REPORTES")
+            print("-" * 30)
+            print("1. Ocupación por Médico (semanal)")
+            print("2. Demanda por Especialidad (diaria)")
+            print("0. Volver")
+            
+            opcion = self.solicitar_opcion(2)
+            
+            if opcion == 1:
+                self.reporte_utilizacion()
+            elif opcion == 2:
+                self.reporte_demanda()
+            elif opcion == 0:
+                break
+            
+            self.pausar()
+    
+    def solicitar_rango_fechas(self) -> tuple[date | None, date | None]:
+        """Solicita un rango de fechas opcional (vacío = todos los turnos)."""
+        desde_str = input("Desde (DD/MM/YYYY, vacío = todo): ").strip()
+        hasta_str = input("Hasta (DD/MM/YYYY, vacío = todo): ").strip()
+        desde = datetime.strptime(desde_str, "%d/%m/%Y").date() if desde_str else None
+        hasta = datetime.strptime(hasta_str, "%d/%m/%Y").date() if hasta_str else None
+        return desde, hasta
+    
+    def reporte_utilizacion(self):
+        """Muestra turnos y ocupación de cada médico por semana."""
+        print("\n📊 Ocupación por Médico")
+        print("-" * 30)
+        
+        try:
+            desde, hasta = self.solicitar_rango_fechas()
+        except ValueError:
+            print("❌ Formato de fecha incorrecto")
+            return
+        
+        reporte = utilizacion_por_medico(self.clinica, desde, hasta)
+        if not reporte:
+            print("No hay turnos registrados")
+            return
+        
+        for fila in reporte:
+            print(f"- {fila}")
+    
+    def reporte_demanda(self):
+        """Muestra la cantidad de turnos por especialidad y día."""
+        print("\n📊 Demanda por Especialidad")
+        print("-" * 30)
+        
+        try:
+            desde, hasta = self.solicitar_rango_fechas()
+        except ValueError:
+            print("❌ Formato de fecha incorrecto")
+            return
+        
+        demanda = demanda_por_especialidad(self.clinica, desde, hasta)
+        if not demanda:
+            print("No hay turnos registrados")
+            return
+        
+        for especialidad, por_dia in sorted(demanda.items()):
+            print(f"\n{especialidad} ({sum(por_dia.values())} turnos)")
+            for dia, cantidad in sorted(por_dia.items()):
+                print(f"  {dia.strftime('%d/%m/%Y')}: {cantidad}")
+    
     # === BUCLE PRINCIPAL ===
     
     def ejecutar(self):
@@ -357,7 +484,7 @@ class CLI:
                 self.mostrar_header()
                 self.mostrar_menu_principal()
                 
-                opcion = self.solicitar_opcion(4)
+                opcion = self.solicitar_opcion(5)
                 
                 if opcion == 1:
                     self.menu_pacientes()
@@ -367,6 +494,8 @@ class CLI:
                     self.menu_turnos()
                 elif opcion == 4:
                     self.menu_recetas()
+                elif opcion == 5:
+                    self.menu_reportes()
                 elif opcion == 0:
                     print("\n👋 ¡Hasta luego!")
                     self.ejecutando = False
@@ -384,7 +513,8 @@ class CLI:
 
 if __name__ == "__main__":
     try:
-        clinica = Clinica({}, {}, [], {})
+        ruta_db = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "clinica.db")
+        clinica = Clinica({}, {}, [], {}, repositorio=RepositorioSQLite(ruta_db))
         cli = CLI(clinica)
         cli.ejecutar()
     except Exception as e:
@@ -0,0 +1,250 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, date, timedelta
+from typing import Iterable, Iterator
+from src.turno import Turno
+from src.paginacion import IndiceOrdenado
+from src.serie_turnos import SerieTurnos
+from src.excepciones import TurnoOcupadoException
+
+class IntervalosMedico:
+
+    # LOS TURNOS DE UN MEDICO NUNCA SE SUPERPONEN, ASI QUE ORDENADOS POR INICIO
+    # TAMBIEN QUEDAN ORDENADOS POR FIN: ALCANZA CON MIRAR EL VECINO ANTERIOR
+    def __init__(self):
+        self.__inicios: list[datetime] = []
+        self.__fines: list[datetime] = []
+
+    def superpone(self, inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        # excepto: EL INICIO DE UN TURNO QUE NO CUENTA (EL QUE SE ESTA REPROGRAMANDO)
+        i = bisect_left(self.__inicios, fin)
+        if excepto is not None and i > 0 and self.__inicios[i - 1] == excepto:
+            i -= 1
+        return i > 0 and self.__fines[i - 1] > inicio
+
+    def superposiciones(self, intervalos: Iterable[tuple[datetime, datetime]]) -> list[bool]:
+        # intervalos ORDENADOS POR INICIO: UN SOLO RECORRIDO HACIA ADELANTE, CADA BISECT
+        # EMPIEZA DONDE TERMINO EL ANTERIOR
+        inicios = self.__inicios
+        fines = self.__fines
+        resultado = []
+        i = 0
+        for inicio, fin in intervalos:
+            i = bisect_right(fines, inicio, i)
+            resultado.append(i < len(inicios) and inicios[i] < fin)
+        return resultado
+
+    def agregar(self, inicio: datetime, fin: datetime) -> None:
+        i = bisect_left(self.__inicios, inicio)
+        self.__inicios.insert(i, inicio)
+        self.__fines.insert(i, fin)
+
+    def quitar(self, inicio: datetime) -> bool:
+        # EL INICIO IDENTIFICA AL TURNO: DOS TURNOS DEL MISMO MEDICO NUNCA EMPIEZAN JUNTOS
+        i = bisect_left(self.__inicios, inicio)
+        if i < len(self.__inicios) and self.__inicios[i] == inicio:
+            del self.__inicios[i]
+            del self.__fines[i]
+            return True
+        return False
+
+    def huecos_libres(self, desde: datetime, hasta: datetime, duracion: timedelta) -> Iterator[datetime]:
+        # RECORRE LA GRILLA desde, desde + duracion, ... SALTANDO DIRECTO AL FINAL DE CADA TURNO OCUPADO
+        inicios = self.__inicios
+        fines = self.__fines
+        i = bisect_right(fines, desde)
+        candidato = desde
+
+        while candidato + duracion <= hasta:
+            while i < len(fines) and fines[i] <= candidato:
+                i += 1
+
+            if i < len(inicios) and inicios[i] < candidato + duracion:
+                pasos = -((desde - fines[i]) // duracion)
+                candidato = desde + pasos * duracion
+                continue
+
+            yield candidato
+            candidato += duracion
+
+    def __len__(self) -> int:
+        return len(self.__inicios)
+
+class AgendaTurnos:
+
+    def __init__(self, turnos: list[Turno] | None = None):
+        # INDICE PRINCIPAL: (matricula, fecha_hora) -> turno
+        self.__por_clave: dict[tuple[str, datetime], Turno] = {}
+        # INDICES SECUNDARIOS: CADA GRUPO ES UN DICT POR CLAVE PRINCIPAL (CONSERVA EL ORDEN DE ALTA
+        # Y QUITAR UN TURNO ES O(1), SIN RECORRER LOS TURNOS DEL PACIENTE O DEL DIA)
+        self.__por_dni: dict[str, dict[tuple[str, datetime], Turno]] = {}
+        self.__por_fecha: dict[date, dict[tuple[str, datetime], Turno]] = {}
+        # OCUPACION POR MEDICO: INTERVALOS ORDENADOS PARA BUSQUEDAS CON BISECT
+        self.__ocupacion: dict[str, IntervalosMedico] = {}
+        # ORDEN CRONOLOGICO PARA LISTADOS PAGINADOS, ARMADO RECIEN AL PEDIR UNA PAGINA: LOS DIAS CON
+        # TURNOS ORDENADOS (SOLO CAMBIAN AL APARECER O VACIARSE UN DIA) Y, POR DIA, SUS CLAVES
+        # (fecha_hora, matricula) ORDENADAS. AGENDAR O CANCELAR SOLO DESCARTA LA LISTA DE ESE DIA
+        self.__dias = IndiceOrdenado()
+        self.__orden_por_dia: dict[date, list[tuple[datetime, str]]] = {}
+        # SERIES DE TURNOS POR MEDICO: SUS OCURRENCIAS PENDIENTES OCUPAN EL HORARIO SIN SER TURNOS
+        self.__series: dict[str, list[SerieTurnos]] = {}
+        # LOS INDICES COMPARTIDOS SE ACTUALIZAN JUNTOS; LOS INTERVALOS DE CADA MEDICO
+        # LOS PROTEGE QUIEN LLAMA (CLINICA TOMA EL CERROJO DEL MEDICO)
+        self.__cerrojo = threading.Lock()
+
+        for turno in turnos or []:
+            self.agregar(turno)
+
+# AGREGAR
+
+    def agregar(self, turno: Turno) -> None:
+        fecha_hora = turno.obtener_fecha_hora()
+        fin = turno.obtener_fin()
+        matricula = turno.obtener_medico().obtener_matricula()
+        clave = (matricula, fecha_hora)
+        if clave in self.__por_clave or self.superpone(matricula, fecha_hora, fin):
+            raise TurnoOcupadoException("Ya existe un turno para ese médico en esa fecha y hora")
+
+        with self.__cerrojo:
+            self.__por_clave[clave] = turno
+            self.__por_dni.setdefault(turno.obtener_paciente().obtener_dni(), {})[clave] = turno
+            dia = fecha_hora.date()
+            del_dia = self.__por_fecha.get(dia)
+            if del_dia is None:
+                del_dia = self.__por_fecha[dia] = {}
+                self.__dias.agregar(dia)
+            del_dia[clave] = turno
+            self.__orden_por_dia.pop(dia, None)
+            intervalos = self.__ocupacion.get(matricula)
+            if intervalos is None:
+                intervalos = self.__ocupacion[matricula] = IntervalosMedico()
+
+        intervalos.agregar(fecha_hora, fin)
+
+# QUITAR
+
+    def quitar(self, matricula: str, fecha_hora: datetime) -> Turno | None:
+        # EL HORARIO QUEDA LIBRE EN TODOS LOS INDICES: SE PUEDE VOLVER A AGENDAR EN EL ACTO
+        with self.__cerrojo:
+            clave = (matricula, fecha_hora)
+            turno = self.__por_clave.pop(clave, None)
+            if turno is None:
+                return None
+            self._quitar_de(self.__por_dni, turno.obtener_paciente().obtener_dni(), clave)
+            dia = fecha_hora.date()
+            if self._quitar_de(self.__por_fecha, dia, clave):
+                self.__dias.quitar(dia)
+            self.__orden_por_dia.pop(dia, None)
+            intervalos = self.__ocupacion.get(matricula)
+        if intervalos is not None:
+            intervalos.quitar(fecha_hora)
+        return turno
+
+    @staticmethod
+    def _quitar_de(indice: dict, grupo, clave: tuple[str, datetime]) -> bool:
+        # True SI EL GRUPO QUEDO VACIO Y SE BORRO
+        turnos = indice.get(grupo)
+        if turnos is None:
+            return False
+        turnos.pop(clave, None)
+        if not turnos:
+            del indice[grupo]
+            return True
+        return False
+
+    def agregar_serie(self, serie: SerieTurnos) -> None:
+        with self.__cerrojo:
+            self.__series.setdefault(serie.obtener_matricula(), []).append(serie)
+
+    def quitar_serie(self, serie: SerieTurnos) -> None:
+        with self.__cerrojo:
+            series = self.__series.get(serie.obtener_matricula(), [])
+            if serie in series:
+                series.remove(serie)
+
+# OBTENER
+
+    def existe(self, matricula: str, fecha_hora: datetime) -> bool:
+        if (matricula, fecha_hora) in self.__por_clave:
+            return True
+        return any(serie.contiene(fecha_hora) for serie in self.__series.get(matricula, ()))
+
+    def superpone(self, matricula: str, inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        intervalos = self.__ocupacion.get(matricula)
+        if intervalos is not None and intervalos.superpone(inicio, fin, excepto):
+            return True
+        series = self.__series.get(matricula)
+        return bool(series) and self._superpone_series(series, inicio, fin, excepto)
+
+    def superposiciones(self, matricula: str, intervalos: list[tuple[datetime, datetime]]) -> list[bool]:
+        # VARIOS INTERVALOS ORDENADOS DE UN MISMO MEDICO EN UNA PASADA (SERIES DE TURNOS)
+        ocupacion = self.__ocupacion.get(matricula)
+        resultado = ocupacion.superposiciones(intervalos) if ocupacion is not None else [False] * len(intervalos)
+        series = self.__series.get(matricula)
+        if series:
+            resultado = [ocupado or self._superpone_series(series, inicio, fin) for ocupado, (inicio, fin) in zip(resultado, intervalos)]
+        return resultado
+
+    @staticmethod
+    def _superpone_series(series: list[SerieTurnos], inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        return any(serie.superpone(inicio, fin, excepto) for serie in series)
+
+    def obtener_series(self, matricula: str | None = None) -> list[SerieTurnos]:
+        with self.__cerrojo:
+            if matricula is not None:
+                return list(self.__series.get(matricula, ()))
+            return [serie for series in self.__series.values() for serie in series]
+
+    def obtener(self, matricula: str, fecha_hora: datetime) -> Turno | None:
+        return self.__por_clave.get((matricula, fecha_hora))
+
+    def obtener_por_dni(self, dni: str) -> list[Turno]:
+        with self.__cerrojo:
+            return list(self.__por_dni.get(dni, {}).values())
+
+    def obtener_por_fecha(self, dia: date) -> list[Turno]:
+        with self.__cerrojo:
+            return list(self.__por_fecha.get(dia, {}).values())
+
+    def obtener_turnos(self) -> list[Turno]:
+        with self.__cerrojo:
+            return list(self.__por_clave.values())
+
+    def iterar(self, despues_de: tuple[datetime, str] | None = None) -> Iterator[Turno]:
+        # EN ORDEN (fecha_hora, matricula), EMPEZANDO DESPUES DEL CURSOR: EL RESTO DEL DIA DEL CURSOR
+        # Y DESPUES LOS DIAS SIGUIENTES. CADA DIA SE ORDENA UNA VEZ POR CAMBIO, NO EN CADA ALTA
+        dia_cursor = None
+        if despues_de is not None:
+            dia_cursor = despues_de[0].date()
+            claves = self._orden_del_dia(dia_cursor)
+            yield from self._turnos_de(claves[bisect_right(claves, despues_de):])
+        for dia in self.__dias.iterar(dia_cursor):
+            yield from self._turnos_de(self._orden_del_dia(dia))
+
+    def _orden_del_dia(self, dia: date) -> list[tuple[datetime, str]]:
+        with self.__cerrojo:
+            claves = self.__orden_por_dia.get(dia)
+            if claves is None:
+                claves = sorted((fecha_hora, matricula) for matricula, fecha_hora in self.__por_fecha.get(dia, ()))
+                self.__orden_por_dia[dia] = claves
+            return claves
+
+    def _turnos_de(self, claves: list[tuple[datetime, str]]) -> Iterator[Turno]:
+        for fecha_hora, matricula in claves:
+            turno = self.__por_clave.get((matricula, fecha_hora))
+            if turno is not None:
+                yield turno
+
+    def huecos_libres(self, matricula: str, desde: datetime, hasta: datetime, duracion: timedelta) -> Iterator[datetime]:
+        intervalos = self.__ocupacion.get(matricula)
+        if intervalos is None:
+            intervalos = IntervalosMedico()
+        huecos = intervalos.huecos_libres(desde, hasta, duracion)
+        series = self.__series.get(matricula)
+        if series:
+            # LAS OCURRENCIAS PENDIENTES DE SUS SERIES TAMBIEN OCUPAN EL HORARIO
+            huecos = (hueco for hueco in huecos if not self._superpone_series(series, hueco, hueco + duracion))
+        return huecos
+
+    def __len__(self) -> int:
+        return len(self.__por_clave)
@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterator
+from src.turno import DURACION_TURNO_POR_DEFECTO
+
+# OPERACIONES REGISTRADAS
+OP_PACIENTE = "paciente"
+OP_MEDICO = "medico"
+OP_TURNO = "turno"
+OP_RECETA = "receta"
+OP_SERIE = "serie"
+OP_MATERIALIZACION = "materializacion"
+OP_CANCELACION = "cancelacion"
+OP_REPROGRAMACION = "reprogramacion"
+
+# CON GROUP COMMIT (lote_fsync > 1) Y SIN INTERVALO, NINGUN REGISTRO ESPERA SU fsync MAS QUE ESTO
+INTERVALO_FSYNC_POR_DEFECTO = 0.01
+BLOQUE_LECTURA = 64 * 1024
+
+class Bitacora:
+
+    def __init__(self, ruta: str, lote_fsync: int = 1, intervalo_fsync: float | None = None, umbral_compactacion: int = 100_000):
+        # UNA LINEA JSON POR OPERACION, SIEMPRE AL FINAL DEL ARCHIVO. SI UNA CAIDA DEJO UNA ULTIMA LINEA
+        # A MEDIAS SE CORTA ANTES DE ABRIR: EL PROXIMO REGISTRO NO SE PEGA A ELLA
+        self.__ruta = ruta
+        _descartar_linea_incompleta(ruta)
+        self.__archivo = open(ruta, "ab")
+        # GROUP COMMIT: UN fsync CADA lote_fsync REGISTROS O CADA intervalo_fsync SEGUNDOS. QUIEN REGISTRA
+        # ESPERA EL fsync DE SU GRUPO: NINGUNA OPERACION CONFIRMADA QUEDA SIN PERSISTIR
+        self.__lote_fsync = max(1, lote_fsync)
+        if intervalo_fsync is None and self.__lote_fsync > 1:
+            intervalo_fsync = INTERVALO_FSYNC_POR_DEFECTO
+        self.__intervalo_fsync = intervalo_fsync
+        self.__pendientes = 0
+        self.__ultimo_fsync = time.monotonic()
+        self.__umbral_compactacion = umbral_compactacion
+        self.__registros = self._contar_registros()
+        # NUMERO DEL ULTIMO REGISTRO ESCRITO Y DEL ULTIMO QUE YA PASO POR fsync
+        self.__escritos = 0
+        self.__persistidos = 0
+        # VARIOS HILOS PUEDEN REGISTRAR A LA VEZ: CADA LINEA SE ESCRIBE ENTERA
+        self.__cerrojo = threading.RLock()
+        self.__sincronizada = threading.Condition(self.__cerrojo)
+        # EL INTERVALO LO CUMPLE UN TEMPORIZADOR, NO LA PROXIMA ESCRITURA (QUE PUEDE NO LLEGAR)
+        self.__detener = threading.Event()
+        self.__temporizador = None
+        if intervalo_fsync is not None:
+            self.__temporizador = threading.Thread(target=self._sincronizar_periodicamente, name="bitacora-fsync", daemon=True)
+            self.__temporizador.start()
+
+# REGISTRAR
+
+    def registrar_paciente(self, nombre: str, dni: str, fecha_de_nacimiento: str) -> None:
+        self._escribir({"op": OP_PACIENTE, "nombre": nombre, "dni": dni, "fecha_de_nacimiento": fecha_de_nacimiento})
+
+    def registrar_medico(self, nombre: str, matricula: str, especialidades: list[tuple[str, tuple[str, ...]]]) -> None:
+        self._escribir({"op": OP_MEDICO, "nombre": nombre, "matricula": matricula, "especialidades": [[tipo, list(dias)] for tipo, dias in especialidades]})
+
+    def registrar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO) -> None:
+        self._escribir({"op": OP_TURNO, "dni": dni, "matricula": matricula, "especialidad": especialidad, "fecha_hora": fecha_hora.isoformat(), "duracion": duracion.total_seconds()})
+
+    def registrar_serie(self, dni: str, matricula: str, especialidad: str, inicio: datetime, frecuencia: str, cantidad: int, duracion: timedelta, excluidas: list[int]) -> None:
+        self._escribir({"op": OP_SERIE, "dni": dni, "matricula": matricula, "especialidad": especialidad, "inicio": inicio.isoformat(), "frecuencia": frecuencia, "cantidad": cantidad, "duracion": duracion.total_seconds(), "excluidas": excluidas})
+
+    def registrar_materializacion(self, matricula: str, inicio: datetime, materializadas: int) -> None:
+        self._escribir({"op": OP_MATERIALIZACION, "matricula": matricula, "inicio": inicio.isoformat(), "materializadas": materializadas})
+
+    def registrar_cancelacion(self, matricula: str, fecha_hora: datetime) -> None:
+        self._escribir({"op": OP_CANCELACION, "matricula": matricula, "fecha_hora": fecha_hora.isoformat()})
+
+    def registrar_reprogramacion(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime) -> None:
+        self._escribir({"op": OP_REPROGRAMACION, "matricula": matricula, "fecha_hora": fecha_hora.isoformat(), "nueva_fecha_hora": nueva_fecha_hora.isoformat()})
+
+    def registrar_receta(self, dni: str, matricula: str, medicamentos: list[str], fecha: datetime) -> None:
+        self._escribir({"op": OP_RECETA, "dni": dni, "matricula": matricula, "medicamentos": medicamentos, "fecha": fecha.isoformat()})
+
+    def _escribir(self, registro: dict) -> None:
+        linea = json.dumps(registro, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self.__cerrojo:
+            self.__archivo.write(linea)
+            self.__pendientes += 1
+            self.__registros += 1
+            self.__escritos += 1
+            propio = self.__escritos
+
+            if self.__pendientes >= self.__lote_fsync:
+                self.sincronizar()
+            elif self.__intervalo_fsync is not None and time.monotonic() - self.__ultimo_fsync >= self.__intervalo_fsync:
+                self.sincronizar()
+            # wait LIBERA EL CERROJO: OTROS HILOS SUMAN SUS REGISTROS AL MISMO fsync
+            while self.__persistidos < propio and not self.__archivo.closed:
+                self.__sincronizada.wait()
+
+    def sincronizar(self) -> None:
+        with self.__cerrojo:
+            self.__archivo.flush()
+            os.fsync(self.__archivo.fileno())
+            self.__pendientes = 0
+            self.__ultimo_fsync = time.monotonic()
+            self.__persistidos = self.__escritos
+            self.__sincronizada.notify_all()
+
+    def _sincronizar_periodicamente(self) -> None:
+        while not self.__detener.wait(self.__intervalo_fsync):
+            with self.__cerrojo:
+                if self.__pendientes and not self.__archivo.closed:
+                    self.sincronizar()
+
+# LEER
+
+    def leer(self) -> Iterator[dict]:
+        with self.__cerrojo:
+            self.__archivo.flush()
+        with open(self.__ruta, "rb") as archivo:
+            for linea in archivo:
+                try:
+                    registro = json.loads(linea)
+                except ValueError:
+                    # UNA ULTIMA LINEA TRUNCADA POR UNA CAIDA SE DESCARTA; UNA LINEA ILEGIBLE EN EL MEDIO
+                    # TAMBIEN, SIN PERDER LOS REGISTROS QUE LA SIGUEN
+                    continue
+                yield registro
+
+    def _contar_registros(self) -> int:
+        with open(self.__ruta, "rb") as archivo:
+            return sum(1 for _ in archivo)
+
+# COMPACTAR
+
+    def exclusiva(self) -> threading.RLock:
+        # MIENTRAS SE TIENE, NINGUN OTRO HILO PUEDE ESCRIBIR, SINCRONIZAR NI TRUNCAR
+        return self.__cerrojo
+
+    def necesita_compactacion(self) -> bool:
+        return self.__registros >= self.__umbral_compactacion
+
+    def truncar(self) -> None:
+        # SOLO DEBE LLAMARSE CUANDO UN SNAPSHOT YA CONTIENE TODO LO REGISTRADO
+        with self.__cerrojo:
+            self.__archivo.flush()
+            self.__archivo.truncate(0)
+            os.fsync(self.__archivo.fileno())
+            self.__pendientes = 0
+            self.__registros = 0
+
+    def cerrar(self) -> None:
+        # EL TEMPORIZADOR SE DETIENE SIN EL CERROJO TOMADO: PUEDE ESTAR ESPERANDOLO
+        self.__detener.set()
+        if self.__temporizador is not None:
+            self.__temporizador.join()
+        with self.__cerrojo:
+            if not self.__archivo.closed:
+                self.sincronizar()
+                self.__archivo.close()
+                self.__sincronizada.notify_all()
+
+def _descartar_linea_incompleta(ruta: str) -> None:
+    # CORTA EL ARCHIVO DESPUES DEL ULTIMO SALTO DE LINEA, LEYENDO DESDE EL FINAL DE A BLOQUES
+    try:
+        archivo = open(ruta, "r+b")
+    except FileNotFoundError:
+        return
+    with archivo:
+        fin = archivo.seek(0, os.SEEK_END)
+        posicion = fin
+        while posicion > 0:
+            inicio = max(0, posicion - BLOQUE_LECTURA)
+            archivo.seek(inicio)
+            salto = archivo.read(posicion - inicio).rfind(b"\n")
+            if salto >= 0:
+                posicion = inicio + salto + 1
+                break
+            posicion = inicio
+        if posicion < fin:
+            archivo.truncate(posicion)
+            os.fsync(archivo.fileno())
@@ -0,0 +1,28 @@
+import threading
+from contextlib import contextmanager, ExitStack
+from typing import Iterator
+
+class CerrojosPorClave:
+
+    # LOCK STRIPING: UNA CANTIDAD FIJA DE CERROJOS REPARTIDOS POR HASH DE LA CLAVE.
+    # CLAVES DISTINTAS CASI NUNCA COMPARTEN CERROJO Y LA MEMORIA NO CRECE CON LAS CLAVES.
+    # SON REENTRANTES: UN HILO QUE YA TIENE EL CERROJO PUEDE VOLVER A PEDIRLO
+    def __init__(self, cantidad: int = 64):
+        if cantidad < 1:
+            raise ValueError("La cantidad de cerrojos debe ser positiva.")
+        self.__cerrojos = tuple(threading.RLock() for _ in range(cantidad))
+
+    def obtener(self, clave: str) -> threading.RLock:
+        return self.__cerrojos[hash(clave) % len(self.__cerrojos)]
+
+    @contextmanager
+    def todos(self) -> Iterator[None]:
+        # TODOS LOS CERROJOS, SIEMPRE EN EL MISMO ORDEN: MIENTRAS SE TIENEN, NINGUN OTRO HILO ESTA
+        # DENTRO DE NINGUNA CLAVE
+        with ExitStack() as tomados:
+            for cerrojo in self.__cerrojos:
+                tomados.enter_context(cerrojo)
+            yield
+
+    def __len__(self) -> int:
+        return len(self.__cerrojos)
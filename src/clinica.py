@@ -1,10 +1,41 @@
-from typing import List, Dict
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from typing import List, Dict, Iterable, Iterator
+from heapq import merge
+from itertools import islice, takewhile
 from src.paciente import Paciente
 from src.medico import Medico
-from src.turno import Turno
+from src.turno import Turno, DURACION_TURNO_POR_DEFECTO
 from src.historia_clinica import HistoriaClinica
-from datetime import datetime
+from src.agenda import AgendaTurnos, IntervalosMedico
+from src.tabla_turnos import TablaTurnos
+from src.cerrojos import CerrojosPorClave
+from src.paginacion import Pagina, IndiceOrdenado, paginar, TAMANO_PAGINA
+from src.indice_nombres import IndiceNombres
+from src.metricas import Metricas
+from datetime import datetime, date, time, timedelta
 from src.receta import Receta
+from src.eventos import RegistroEventos, RegistroConsola
+from src.repositorio import RepositorioClinica
+from src.bitacora import Bitacora, OP_PACIENTE, OP_MEDICO, OP_TURNO, OP_RECETA, OP_SERIE, OP_MATERIALIZACION, OP_CANCELACION, OP_REPROGRAMACION
+from src.serie_turnos import SerieTurnos
+from src.lista_espera import ListaEspera, SolicitudEspera, PRIORIDAD_NORMAL
+from src.especialidad import Especialidad
+from src.resultado import (
+    ResultadoOperacion,
+    MEDICO_YA_REGISTRADO,
+    PACIENTE_YA_REGISTRADO,
+    PACIENTE_NO_REGISTRADO,
+    MEDICO_NO_REGISTRADO,
+    ESPECIALIDAD_NO_ATENDIDA,
+    DIA_NO_DISPONIBLE,
+    TURNO_OCUPADO,
+    DUPLICADO_EN_LOTE,
+    SUPERPUESTO_EN_LOTE,
+    SERIE_RECHAZADA,
+    TURNO_NO_ENCONTRADO,
+    YA_EN_LISTA_ESPERA
+)
 from src.excepciones import (
     ClinicaException,
     PacienteInvalidoException,
@@ -20,87 +51,643 @@ from src.excepciones import (
 )
 
 class Clinica:
-    def __init__(self, medicos: dict[str, Medico], pacientes: dict[str, Paciente], turnos: list[Turno], historias_clinicas: dict[str, HistoriaClinica]) -> None:
+    def __init__(self, medicos: dict[str, Medico], pacientes: dict[str, Paciente], turnos: list[Turno], historias_clinicas: dict[str, HistoriaClinica], registro: RegistroEventos | None = None, repositorio: RepositorioClinica | None = None, bitacora: Bitacora | None = None, metricas: Metricas | None = None) -> None:
         self.__medicos = medicos
         self.__pacientes = pacientes
-        self.__turnos = turnos
+        self.__agenda = AgendaTurnos(turnos)
         self.__historias_clinicas = historias_clinicas
+        # DESTINO DE LOS EVENTOS (POR DEFECTO SE IMPRIMEN EN CONSOLA)
+        self.__registro = registro if registro is not None else RegistroConsola()
+        # ALMACENAMIENTO PERSISTENTE OPCIONAL: LOS DICCIONARIOS ACTUAN COMO CACHE
+        self.__repositorio = repositorio
+        # BITACORA OPCIONAL: CADA CAMBIO SE ESCRIBE ANTES DE APLICARSE EN MEMORIA
+        self.__bitacora = bitacora
+        # COPIA COLUMNAR DE TODOS LOS TURNOS PARA CONTEOS Y REPORTES. SE ARMA CON EL PRIMER REPORTE
+        # QUE LA PIDE, NO AL ARRANCAR: CON REPOSITORIO LOS TURNOS SE QUEDAN EN EL HASTA ENTONCES
+        self.__tabla_turnos: TablaTurnos | None = None
+        # LAS SERIES PERSISTIDAS VUELVEN A OCUPAR SUS HORARIOS EN LA AGENDA
+        if repositorio is not None:
+            for serie in repositorio.listar_series():
+                self.__agenda.agregar_serie(serie)
+        # CONCURRENCIA: UN CERROJO POR GRUPO DE MEDICOS Y OTRO POR GRUPO DE PACIENTES.
+        # SIEMPRE SE TOMA PRIMERO EL DEL MEDICO Y DESPUES EL DEL PACIENTE (SIN DEADLOCKS)
+        self.__cerrojos_medicos = CerrojosPorClave()
+        self.__cerrojos_pacientes = CerrojosPorClave()
+        # CLAVES ORDENADAS PARA LOS LISTADOS PAGINADOS SIN REPOSITORIO
+        self.__indice_medicos = IndiceOrdenado(medicos)
+        self.__indice_pacientes = IndiceOrdenado(pacientes)
+        # BUSQUEDA DE PACIENTES POR NOMBRE (PREFIJO Y CON ERRORES DE TIPEO). IGUAL QUE LA TABLA DE
+        # TURNOS, SE ARMA CON LA PRIMERA BUSQUEDA Y NO AL ARRANCAR
+        self.__indice_nombres: IndiceNombres | None = None
+        # PACIENTES ESPERANDO UN HORARIO QUE SE LIBERE. SOLO EN MEMORIA: LOS TURNOS QUE ASIGNA SI SE REGISTRAN
+        self.__lista_espera = ListaEspera()
+        # METRICAS OPCIONALES: SOLO SI SE PIDEN SE ENVUELVEN LOS METODOS MEDIDOS
+        self.__metricas = metricas
+        if metricas is not None:
+            self._instrumentar(metricas)
+
+    # OPERACIONES MEDIDAS. LAS LLAMADAS INTERNAS (POR EJEMPLO LAS BUSQUEDAS QUE HACE agendar_turno)
+    # TAMBIEN SE CUENTAN, ASI SE VE CUANTO PESA CADA PASO DENTRO DE LA OPERACION QUE LO USA
+    OPERACIONES_MEDIDAS = (
+        "agregar_medico",
+        "agregar_paciente",
+        "agregar_medicos_lote",
+        "agregar_pacientes_lote",
+        "agregar_especialidad_a_medico",
+        "agendar_turno",
+        "agendar_turnos_lote",
+        "agendar_serie",
+        "materializar_series",
+        "cancelar_turno",
+        "reprogramar_turno",
+        "agregar_a_lista_espera",
+        "emitir_receta",
+        "obtener_medico_por_matricula",
+        "obtener_paciente_por_dni",
+        "obtener_historia_clinica_por_DNI",
+        "obtener_turnos_por_dni",
+        "obtener_turnos_por_fecha",
+        "buscar_pacientes",
+        "buscar_turnos_libres",
+    )
+
+    def _instrumentar(self, metricas: Metricas) -> None:
+        # CADA METODO SE REEMPLAZA EN ESTA INSTANCIA POR UNA VERSION MEDIDA
+        for operacion in self.OPERACIONES_MEDIDAS:
+            setattr(self, operacion, metricas.envolver(operacion, getattr(self, operacion)))
+        metricas.registrar_tamano("medicos", self.__medicos.__len__)
+        metricas.registrar_tamano("pacientes", self.__pacientes.__len__)
+        metricas.registrar_tamano("turnos", self.__agenda.__len__)
+        # LOS INDICES QUE TODAVIA NO SE ARMARON NO OCUPAN NADA
+        metricas.registrar_tamano("tabla_turnos", lambda: len(self.__tabla_turnos) if self.__tabla_turnos is not None else 0)
+        metricas.registrar_tamano("historias_clinicas", self.__historias_clinicas.__len__)
+        metricas.registrar_tamano("indice_nombres", lambda: len(self.__indice_nombres) if self.__indice_nombres is not None else 0)
+        metricas.registrar_tamano("lista_espera", self.__lista_espera.__len__)
+
+    def obtener_metricas(self) -> Metricas | None:
+        return self.__metricas
+
+    @contextmanager
+    def escrituras_detenidas(self) -> Iterator[None]:
+        # TODA OPERACION QUE MODIFICA LA CLINICA REGISTRA EN LA BITACORA Y APLICA EN MEMORIA CON EL
+        # CERROJO DE SU MEDICO O DE SU PACIENTE: CON TODOS TOMADOS (MEDICOS PRIMERO, EL ORDEN DE
+        # SIEMPRE) NINGUNA QUEDA A MEDIAS Y EL ESTADO NO CAMBIA HASTA SALIR
+        with self.__cerrojos_medicos.todos(), self.__cerrojos_pacientes.todos():
+            yield
 
 
 # AGREGAR
 
-    def agregar_medico(self, medico: Medico) -> None:
-        if medico.obtener_matricula() in self.__medicos:
-            print(f"El médico con matrícula {medico.obtener_matricula()} ya está registrado.")
-        else:
+    def agregar_medico(self, medico: Medico) -> ResultadoOperacion:
+        with self.__cerrojos_medicos.obtener(medico.obtener_matricula()):
+            if self.validar_existencia_medico(medico.obtener_matricula()):
+                resultado = ResultadoOperacion(False, f"El médico con matrícula {medico.obtener_matricula()} ya está registrado.", MEDICO_YA_REGISTRADO)
+            else:
+                self._registrar_medicos([medico])
+                resultado = ResultadoOperacion(True, f"Médico {medico.obtener_nombre()} agregado correctamente.", objeto=medico)
+        return self._notificar(resultado)
+
+
+    def agregar_paciente(self, paciente: Paciente) -> ResultadoOperacion:
+        with self.__cerrojos_pacientes.obtener(paciente.obtener_dni()):
+            if self.validar_existencia_paciente(paciente.obtener_dni()):
+                resultado = ResultadoOperacion(False, f"El paciente con DNI {paciente.obtener_dni()} ya está registrado.", PACIENTE_YA_REGISTRADO)
+            else:
+                self._registrar_pacientes([paciente])
+                resultado = ResultadoOperacion(True, f"Paciente {paciente.obtener_nombre()} agregado correctamente.", objeto=paciente)
+        return self._notificar(resultado)
+
+    def agregar_pacientes_lote(self, pacientes: Iterable[Paciente]) -> list[ResultadoOperacion]:
+        # ALTA MASIVA (IMPORTACIONES): SIN UN EVENTO POR PACIENTE Y CON UNA SOLA ESCRITURA POR INDICE Y EN EL
+        # REPOSITORIO. EL LOTE TOMA TODOS LOS CERROJOS DE PACIENTES: NINGUN DNI SE DA DE ALTA POR OTRO LADO
+        # ENTRE LA VALIDACION Y LA APLICACION
+        pacientes = list(pacientes)
+        resultados = []
+        nuevos: dict[str, Paciente] = {}
+        with self.__cerrojos_pacientes.todos():
+            for paciente in pacientes:
+                dni = paciente.obtener_dni()
+                if dni in nuevos or self.validar_existencia_paciente(dni):
+                    resultados.append(ResultadoOperacion(False, f"El paciente con DNI {dni} ya está registrado.", PACIENTE_YA_REGISTRADO))
+                    continue
+                nuevos[dni] = paciente
+                resultados.append(ResultadoOperacion(True, f"Paciente {paciente.obtener_nombre()} agregado correctamente.", objeto=paciente))
+            if nuevos:
+                self._registrar_pacientes(list(nuevos.values()))
+        return resultados
+
+    def agregar_medicos_lote(self, medicos: Iterable[Medico]) -> list[ResultadoOperacion]:
+        medicos = list(medicos)
+        resultados = []
+        nuevos: dict[str, Medico] = {}
+        with self.__cerrojos_medicos.todos():
+            for medico in medicos:
+                matricula = medico.obtener_matricula()
+                if matricula in nuevos or self.validar_existencia_medico(matricula):
+                    resultados.append(ResultadoOperacion(False, f"El médico con matrícula {matricula} ya está registrado.", MEDICO_YA_REGISTRADO))
+                    continue
+                nuevos[matricula] = medico
+                resultados.append(ResultadoOperacion(True, f"Médico {medico.obtener_nombre()} agregado correctamente.", objeto=medico))
+            if nuevos:
+                self._registrar_medicos(list(nuevos.values()))
+        return resultados
+
+    def agregar_especialidad_a_medico(self, matricula: str, especialidad: Especialidad) -> ResultadoOperacion:
+        # Medico.agregar_especialidad SOLO CAMBIA EL OBJETO: ESTE ES EL CAMINO QUE LO REGISTRA EN LA
+        # BITACORA Y LO GUARDA EN EL REPOSITORIO, ASI EL CAMBIO SOBREVIVE A UN REINICIO
+        with self.__cerrojos_medicos.obtener(matricula):
+            medico = self._buscar_medico(matricula)
+            if medico is None:
+                resultado = ResultadoOperacion(False, f"El médico con matrícula {matricula} no está registrado.", MEDICO_NO_REGISTRADO)
+            else:
+                if not self._tiene_especialidad(medico, especialidad):
+                    especialidades = medico.obtener_especialidades() + [especialidad]
+                    if self.__bitacora is not None:
+                        self.__bitacora.registrar_medico(
+                            medico.obtener_nombre(),
+                            matricula,
+                            [(e.obtener_especialidad(), e.obtener_dias()) for e in especialidades]
+                        )
+                    self._aplicar_especialidades(medico, [especialidad])
+                resultado = ResultadoOperacion(True, f"Especialidad {especialidad.obtener_especialidad()} agregada al médico {medico.obtener_nombre()}.", objeto=medico)
+        return self._notificar(resultado)
+
+    @staticmethod
+    def _tiene_especialidad(medico: Medico, especialidad: Especialidad) -> bool:
+        # LAS LEIDAS DEL REPOSITORIO O DE LA BITACORA SON OBJETOS NUEVOS: SE COMPARAN POR SUS DATOS
+        datos = (especialidad.obtener_especialidad(), especialidad.obtener_dias())
+        return any((e.obtener_especialidad(), e.obtener_dias()) == datos for e in medico.obtener_especialidades())
+
+    def _aplicar_especialidades(self, medico: Medico, especialidades: list[Especialidad]) -> None:
+        for especialidad in especialidades:
+            medico.agregar_especialidad(especialidad)
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_medicos([medico])
+
+    def _registrar_medicos(self, medicos: list[Medico]) -> None:
+        # CON LOS CERROJOS DE ESOS MEDICOS TOMADOS: UN REGISTRO DE BITACORA POR MEDICO Y DESPUES EL ALTA
+        if self.__bitacora is not None:
+            for medico in medicos:
+                self.__bitacora.registrar_medico(
+                    medico.obtener_nombre(),
+                    medico.obtener_matricula(),
+                    [(e.obtener_especialidad(), e.obtener_dias()) for e in medico.obtener_especialidades()]
+                )
+        self._aplicar_medicos(medicos)
+
+    def _registrar_pacientes(self, pacientes: list[Paciente]) -> None:
+        if self.__bitacora is not None:
+            for paciente in pacientes:
+                self.__bitacora.registrar_paciente(paciente.obtener_nombre(), paciente.obtener_dni(), paciente.obtener_fecha_de_nacimiento())
+        self._aplicar_pacientes(pacientes)
+
+    def _aplicar_medico(self, medico: Medico) -> None:
+        self._aplicar_medicos([medico])
+
+    def _aplicar_medicos(self, medicos: list[Medico]) -> None:
+        # UNO O MUCHOS: CADA INDICE Y EL REPOSITORIO RECIBEN TODO EL LOTE DE UNA VEZ
+        for medico in medicos:
             self.__medicos[medico.obtener_matricula()] = medico
-            print(f"Médico {medico.obtener_nombre()} agregado correctamente.")
+        self.__indice_medicos.agregar_varias(m.obtener_matricula() for m in medicos)
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_medicos(medicos)
 
+    def _aplicar_paciente(self, paciente: Paciente) -> None:
+        self._aplicar_pacientes([paciente])
 
-    def agregar_paciente(self, paciente: Paciente) -> None:
-        if paciente.obtener_dni() in self.__pacientes:
-            print(f"El paciente con DNI {paciente.obtener_dni()} ya está registrado.")
-        else:
+    def _aplicar_pacientes(self, pacientes: list[Paciente]) -> None:
+        for paciente in pacientes:
             self.__pacientes[paciente.obtener_dni()] = paciente
-            print(f"Paciente {paciente.obtener_nombre()} agregado correctamente.")
+        self.__indice_pacientes.agregar_varias(p.obtener_dni() for p in pacientes)
+        if self.__indice_nombres is not None:
+            self.__indice_nombres.agregar_lote((p.obtener_dni(), p.obtener_nombre()) for p in pacientes)
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_pacientes(pacientes)
 
 
 # AGENDAR TURNO
 
-    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime):
+    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO) -> ResultadoOperacion:
     
         # VERIFICAR SI EL PACIENTE ESTÁ REGISTRADO EN LA CLINICA
         if not self.validar_existencia_paciente(dni):
-            print(f"Paciente con DNI: {dni} no está registrado en la clínica")
-            return False
+            return self._notificar(ResultadoOperacion(False, f"Paciente con DNI: {dni} no está registrado en la clínica", PACIENTE_NO_REGISTRADO))
             
         # VERIFICAR SI EL MEDICO ESTA REGISTRADO EN LA CLINICA
         if not self.validar_existencia_medico(matricula):
-            print(f"Médico con matrícula: {matricula} no está registrado en la clínica")
-            return False
+            return self._notificar(ResultadoOperacion(False, f"Médico con matrícula: {matricula} no está registrado en la clínica", MEDICO_NO_REGISTRADO))
         
         # OBTENER LOS OBJETOS
         paciente = self.obtener_paciente_por_dni(dni) 
         medico = self.obtener_medico_por_matricula(matricula)
         
+        # VALIDAR Y AGREGAR BAJO LOS CERROJOS DEL MEDICO Y DEL PACIENTE: NINGUN OTRO HILO
+        # PUEDE OCUPAR EL HORARIO ENTRE LA VALIDACION Y EL REGISTRO
+        with self.__cerrojos_medicos.obtener(matricula), self.__cerrojos_pacientes.obtener(dni):
+            # VALIDAR ESPECIALIDAD, DIA Y SUPERPOSICION CON OTROS TURNOS
+            rechazo = self._validar_turno(medico, especialidad, fecha_hora, duracion)
+            if rechazo is None:
+                # CREAR Y AGREGAR EL TURNO (después de todas las validaciones)
+                turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
+                self._registrar_turno(turno)
+
+        if rechazo is not None:
+            self._notificar(rechazo)
+            if rechazo.obtener_motivo() == TURNO_OCUPADO:
+                raise TurnoOcupadoException(rechazo.obtener_mensaje())
+            return rechazo
+
+        return self._notificar(ResultadoOperacion(
+            True,
+            f"Turno agendado correctamente para el paciente {paciente.obtener_nombre()} con el médico {medico.obtener_nombre()}.",
+            objeto=turno
+        ))
+
+    def agendar_turnos_lote(self, filas: Iterable[tuple]) -> list[ResultadoOperacion]:
+        # CADA FILA: (dni, matricula, especialidad, fecha_hora) O CON UNA duracion AL FINAL
+        # CADA PACIENTE Y MEDICO DISTINTO SE RESUELVE UNA SOLA VEZ. UNA FILA IGUAL A OTRA YA AGENDADA EN EL
+        # LOTE ES DUPLICADO_EN_LOTE; UNA QUE SOLO SE SUPERPONE CON ALGUNA DEL LOTE ES SUPERPUESTO_EN_LOTE
+        # Y TURNO_OCUPADO QUEDA PARA LOS CHOQUES CON TURNOS QUE YA ESTABAN
+        pacientes: dict[str, Paciente | None] = {}
+        medicos: dict[str, Medico | None] = {}
+        agendados_en_lote: set[tuple[str, datetime]] = set()
+        intervalos_en_lote: dict[str, list[tuple[datetime, datetime]]] = {}
+        resultados = []
+
+        for fila in filas:
+            dni, matricula, especialidad, fecha_hora = fila[:4]
+            duracion = fila[4] if len(fila) > 4 else DURACION_TURNO_POR_DEFECTO
+            if dni not in pacientes:
+                pacientes[dni] = self._buscar_paciente(dni)
+            if matricula not in medicos:
+                medicos[matricula] = self._buscar_medico(matricula)
+
+            paciente = pacientes[dni]
+            medico = medicos[matricula]
+
+            if paciente is None:
+                resultados.append(ResultadoOperacion(False, f"Paciente con DNI: {dni} no está registrado en la clínica", PACIENTE_NO_REGISTRADO))
+                continue
+            if medico is None:
+                resultados.append(ResultadoOperacion(False, f"Médico con matrícula: {matricula} no está registrado en la clínica", MEDICO_NO_REGISTRADO))
+                continue
+
+            if (matricula, fecha_hora) in agendados_en_lote:
+                resultados.append(ResultadoOperacion(False, "El turno está repetido dentro del lote", DUPLICADO_EN_LOTE))
+                continue
+
+            with self.__cerrojos_medicos.obtener(matricula), self.__cerrojos_pacientes.obtener(dni):
+                rechazo = self._validar_turno(medico, especialidad, fecha_hora, duracion)
+                if rechazo is None:
+                    turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
+                    self._registrar_turno(turno)
+            if rechazo is not None:
+                if rechazo.obtener_motivo() == TURNO_OCUPADO and self._superpone_en_lote(intervalos_en_lote.get(matricula, []), fecha_hora, fecha_hora + duracion):
+                    rechazo = ResultadoOperacion(False, "El turno se superpone con otro turno del mismo lote", SUPERPUESTO_EN_LOTE)
+                resultados.append(rechazo)
+                continue
+
+            agendados_en_lote.add((matricula, fecha_hora))
+            insort(intervalos_en_lote.setdefault(matricula, []), (fecha_hora, fecha_hora + duracion))
+            resultados.append(ResultadoOperacion(True, "Turno agendado correctamente", objeto=turno))
+
+        return resultados
+
+    @staticmethod
+    def _superpone_en_lote(intervalos: list[tuple[datetime, datetime]], inicio: datetime, fin: datetime) -> bool:
+        # intervalos: LOS DEL MEDICO AGENDADOS EN EL LOTE, ORDENADOS Y SIN SUPERPONERSE ENTRE SI, ASI QUE
+        # ALCANZA CON EL ULTIMO QUE EMPIEZA ANTES DE fin
+        posicion = bisect_left(intervalos, (fin,))
+        return posicion > 0 and intervalos[posicion - 1][1] > inicio
+
+    def _validar_turno(self, medico: Medico, especialidad: str, fecha_hora: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, excepto: datetime | None = None) -> ResultadoOperacion | None:
+        rechazo = self._validar_especialidad_y_dia(medico, especialidad, fecha_hora)
+        if rechazo is not None:
+            return rechazo
+
+        # VALIDAR TURNO DUPLICADO O SUPERPUESTO
+        if self.validar_superposicion(medico.obtener_matricula(), fecha_hora, duracion, excepto):
+            return ResultadoOperacion(False, "Ya existe un turno para ese médico en esa fecha y hora", TURNO_OCUPADO)
+
+        return None
+
+    def _validar_especialidad_y_dia(self, medico: Medico, especialidad: str, fecha_hora: datetime) -> ResultadoOperacion | None:
         # VALIDAR ESPECIALIDAD
-        tiene_especialidad = False
-        for esp in medico.obtener_especialidades():
-            if esp.obtener_especialidad() == especialidad:
-                tiene_especialidad = True
-                break
-
-        if not tiene_especialidad:
-            print(f"El médico no atiende la especialidad {especialidad}")
-            return False
-        
-        #VALIDAR SI EL MEDICO ATIENDE ESA ESPECIALIDAD ESE DIA
+        if not medico.atiende_especialidad(especialidad):
+            return ResultadoOperacion(False, f"El médico no atiende la especialidad {especialidad}", ESPECIALIDAD_NO_ATENDIDA)
+
+        # VALIDAR SI EL MEDICO ATIENDE ESA ESPECIALIDAD ESE DIA
         dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
-        especialidad_para_dia = medico.obtener_especialidad_para_dia(dia_semana)
+        if medico.obtener_especialidad_para_dia(dia_semana) != especialidad:
+            return ResultadoOperacion(False, f"El médico no atiende {especialidad} los {dia_semana}", DIA_NO_DISPONIBLE)
+
+        return None
+
+    def _notificar(self, resultado: ResultadoOperacion) -> ResultadoOperacion:
+        self.__registro.registrar(resultado)
+        return resultado
+
+    def _registrar_turno(self, turno: Turno) -> None:
+        if self.__bitacora is not None:
+            self.__bitacora.registrar_turno(
+                turno.obtener_paciente().obtener_dni(),
+                turno.obtener_medico().obtener_matricula(),
+                turno.obtener_especialidad(),
+                turno.obtener_fecha_hora(),
+                turno.obtener_duracion()
+            )
+        self._aplicar_turno(turno)
+
+    def _aplicar_turno(self, turno: Turno) -> None:
+        # LA HISTORIA SE OBTIENE ANTES DE PERSISTIR PARA NO CARGAR EL TURNO DOS VECES
+        historia = self.obtener_historia_clinica_por_DNI(turno.obtener_paciente().obtener_dni())
+
+        self.__agenda.agregar(turno)
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_turno(turno)
+        if self.__tabla_turnos is not None:
+            self.__tabla_turnos.agregar(turno)
 
-        if especialidad_para_dia != especialidad:
-            print(f"El médico no atiende {especialidad} los {dia_semana}")
-            return False
-        
-        # VALIDAR TURNO DUPLICADO
-        if self.validar_turno_duplicado(matricula, fecha_hora):
-            raise TurnoOcupadoException(f"Ya existe un turno para ese médico en esa fecha y hora")
-            return False
-        
-        # CREAR EL TURNO (después de todas las validaciones)
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        
-        # AGREGAR EL TURNO
-        self.__turnos.append(turno)
-        print(f"Turno agendado correctamente para el paciente {paciente.obtener_nombre()} con el médico {medico.obtener_nombre()}.")
-        
-        historia = self.obtener_historia_clinica_por_DNI(dni)
         if historia:
             historia.agregar_turno(turno)
-        print(f"Turno agregado a la historia clínica del paciente con dni:{dni}")
-
-        return True
     
+# SERIES DE TURNOS
+
+    def agendar_serie(self, serie: SerieTurnos, atomica: bool = True) -> list[ResultadoOperacion]:
+        # UN RESULTADO POR OCURRENCIA. LA SERIE SE VALIDA DE UNA VEZ: TODAS LAS OCURRENCIAS CAEN EL MISMO
+        # DIA DE LA SEMANA (ESPECIALIDAD Y DIA SE VERIFICAN UNA SOLA VEZ) Y LA AGENDA DEL MEDICO SE RECORRE
+        # EN UNA PASADA. atomica: CON UNA OCURRENCIA OCUPADA NO SE AGENDA NINGUNA; SI NO, SOLO LAS LIBRES
+        dni = serie.obtener_dni()
+        matricula = serie.obtener_matricula()
+        cantidad = serie.obtener_cantidad()
+
+        paciente = self._buscar_paciente(dni)
+        medico = self._buscar_medico(matricula)
+        if paciente is None:
+            rechazo = ResultadoOperacion(False, f"Paciente con DNI: {dni} no está registrado en la clínica", PACIENTE_NO_REGISTRADO)
+        elif medico is None:
+            rechazo = ResultadoOperacion(False, f"Médico con matrícula: {matricula} no está registrado en la clínica", MEDICO_NO_REGISTRADO)
+        else:
+            with self.__cerrojos_medicos.obtener(matricula), self.__cerrojos_pacientes.obtener(dni):
+                rechazo = self._validar_especialidad_y_dia(medico, serie.obtener_especialidad(), serie.obtener_inicio())
+                if rechazo is None:
+                    ocupadas = self._ocurrencias_ocupadas(serie)
+                    agendar = not ocupadas or (not atomica and len(ocupadas) + len(serie.obtener_excluidas()) < cantidad)
+                    if agendar:
+                        serie = serie.excluyendo(ocupadas) if ocupadas else serie
+                        self._registrar_serie(serie)
+        if rechazo is not None:
+            self._notificar(rechazo)
+            return [rechazo] * cantidad
+
+        resultados = []
+        excluidas = serie.obtener_excluidas()
+        for indice, fecha in enumerate(serie.fechas()):
+            if indice in ocupadas:
+                resultados.append(ResultadoOperacion(False, f"Ya existe un turno para ese médico el {fecha.strftime('%d/%m/%Y %H:%M')}", TURNO_OCUPADO))
+            elif not agendar:
+                resultados.append(ResultadoOperacion(False, "La serie no se agendó porque otras ocurrencias están ocupadas", SERIE_RECHAZADA))
+            elif indice in excluidas:
+                resultados.append(ResultadoOperacion(False, "La ocurrencia está excluida de la serie", SERIE_RECHAZADA))
+            else:
+                resultados.append(ResultadoOperacion(True, f"Turno reservado para el {fecha.strftime('%d/%m/%Y %H:%M')}", objeto=serie))
+
+        agendadas = sum(1 for resultado in resultados if resultado)
+        if agendar:
+            self._notificar(ResultadoOperacion(True, f"Serie de {agendadas} turnos agendada para el paciente {paciente.obtener_nombre()} con el médico {medico.obtener_nombre()}.", objeto=serie))
+        else:
+            self._notificar(ResultadoOperacion(False, f"La serie no se agendó: {len(ocupadas)} de {cantidad} turnos están ocupados", SERIE_RECHAZADA))
+        return resultados
+
+    def _ocurrencias_ocupadas(self, serie: SerieTurnos) -> set[int]:
+        # INDICES DE LAS OCURRENCIAS QUE CHOCAN CON TURNOS U OTRAS SERIES DEL MEDICO (CON SU CERROJO TOMADO)
+        matricula = serie.obtener_matricula()
+        duracion = serie.obtener_duracion()
+        intervalos = [(fecha, fecha + duracion) for fecha in serie.fechas()]
+        ocupadas = {indice for indice, ocupado in enumerate(self.__agenda.superposiciones(matricula, intervalos)) if ocupado}
+        if self.__repositorio is not None:
+            # UNA SOLA CONSULTA POR TODO EL RANGO DE LA SERIE; LAS OCURRENCIAS SE CRUZAN EN MEMORIA.
+            # LAS SERIES PERSISTIDAS YA ESTAN EN LA AGENDA DESDE QUE ARRANCO LA CLINICA
+            ocupacion = IntervalosMedico()
+            for inicio, fin in self.__repositorio.listar_intervalos_turnos(matricula, intervalos[0][0], intervalos[-1][1]):
+                ocupacion.agregar(inicio, fin)
+            ocupadas.update(indice for indice, ocupado in enumerate(ocupacion.superposiciones(intervalos)) if ocupado)
+        return ocupadas - serie.obtener_excluidas()
+
+    def _registrar_serie(self, serie: SerieTurnos) -> None:
+        if self.__bitacora is not None:
+            self.__bitacora.registrar_serie(
+                serie.obtener_dni(),
+                serie.obtener_matricula(),
+                serie.obtener_especialidad(),
+                serie.obtener_inicio(),
+                serie.obtener_frecuencia(),
+                serie.obtener_cantidad(),
+                serie.obtener_duracion(),
+                sorted(serie.obtener_excluidas())
+            )
+        self._aplicar_serie(serie)
+
+    def _aplicar_serie(self, serie: SerieTurnos) -> None:
+        # LA SERIE OCUPA SUS HORARIOS COMO REGLA: NINGUN Turno SE CREA HASTA MATERIALIZARLA
+        self.__agenda.agregar_serie(serie)
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_serie(serie)
+
+    def _actualizar_serie(self, serie: SerieTurnos) -> None:
+        # DESPUES DE MATERIALIZAR O EXCLUIR OCURRENCIAS: SIN PENDIENTES, LA SERIE DEJA LA AGENDA Y EL REPOSITORIO
+        if serie.cantidad_pendientes() == 0:
+            self.__agenda.quitar_serie(serie)
+            if self.__repositorio is not None:
+                self.__repositorio.eliminar_serie(serie.obtener_matricula(), serie.obtener_inicio())
+        elif self.__repositorio is not None:
+            self.__repositorio.guardar_serie(serie)
+
+    def materializar_series(self, hasta: datetime) -> int:
+        # CONVIERTE EN TURNOS (AGENDA, HISTORIA, REPOSITORIO) LAS OCURRENCIAS ANTERIORES A hasta.
+        # DEVUELVE CUANTOS TURNOS SE CREARON
+        return sum(self._materializar_serie(serie, serie.ocurrencias_antes_de(hasta)) for serie in self.__agenda.obtener_series())
+
+    def _materializar_serie(self, serie: SerieTurnos, limite: int, registrar: bool = True) -> int:
+        paciente = self._buscar_paciente(serie.obtener_dni())
+        medico = self._buscar_medico(serie.obtener_matricula())
+        if paciente is None or medico is None:
+            return 0
+
+        with self.__cerrojos_medicos.obtener(serie.obtener_matricula()), self.__cerrojos_pacientes.obtener(serie.obtener_dni()):
+            if limite <= serie.obtener_materializadas():
+                return 0
+            pendientes = list(serie.pendientes(limite))
+            if registrar and self.__bitacora is not None:
+                self.__bitacora.registrar_materializacion(serie.obtener_matricula(), serie.obtener_inicio(), limite)
+            # PRIMERO SE LIBERAN LAS OCURRENCIAS DE LA REGLA Y DESPUES OCUPAN SU LUGAR LOS TURNOS
+            serie._avanzar(limite)
+            for _, fecha in pendientes:
+                self._aplicar_turno(Turno(paciente, medico, fecha, serie.obtener_especialidad(), serie.obtener_duracion()))
+            self._actualizar_serie(serie)
+        return len(pendientes)
+
+    def obtener_series(self, matricula: str | None = None, dni: str | None = None) -> list[SerieTurnos]:
+        # SERIES CON OCURRENCIAS SIN MATERIALIZAR
+        series = self.__agenda.obtener_series(matricula)
+        if dni is not None:
+            series = [serie for serie in series if serie.obtener_dni() == dni]
+        return series
+
+    def _buscar_serie(self, matricula: str, inicio: datetime) -> SerieTurnos | None:
+        for serie in self.__agenda.obtener_series(matricula):
+            if serie.obtener_inicio() == inicio:
+                return serie
+        return None
+
+# CANCELAR Y REPROGRAMAR
+
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> ResultadoOperacion:
+        # EL HORARIO QUEDA LIBRE EN EL ACTO: AGENDA, OCUPACION DEL MEDICO, TABLA, HISTORIA Y REPOSITORIO.
+        # TAMBIEN CANCELA UNA OCURRENCIA PENDIENTE DE UNA SERIE. SI ALGUIEN ESPERA ESE HORARIO, SE LE
+        # ASIGNA SIN SOLTAR EL CERROJO DEL MEDICO (EL RESULTADO LLEVA ESE TURNO COMO OBJETO)
+        asignado = None
+        with self.__cerrojos_medicos.obtener(matricula):
+            ubicado = self._ubicar_turno(matricula, fecha_hora)
+            if ubicado is not None:
+                dni = ubicado[0]
+                with self.__cerrojos_pacientes.obtener(dni):
+                    if self.__bitacora is not None:
+                        self.__bitacora.registrar_cancelacion(matricula, fecha_hora)
+                    self._aplicar_cancelacion(matricula, fecha_hora, dni)
+                asignado = self._asignar_desde_lista_espera(matricula, fecha_hora)
+
+        if ubicado is None:
+            return self._notificar(ResultadoOperacion(False, f"No existe un turno del médico {matricula} el {fecha_hora.strftime('%d/%m/%Y %H:%M')}", TURNO_NO_ENCONTRADO))
+        return self._notificar(ResultadoOperacion(True, f"Turno del {fecha_hora.strftime('%d/%m/%Y %H:%M')} cancelado para el paciente con DNI {dni}.", objeto=asignado))
+
+    def reprogramar_turno(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime) -> ResultadoOperacion:
+        # MISMO MEDICO, PACIENTE, ESPECIALIDAD Y DURACION EN OTRO HORARIO. EL NUEVO SE VALIDA SIN CONTAR
+        # EL VIEJO (PUEDE PISARLO, POR EJEMPLO AL CORRERLO 15 MINUTOS); SI SE RECHAZA, NADA CAMBIA
+        medico = self._buscar_medico(matricula)
+        ubicado = rechazo = None
+        if medico is not None:
+            with self.__cerrojos_medicos.obtener(matricula):
+                ubicado = self._ubicar_turno(matricula, fecha_hora)
+                if ubicado is not None:
+                    dni, especialidad, duracion = ubicado
+                    with self.__cerrojos_pacientes.obtener(dni):
+                        rechazo = self._validar_turno(medico, especialidad, nueva_fecha_hora, duracion, excepto=fecha_hora)
+                        if rechazo is None:
+                            if self.__bitacora is not None:
+                                self.__bitacora.registrar_reprogramacion(matricula, fecha_hora, nueva_fecha_hora)
+                            turno = self._aplicar_reprogramacion(matricula, fecha_hora, nueva_fecha_hora, ubicado)
+                    if rechazo is None:
+                        # EL HORARIO VIEJO TAMBIEN QUEDA PARA LA LISTA DE ESPERA
+                        self._asignar_desde_lista_espera(matricula, fecha_hora)
+
+        if ubicado is None:
+            rechazo = ResultadoOperacion(False, f"No existe un turno del médico {matricula} el {fecha_hora.strftime('%d/%m/%Y %H:%M')}", TURNO_NO_ENCONTRADO)
+        if rechazo is not None:
+            return self._notificar(rechazo)
+        return self._notificar(ResultadoOperacion(
+            True,
+            f"Turno reprogramado del {fecha_hora.strftime('%d/%m/%Y %H:%M')} al {nueva_fecha_hora.strftime('%d/%m/%Y %H:%M')}.",
+            objeto=turno
+        ))
+
+    def _ubicar_turno(self, matricula: str, fecha_hora: datetime) -> tuple[str, str, timedelta] | None:
+        # (dni, especialidad, duracion) DEL TURNO EN MEMORIA, EN EL REPOSITORIO O COMO OCURRENCIA DE UNA SERIE
+        turno = self.__agenda.obtener(matricula, fecha_hora)
+        if turno is None and self.__repositorio is not None:
+            turno = self.__repositorio.obtener_turno(matricula, fecha_hora, self._buscar_paciente, self._buscar_medico)
+        if turno is not None:
+            return turno.obtener_paciente().obtener_dni(), turno.obtener_especialidad(), turno.obtener_duracion()
+        serie = self._serie_con_ocurrencia(matricula, fecha_hora)
+        if serie is not None:
+            return serie.obtener_dni(), serie.obtener_especialidad(), serie.obtener_duracion()
+        return None
+
+    def _serie_con_ocurrencia(self, matricula: str, fecha_hora: datetime) -> SerieTurnos | None:
+        for serie in self.__agenda.obtener_series(matricula):
+            if serie.contiene(fecha_hora):
+                return serie
+        return None
+
+    def _aplicar_cancelacion(self, matricula: str, fecha_hora: datetime, dni: str) -> None:
+        # CADA ESTRUCTURA UBICA EL TURNO POR CLAVE CON BISECT O DICCIONARIO, SIN RECORRER TODOS LOS TURNOS
+        turno = self.__agenda.quitar(matricula, fecha_hora)
+        eliminado = self.__repositorio is not None and self.__repositorio.eliminar_turno(matricula, fecha_hora)
+        if turno is None and not eliminado:
+            serie = self._serie_con_ocurrencia(matricula, fecha_hora)
+            if serie is not None:
+                serie._excluir(fecha_hora)
+                self._actualizar_serie(serie)
+            return
+
+        if self.__tabla_turnos is not None:
+            self.__tabla_turnos.desactivar_turno(matricula, fecha_hora)
+        # SOLO LA HISTORIA YA CARGADA: SI ESTA EN EL REPOSITORIO, SE VA A LEER SIN EL TURNO
+        historia = self.__historias_clinicas.get(dni)
+        if historia is not None:
+            historia.quitar_turno_de(matricula, fecha_hora)
+
+    def _aplicar_reprogramacion(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime, ubicado: tuple[str, str, timedelta]) -> Turno:
+        dni, especialidad, duracion = ubicado
+        self._aplicar_cancelacion(matricula, fecha_hora, dni)
+        turno = Turno(self._buscar_paciente(dni), self._buscar_medico(matricula), nueva_fecha_hora, especialidad, duracion)
+        self._aplicar_turno(turno)
+        return turno
+
+# LISTA DE ESPERA
+
+    def agregar_a_lista_espera(self, dni: str, especialidad: str, matricula: str | None = None, prioridad: int = PRIORIDAD_NORMAL, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, desde: datetime | None = None, hasta: datetime | None = None) -> ResultadoOperacion:
+        # SIN matricula EL PACIENTE ACEPTA CUALQUIER MEDICO DE LA ESPECIALIDAD. desde Y hasta
+        # LIMITAN LOS HORARIOS QUE ACEPTA. EL OBJETO DEL RESULTADO ES LA SOLICITUD
+        if not self.validar_existencia_paciente(dni):
+            return self._notificar(ResultadoOperacion(False, f"Paciente con DNI: {dni} no está registrado en la clínica", PACIENTE_NO_REGISTRADO))
+        if matricula is not None:
+            medico = self._buscar_medico(matricula)
+            if medico is None:
+                return self._notificar(ResultadoOperacion(False, f"Médico con matrícula: {matricula} no está registrado en la clínica", MEDICO_NO_REGISTRADO))
+            if not medico.atiende_especialidad(especialidad):
+                return self._notificar(ResultadoOperacion(False, f"El médico no atiende la especialidad {especialidad}", ESPECIALIDAD_NO_ATENDIDA))
+
+        solicitud = self.__lista_espera.agregar(dni, especialidad, matricula, prioridad, duracion, desde, hasta)
+        if solicitud is None:
+            return self._notificar(ResultadoOperacion(False, f"El paciente con DNI {dni} ya está en la lista de espera de {especialidad}.", YA_EN_LISTA_ESPERA))
+        return self._notificar(ResultadoOperacion(True, f"Paciente con DNI {dni} agregado a la lista de espera de {especialidad}.", objeto=solicitud))
+
+    def quitar_de_lista_espera(self, solicitud: SolicitudEspera) -> bool:
+        return self.__lista_espera.quitar(solicitud)
+
+    def obtener_lista_espera(self) -> ListaEspera:
+        return self.__lista_espera
+
+    def _asignar_desde_lista_espera(self, matricula: str, fecha_hora: datetime) -> Turno | None:
+        # CON EL CERROJO DEL MEDICO TOMADO: NADIE MAS PUEDE OCUPAR EL HORARIO RECIEN LIBERADO.
+        # LA ESPECIALIDAD ES LA QUE EL MEDICO ATIENDE ESE DIA Y CADA CANDIDATA PASA LAS MISMAS
+        # VALIDACIONES QUE agendar_turno (CON SU PROPIA DURACION)
+        if not len(self.__lista_espera):
+            return None
+        medico = self._buscar_medico(matricula)
+        if medico is None:
+            return None
+        especialidad = medico.obtener_especialidad_para_dia(self.obtener_dia_semana_en_espanol(fecha_hora))
+        if especialidad is None:
+            return None
+
+        def acepta(solicitud: SolicitudEspera) -> bool:
+            return (
+                self._buscar_paciente(solicitud.obtener_dni()) is not None
+                and self._validar_turno(medico, especialidad, fecha_hora, solicitud.obtener_duracion()) is None
+            )
+
+        solicitud = self.__lista_espera.tomar(matricula, especialidad, fecha_hora, acepta)
+        if solicitud is None:
+            return None
+        dni = solicitud.obtener_dni()
+        turno = Turno(self._buscar_paciente(dni), medico, fecha_hora, especialidad, solicitud.obtener_duracion())
+        with self.__cerrojos_pacientes.obtener(dni):
+            self._registrar_turno(turno)
+        self._notificar(ResultadoOperacion(True, f"Turno del {fecha_hora.strftime('%d/%m/%Y %H:%M')} asignado desde la lista de espera al paciente con DNI {dni}.", objeto=turno))
+        return turno
+
 # EMITIR RECETA
 
     def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]) -> str:
@@ -122,7 +709,18 @@ class Clinica:
         # CREAR LA RECETA
    
         receta = Receta(paciente, medico, medicamentos)
+        # EL CERROJO DEL PACIENTE EVITA QUE DOS HILOS CREEN DOS HISTORIAS PARA EL MISMO DNI
+        with self.__cerrojos_pacientes.obtener(dni):
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_receta(dni, matricula, receta.obtener_medicamentos(), receta.obtener_fecha())
+            self._aplicar_receta(receta)
             
+        return f"Receta emitida correctamente para {paciente.obtener_nombre()}"
+
+    def _aplicar_receta(self, receta: Receta) -> None:
+        paciente = receta.obtener_paciente()
+        dni = paciente.obtener_dni()
+
         # AGREGAR A LA HISTORIA CLÍNICA
         historia = self.obtener_historia_clinica_por_DNI(dni)
         if historia:
@@ -132,8 +730,97 @@ class Clinica:
                 nueva_historia = HistoriaClinica(paciente)
                 nueva_historia.agregar_receta(receta)
                 self.__historias_clinicas[dni] = nueva_historia
-            
-        return f"Receta emitida correctamente para {paciente.obtener_nombre()}"
+                if self.__repositorio is not None:
+                    self.__repositorio.guardar_historia(dni)
+
+        if self.__repositorio is not None:
+            self.__repositorio.guardar_receta(receta)
+
+# BITACORA
+
+    def reproducir_bitacora(self) -> int:
+        # REAPLICA LO REGISTRADO DESPUES DEL ULTIMO SNAPSHOT SIN VOLVER A ESCRIBIRLO
+        if self.__bitacora is None:
+            return 0
+
+        aplicados = 0
+        for registro in self.__bitacora.leer():
+            operacion = registro["op"]
+            if operacion == OP_PACIENTE:
+                if self._buscar_paciente(registro["dni"]) is None:
+                    self._aplicar_paciente(Paciente._desde_datos_validados(registro["nombre"], registro["dni"], registro["fecha_de_nacimiento"]))
+                    aplicados += 1
+            elif operacion == OP_MEDICO:
+                especialidades = [Especialidad(tipo, dias) for tipo, dias in registro["especialidades"]]
+                medico = self._buscar_medico(registro["matricula"])
+                if medico is None:
+                    self._aplicar_medico(Medico._desde_datos_validados(registro["nombre"], registro["matricula"], especialidades))
+                    aplicados += 1
+                else:
+                    # EL MISMO MEDICO CON MAS ESPECIALIDADES: LAS QUE SE LE AGREGARON DESPUES DEL ALTA
+                    faltantes = [e for e in especialidades if not self._tiene_especialidad(medico, e)]
+                    if faltantes:
+                        self._aplicar_especialidades(medico, faltantes)
+                        aplicados += 1
+            elif operacion == OP_TURNO:
+                fecha_hora = datetime.fromisoformat(registro["fecha_hora"])
+                duracion = timedelta(seconds=registro.get("duracion", DURACION_TURNO_POR_DEFECTO.total_seconds()))
+                paciente = self._buscar_paciente(registro["dni"])
+                medico = self._buscar_medico(registro["matricula"])
+                if paciente is not None and medico is not None and not self.validar_superposicion(registro["matricula"], fecha_hora, duracion):
+                    self._aplicar_turno(Turno(paciente, medico, fecha_hora, registro["especialidad"], duracion))
+                    aplicados += 1
+            elif operacion == OP_SERIE:
+                inicio = datetime.fromisoformat(registro["inicio"])
+                if self._buscar_serie(registro["matricula"], inicio) is None and self._buscar_paciente(registro["dni"]) is not None:
+                    self._aplicar_serie(SerieTurnos(
+                        registro["dni"], registro["matricula"], registro["especialidad"], inicio, registro["frecuencia"],
+                        cantidad=registro["cantidad"], duracion=timedelta(seconds=registro["duracion"]), excluidas=registro["excluidas"]
+                    ))
+                    aplicados += 1
+            elif operacion == OP_MATERIALIZACION:
+                serie = self._buscar_serie(registro["matricula"], datetime.fromisoformat(registro["inicio"]))
+                if serie is not None and self._materializar_serie(serie, registro["materializadas"], registrar=False):
+                    aplicados += 1
+            elif operacion == OP_CANCELACION:
+                fecha_hora = datetime.fromisoformat(registro["fecha_hora"])
+                ubicado = self._ubicar_turno(registro["matricula"], fecha_hora)
+                if ubicado is not None:
+                    self._aplicar_cancelacion(registro["matricula"], fecha_hora, ubicado[0])
+                    aplicados += 1
+            elif operacion == OP_REPROGRAMACION:
+                fecha_hora = datetime.fromisoformat(registro["fecha_hora"])
+                nueva_fecha_hora = datetime.fromisoformat(registro["nueva_fecha_hora"])
+                ubicado = self._ubicar_turno(registro["matricula"], fecha_hora)
+                if ubicado is None:
+                    continue
+                if not self.validar_superposicion(registro["matricula"], nueva_fecha_hora, ubicado[2], excepto=fecha_hora):
+                    self._aplicar_reprogramacion(registro["matricula"], fecha_hora, nueva_fecha_hora, ubicado)
+                    aplicados += 1
+                else:
+                    # YA REPROGRAMADO EN UNA PASADA ANTERIOR: EL ORIGEN VOLVIO POR SU OP_TURNO Y SE DESCARTA
+                    destino = self._ubicar_turno(registro["matricula"], nueva_fecha_hora)
+                    if destino is not None and destino[0] == ubicado[0]:
+                        self._aplicar_cancelacion(registro["matricula"], fecha_hora, ubicado[0])
+                        aplicados += 1
+            elif operacion == OP_RECETA:
+                fecha = datetime.fromisoformat(registro["fecha"])
+                paciente = self._buscar_paciente(registro["dni"])
+                medico = self._buscar_medico(registro["matricula"])
+                if paciente is not None and medico is not None and not self._receta_ya_aplicada(registro["dni"], registro["matricula"], fecha):
+                    self._aplicar_receta(Receta(paciente, medico, registro["medicamentos"], fecha))
+                    aplicados += 1
+        return aplicados
+
+    def _receta_ya_aplicada(self, dni: str, matricula: str, fecha: datetime) -> bool:
+        # CUBRE UNA CAIDA ENTRE EL SNAPSHOT DE COMPACTACION Y EL TRUNCADO DE LA BITACORA
+        historia = self.obtener_historia_clinica_por_DNI(dni)
+        if historia is None:
+            return False
+        return any(
+            r.obtener_medico().obtener_matricula() == matricula
+            for r in historia.obtener_recetas_entre(fecha, fecha + timedelta(microseconds=1))
+        )
             
 # OBTENER
 
@@ -142,15 +829,18 @@ class Clinica:
     
     def obtener_pacientes_dict(self) -> dict[str, Paciente]:
         return self.__pacientes
+
+    def obtener_historias_clinicas_dict(self) -> dict[str, HistoriaClinica]:
+        return self.__historias_clinicas
     
     def obtener_medico_por_matricula(self, matricula: str) -> Medico | None:
-        medico = self.__medicos.get(matricula)
+        medico = self._buscar_medico(matricula)
         if medico is None:
             raise MedicoNoEncontradoException(f"Médico con matrícula {matricula} no encontrado")
         return medico
     
     def obtener_paciente_por_dni(self, dni: str) -> Paciente | None:
-        paciente = self.__pacientes.get(dni)
+        paciente = self._buscar_paciente(dni)
         if paciente is None:
             raise PacienteNoEncontradoException(f"Paciente con DNI: {dni} no encontrado")
         return paciente
@@ -158,41 +848,244 @@ class Clinica:
     def obtener_historia_clinica_por_DNI(self, dni: str) -> HistoriaClinica | None: 
         hc = self.__historias_clinicas.get(dni) 
         if hc is None:
-            return None 
+            if self.__repositorio is None or not self.validar_existencia_paciente(dni):
+                return None
+            # UNA SOLA CARGA DESDE EL REPOSITORIO AUNQUE VARIOS HILOS LA PIDAN A LA VEZ
+            with self.__cerrojos_pacientes.obtener(dni):
+                hc = self.__historias_clinicas.get(dni)
+                if hc is None:
+                    hc = self.__repositorio.cargar_historia(self._buscar_paciente(dni), self._buscar_medico)
+                    if hc is None:
+                        return None
+                    self.__historias_clinicas[dni] = hc
         return hc
 
-    def obtener_turnos(self) -> list[Turno]:  
-        return self.__turnos.copy()  
+    def obtener_turnos(self) -> list[Turno]:
+        if self.__repositorio is not None:
+            return list(self.__repositorio.listar_turnos(self._buscar_paciente, self._buscar_medico))
+        return self.__agenda.obtener_turnos()
+
+    def obtener_tabla_turnos(self) -> TablaTurnos:
+        tabla = self.__tabla_turnos
+        if tabla is None:
+            # CON LAS ESCRITURAS DETENIDAS NINGUN TURNO SE AGENDA NI SE CANCELA MIENTRAS SE ARMA
+            with self.escrituras_detenidas():
+                tabla = self.__tabla_turnos
+                if tabla is None:
+                    tabla = self._armar_tabla_turnos()
+                    self.__tabla_turnos = tabla
+        return tabla
+
+    def _armar_tabla_turnos(self) -> TablaTurnos:
+        # LOS TURNOS AGENDADOS CON REPOSITORIO ESTAN EN EL Y EN LA AGENDA: CADA UNO ENTRA UNA SOLA VEZ
+        tabla = TablaTurnos()
+        cargados: set[tuple[str, datetime]] = set()
+        if self.__repositorio is not None:
+            for matricula, dni, especialidad, fecha_hora, duracion in self.__repositorio.listar_filas_turnos():
+                tabla.agregar_fila(matricula, dni, especialidad, fecha_hora, duracion)
+                cargados.add((matricula, fecha_hora))
+        for turno in self.__agenda.obtener_turnos():
+            if (turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora()) not in cargados:
+                tabla.agregar(turno)
+        return tabla
+
+    def obtener_turnos_por_dni(self, dni: str) -> list[Turno]:
+        # CON REPOSITORIO LA BASE TIENE TODOS LOS TURNOS (TAMBIEN LOS DE SESIONES ANTERIORES): CONSULTA POR idx_turnos_dni
+        if self.__repositorio is not None:
+            return list(self.__repositorio.listar_turnos_por_dni(dni, self._buscar_paciente, self._buscar_medico))
+        return self.__agenda.obtener_por_dni(dni)
+
+    def obtener_turnos_por_fecha(self, dia: date) -> list[Turno]:
+        if self.__repositorio is not None:
+            inicio = datetime.combine(dia, time())
+            return list(self.__repositorio.listar_turnos_entre(inicio, inicio + timedelta(days=1), self._buscar_paciente, self._buscar_medico))
+        return self.__agenda.obtener_por_fecha(dia)
     
     def obtener_pacientes(self) -> list[Paciente]:
+        if self.__repositorio is not None:
+            return [self.__pacientes.get(p.obtener_dni(), p) for p in self.__repositorio.listar_pacientes()]
         return list(self.__pacientes.values())
 
     def obtener_medicos(self) -> list[Medico]:
+        if self.__repositorio is not None:
+            return [self.__medicos.get(m.obtener_matricula(), m) for m in self.__repositorio.listar_medicos()]
         return list(self.__medicos.values())
         
     def obtener_especialidad_disponible(self, medico: Medico, dia_semana: str) -> str | None:
         return medico.obtener_especialidad_para_dia(dia_semana)
     
+# LISTADOS PAGINADOS
+
+    # LOS iterar_* SON PEREZOSOS Y ORDENADOS POR CLAVE (DNI, MATRICULA O (fecha_hora, matricula)).
+    # despues_de ES EL CURSOR DE UNA PAGINA ANTERIOR: SE RETOMA POR BISECT O POR INDICE EN EL
+    # REPOSITORIO, SIN RECORRER NI COPIAR LO YA LISTADO
+
+    def iterar_pacientes(self, despues_de: str | None = None, prefijo_nombre: str | None = None) -> Iterator[Paciente]:
+        if self.__repositorio is not None:
+            pacientes = (self.__pacientes.get(p.obtener_dni(), p) for p in self.__repositorio.listar_pacientes(despues_de))
+        else:
+            pacientes = map(self.__pacientes.__getitem__, self.__indice_pacientes.iterar(despues_de))
+        if prefijo_nombre:
+            prefijo = prefijo_nombre.strip().casefold()
+            pacientes = (p for p in pacientes if p.obtener_nombre().casefold().startswith(prefijo))
+        return pacientes
+
+    def iterar_medicos(self, despues_de: str | None = None, especialidad: str | None = None, prefijo_nombre: str | None = None) -> Iterator[Medico]:
+        if self.__repositorio is not None:
+            medicos = (self.__medicos.get(m.obtener_matricula(), m) for m in self.__repositorio.listar_medicos(despues_de))
+        else:
+            medicos = map(self.__medicos.__getitem__, self.__indice_medicos.iterar(despues_de))
+        if especialidad:
+            medicos = (m for m in medicos if m.atiende_especialidad(especialidad))
+        if prefijo_nombre:
+            prefijo = prefijo_nombre.strip().casefold()
+            medicos = (m for m in medicos if m.obtener_nombre().casefold().startswith(prefijo))
+        return medicos
+
+    def iterar_turnos(self, despues_de: tuple[datetime, str] | None = None, desde: date | None = None, hasta: date | None = None, matricula: str | None = None, especialidad: str | None = None) -> Iterator[Turno]:
+        # EL RANGO DE FECHAS (AMBOS EXTREMOS INCLUIDOS) NO FILTRA: MUEVE EL CURSOR Y CORTA EL RECORRIDO
+        if desde is not None:
+            inicio = (datetime.combine(desde, time()), "")
+            if despues_de is None or despues_de < inicio:
+                despues_de = inicio
+        if self.__repositorio is not None:
+            turnos = self.__repositorio.listar_turnos(self._buscar_paciente, self._buscar_medico, despues_de)
+        else:
+            turnos = self.__agenda.iterar(despues_de)
+        if hasta is not None:
+            limite = datetime.combine(hasta + timedelta(days=1), time())
+            turnos = takewhile(lambda t: t.obtener_fecha_hora() < limite, turnos)
+        if matricula is not None:
+            turnos = (t for t in turnos if t.obtener_medico().obtener_matricula() == matricula)
+        if especialidad is not None:
+            turnos = (t for t in turnos if t.obtener_especialidad() == especialidad)
+        return turnos
+
+    def paginar_pacientes(self, cursor: str | None = None, tamano: int = TAMANO_PAGINA, prefijo_nombre: str | None = None) -> Pagina:
+        return paginar(self.iterar_pacientes(cursor, prefijo_nombre), tamano, Paciente.obtener_dni)
+
+    def paginar_medicos(self, cursor: str | None = None, tamano: int = TAMANO_PAGINA, especialidad: str | None = None, prefijo_nombre: str | None = None) -> Pagina:
+        return paginar(self.iterar_medicos(cursor, especialidad, prefijo_nombre), tamano, Medico.obtener_matricula)
+
+    def paginar_turnos(self, cursor: tuple[datetime, str] | None = None, tamano: int = TAMANO_PAGINA, desde: date | None = None, hasta: date | None = None, matricula: str | None = None, especialidad: str | None = None) -> Pagina:
+        return paginar(self.iterar_turnos(cursor, desde, hasta, matricula, especialidad), tamano, self._clave_de_turno)
+
+# BUSCAR PACIENTES
+
+    def buscar_pacientes(self, texto: str, cantidad: int = TAMANO_PAGINA, aproximado: bool = True) -> list[Paciente]:
+        # PRIMERO LOS NOMBRES QUE EMPIEZAN CON LO BUSCADO (SIN ACENTOS NI MAYUSCULAS, CUALQUIER PALABRA
+        # DEL NOMBRE); SI NO ALCANZAN, SE COMPLETA CON NOMBRES PARECIDOS (ERRORES DE TIPEO)
+        indice = self._obtener_indice_nombres()
+        dnis = indice.buscar_prefijo(texto, cantidad)
+        if aproximado and len(dnis) < cantidad:
+            encontrados = set(dnis)
+            dnis += [dni for dni in indice.buscar_aproximado(texto, cantidad) if dni not in encontrados][:cantidad - len(dnis)]
+        return [paciente for paciente in map(self._buscar_paciente, dnis) if paciente is not None]
+
+    def _obtener_indice_nombres(self) -> IndiceNombres:
+        indice = self.__indice_nombres
+        if indice is None:
+            # CON TODOS LOS CERROJOS DE PACIENTES NINGUN ALTA QUEDA FUERA DEL INDICE MIENTRAS SE ARMA
+            with self.__cerrojos_pacientes.todos():
+                indice = self.__indice_nombres
+                if indice is None:
+                    indice = IndiceNombres()
+                    if self.__repositorio is not None:
+                        indice.agregar_lote((p.obtener_dni(), p.obtener_nombre()) for p in self.__repositorio.listar_pacientes())
+                    indice.agregar_lote((dni, p.obtener_nombre()) for dni, p in list(self.__pacientes.items()))
+                    self.__indice_nombres = indice
+        return indice
+
+    @staticmethod
+    def _clave_de_turno(turno: Turno) -> tuple[datetime, str]:
+        return turno.obtener_fecha_hora(), turno.obtener_medico().obtener_matricula()
+
+# BUSCAR TURNOS LIBRES
+
+    def buscar_turnos_libres(self, especialidad: str, desde: datetime, hasta: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, cantidad: int = 1, hora_inicio: time = time(8, 0), hora_fin: time = time(18, 0)) -> list[tuple[datetime, Medico]]:
+        # UN GENERADOR ORDENADO POR MEDICO; merge LOS COMBINA Y SOLO SE CONSUME LO NECESARIO
+        generadores = [
+            self._huecos_de_medico(medico, especialidad, desde, hasta, duracion, hora_inicio, hora_fin)
+            for medico in self.obtener_medicos()
+            if medico.atiende_especialidad(especialidad)
+        ]
+        return [(fecha_hora, medico) for fecha_hora, _, medico in islice(merge(*generadores), cantidad)]
+
+    def _huecos_de_medico(self, medico: Medico, especialidad: str, desde: datetime, hasta: datetime, duracion: timedelta, hora_inicio: time, hora_fin: time) -> Iterator[tuple[datetime, str, Medico]]:
+        matricula = medico.obtener_matricula()
+        dia = desde.date()
+
+        while dia <= hasta.date():
+            # SOLO LOS DIAS EN QUE EL MEDICO ATIENDE ESA ESPECIALIDAD
+            if medico.obtener_especialidad_para_dia(self.obtener_dia_semana_en_espanol(dia)) == especialidad:
+                apertura = datetime.combine(dia, hora_inicio)
+                cierre = min(datetime.combine(dia, hora_fin), hasta)
+                inicio = apertura
+                if desde > apertura:
+                    inicio = apertura + -((apertura - desde) // duracion) * duracion
+
+                # LOS HUECOS DEL DIA SE CALCULAN BAJO EL CERROJO DEL MEDICO (SIN AGREGADOS A MEDIO HACER).
+                # CON REPOSITORIO, SUS TURNOS DEL DIA LLEGAN EN UNA SOLA CONSULTA Y SE CRUZAN EN MEMORIA
+                with self.__cerrojos_medicos.obtener(matricula):
+                    huecos = list(self.__agenda.huecos_libres(matricula, inicio, cierre, duracion))
+                    if huecos and self.__repositorio is not None:
+                        ocupacion = IntervalosMedico()
+                        for ocupado_desde, ocupado_hasta in self.__repositorio.listar_intervalos_turnos(matricula, inicio, cierre):
+                            ocupacion.agregar(ocupado_desde, ocupado_hasta)
+                        ocupados = ocupacion.superposiciones((hueco, hueco + duracion) for hueco in huecos)
+                        huecos = [hueco for hueco, ocupado in zip(huecos, ocupados) if not ocupado]
+                for fecha_hora in huecos:
+                    # LA MATRICULA DESEMPATA EN merge SIN COMPARAR MEDICOS
+                    yield fecha_hora, matricula, medico
+            dia += timedelta(days=1)
+
 # VALIDAR
 
     def validar_existencia_paciente(self, dni: str) -> bool:
-        if dni in self.__pacientes:
+        if self._buscar_paciente(dni) is not None:
             return True
         else:
             return False
         
     def validar_existencia_medico(self, matricula: str) -> bool:
-        if matricula in self.__medicos:
+        if self._buscar_medico(matricula) is not None:
             return True
         else:
             return False
         
     def validar_turno_duplicado(self, matricula: str, fecha_hora: datetime) -> bool:
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and 
-                turno.obtener_fecha_hora() == fecha_hora):
-                return True     
-        return False 
+        with self.__cerrojos_medicos.obtener(matricula):
+            if self.__agenda.existe(matricula, fecha_hora):
+                return True
+            if self.__repositorio is not None:
+                return self.__repositorio.existe_turno(matricula, fecha_hora)
+            return False
+
+    def validar_superposicion(self, matricula: str, fecha_hora: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, excepto: datetime | None = None) -> bool:
+        # excepto: INICIO DE UN TURNO DEL MEDICO QUE NO CUENTA (EL QUE SE ESTA REPROGRAMANDO)
+        fin = fecha_hora + duracion
+        with self.__cerrojos_medicos.obtener(matricula):
+            if self.__agenda.superpone(matricula, fecha_hora, fin, excepto):
+                return True
+            if self.__repositorio is not None:
+                return self.__repositorio.existe_superposicion(matricula, fecha_hora, fin, excepto)
+            return False
+
+    def _buscar_paciente(self, dni: str) -> Paciente | None:
+        paciente = self.__pacientes.get(dni)
+        if paciente is None and self.__repositorio is not None:
+            paciente = self.__repositorio.obtener_paciente(dni)
+            if paciente is not None:
+                self.__pacientes[dni] = paciente
+        return paciente
+
+    def _buscar_medico(self, matricula: str) -> Medico | None:
+        medico = self.__medicos.get(matricula)
+        if medico is None and self.__repositorio is not None:
+            medico = self.__repositorio.obtener_medico(matricula)
+            if medico is not None:
+                self.__medicos[matricula] = medico
+        return medico
     
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
         dias = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
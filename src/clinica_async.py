@@ -0,0 +1,143 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, date, time, timedelta
+from functools import partial
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno, DURACION_TURNO_POR_DEFECTO
+from src.historia_clinica import HistoriaClinica
+from src.serie_turnos import SerieTurnos
+from src.lista_espera import PRIORIDAD_NORMAL
+from src.resultado import ResultadoOperacion
+from src.paginacion import Pagina, TAMANO_PAGINA
+
+class AsyncClinica:
+
+    # FACHADA ASYNC: CADA OPERACION CORRE EN UN EJECUTOR DE HILOS (CLINICA ES SEGURA ENTRE HILOS)
+    # Y EL EVENT LOOP NUNCA SE BLOQUEA CON EL REPOSITORIO, LA BITACORA O CONSULTAS PESADAS
+    def __init__(self, clinica: Clinica, ejecutor: Executor | None = None, hilos: int = 8):
+        self.__clinica = clinica
+        self.__ejecutor_propio = ejecutor is None
+        self.__ejecutor = ejecutor if ejecutor is not None else ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="clinica")
+        # PEDIDOS EN CURSO POR HORARIO: (matricula, fecha_hora) -> (pedido, tarea)
+        self.__en_curso: dict[tuple[str, datetime], tuple[tuple, asyncio.Future]] = {}
+
+    async def _ejecutar(self, funcion, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__ejecutor, partial(funcion, *args))
+
+    def obtener_clinica(self) -> Clinica:
+        return self.__clinica
+
+# AGREGAR
+
+    async def agregar_medico(self, medico: Medico) -> ResultadoOperacion:
+        return await self._ejecutar(self.__clinica.agregar_medico, medico)
+
+    async def agregar_paciente(self, paciente: Paciente) -> ResultadoOperacion:
+        return await self._ejecutar(self.__clinica.agregar_paciente, paciente)
+
+# AGENDAR TURNO
+
+    async def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO) -> ResultadoOperacion:
+        # PEDIDOS SIMULTANEOS PARA EL MISMO HORARIO:
+        # - IDENTICOS (REINTENTOS, DOBLE CLICK): COMPARTEN UNA SOLA EJECUCION Y SU RESULTADO
+        # - DISTINTOS: ESPERAN AL QUE ESTA EN CURSO Y RECIEN DESPUES SE VALIDAN (Y SE RECHAZAN SI QUEDO OCUPADO)
+        #   SIN OCUPAR HILOS DEL EJECUTOR ESPERANDO EL CERROJO DEL MEDICO
+        clave = (matricula, fecha_hora)
+        pedido = (dni, matricula, especialidad, fecha_hora, duracion)
+
+        while True:
+            en_curso = self.__en_curso.get(clave)
+            if en_curso is None:
+                break
+            pedido_en_curso, tarea = en_curso
+            if pedido_en_curso == pedido:
+                return await asyncio.shield(tarea)
+            await asyncio.wait([tarea])
+
+        # LA EJECUCION NO SE CANCELA SI SE CANCELA QUIEN LA PIDIO: shield LA PROTEGE Y
+        # EL PEDIDO SALE DE "EN CURSO" RECIEN CUANDO TERMINA EN EL EJECUTOR
+        tarea = asyncio.ensure_future(self._ejecutar(self.__clinica.agendar_turno, *pedido))
+        self.__en_curso[clave] = (pedido, tarea)
+        tarea.add_done_callback(partial(self._terminar_pedido, clave))
+        return await asyncio.shield(tarea)
+
+    def _terminar_pedido(self, clave: tuple[str, datetime], tarea: asyncio.Future) -> None:
+        en_curso = self.__en_curso.get(clave)
+        if en_curso is not None and en_curso[1] is tarea:
+            del self.__en_curso[clave]
+
+    def pedidos_en_curso(self) -> int:
+        return len(self.__en_curso)
+
+# CANCELAR Y REPROGRAMAR
+
+    async def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> ResultadoOperacion:
+        return await self._ejecutar(self.__clinica.cancelar_turno, matricula, fecha_hora)
+
+    async def reprogramar_turno(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime) -> ResultadoOperacion:
+        return await self._ejecutar(self.__clinica.reprogramar_turno, matricula, fecha_hora, nueva_fecha_hora)
+
+# LISTA DE ESPERA
+
+    async def agregar_a_lista_espera(self, dni: str, especialidad: str, matricula: str | None = None, prioridad: int = PRIORIDAD_NORMAL, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, desde: datetime | None = None, hasta: datetime | None = None) -> ResultadoOperacion:
+        return await self._ejecutar(self.__clinica.agregar_a_lista_espera, dni, especialidad, matricula, prioridad, duracion, desde, hasta)
+
+# SERIES DE TURNOS
+
+    async def agendar_serie(self, serie: SerieTurnos, atomica: bool = True) -> list[ResultadoOperacion]:
+        return await self._ejecutar(self.__clinica.agendar_serie, serie, atomica)
+
+    async def materializar_series(self, hasta: datetime) -> int:
+        return await self._ejecutar(self.__clinica.materializar_series, hasta)
+
+# RECETAS E HISTORIAS
+
+    async def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]) -> str:
+        return await self._ejecutar(self.__clinica.emitir_receta, dni, matricula, medicamentos)
+
+    async def obtener_historia_clinica_por_DNI(self, dni: str) -> HistoriaClinica | None:
+        return await self._ejecutar(self.__clinica.obtener_historia_clinica_por_DNI, dni)
+
+# OBTENER
+
+    async def obtener_pacientes(self) -> list[Paciente]:
+        return await self._ejecutar(self.__clinica.obtener_pacientes)
+
+    async def obtener_medicos(self) -> list[Medico]:
+        return await self._ejecutar(self.__clinica.obtener_medicos)
+
+    async def obtener_turnos(self) -> list[Turno]:
+        return await self._ejecutar(self.__clinica.obtener_turnos)
+
+    async def obtener_turnos_por_dni(self, dni: str) -> list[Turno]:
+        return await self._ejecutar(self.__clinica.obtener_turnos_por_dni, dni)
+
+    async def obtener_turnos_por_fecha(self, dia: date) -> list[Turno]:
+        return await self._ejecutar(self.__clinica.obtener_turnos_por_fecha, dia)
+
+    async def buscar_turnos_libres(self, especialidad: str, desde: datetime, hasta: datetime, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, cantidad: int = 1, hora_inicio: time = time(8, 0), hora_fin: time = time(18, 0)) -> list[tuple[datetime, Medico]]:
+        return await self._ejecutar(self.__clinica.buscar_turnos_libres, especialidad, desde, hasta, duracion, cantidad, hora_inicio, hora_fin)
+
+    async def buscar_pacientes(self, texto: str, cantidad: int = TAMANO_PAGINA, aproximado: bool = True) -> list[Paciente]:
+        return await self._ejecutar(self.__clinica.buscar_pacientes, texto, cantidad, aproximado)
+
+# PAGINAS (LOS GENERADORES iterar_* NO SE EXPONEN: CADA PAGINA ES UNA SOLA LLAMADA AL EJECUTOR)
+
+    async def paginar_pacientes(self, cursor: str | None = None, tamano: int = TAMANO_PAGINA, prefijo_nombre: str | None = None) -> Pagina:
+        return await self._ejecutar(self.__clinica.paginar_pacientes, cursor, tamano, prefijo_nombre)
+
+    async def paginar_medicos(self, cursor: str | None = None, tamano: int = TAMANO_PAGINA, especialidad: str | None = None, prefijo_nombre: str | None = None) -> Pagina:
+        return await self._ejecutar(self.__clinica.paginar_medicos, cursor, tamano, especialidad, prefijo_nombre)
+
+    async def paginar_turnos(self, cursor: tuple[datetime, str] | None = None, tamano: int = TAMANO_PAGINA, desde: date | None = None, hasta: date | None = None, matricula: str | None = None, especialidad: str | None = None) -> Pagina:
+        return await self._ejecutar(self.__clinica.paginar_turnos, cursor, tamano, desde, hasta, matricula, especialidad)
+
+# CERRAR
+
+    def cerrar(self) -> None:
+        # SOLO SE APAGA EL EJECUTOR SI LO CREO ESTA FACHADA
+        if self.__ejecutor_propio:
+            self.__ejecutor.shutdown(wait=True)
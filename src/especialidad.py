@@ -1,16 +1,52 @@
+import sys
+
+DIAS_SEMANA = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+
+# NOMBRE DEL DIA (CON Y SIN TILDE) -> NUMERO DE DIA COMO EN datetime.weekday()
+_NUMERO_DIA = {dia: numero for numero, dia in enumerate(DIAS_SEMANA)}
+_NUMERO_DIA.update({"miercoles": 2, "sabado": 5})
+
+# LAS LISTAS DE DIAS IGUALES SE COMPARTEN ENTRE TODAS LAS ESPECIALIDADES
+_DIAS_COMPARTIDOS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+def numero_de_dia(dia: str) -> int | None:
+    numero = _NUMERO_DIA.get(dia)
+    if numero is None:
+        numero = _NUMERO_DIA.get(dia.lower())
+    return numero
 
 class Especialidad:
-    
+
+    __slots__ = ("__tipo", "__dias", "__mascara")
+
     def __init__(self, tipo: str, dias: list[str]):
-        self.__tipo = tipo
-        self.__dias = [d.lower() for d in dias]
+        self.__tipo = sys.intern(tipo)
+        dias_normalizados = tuple(sys.intern(d.lower()) for d in dias)
+        self.__dias = _DIAS_COMPARTIDOS.setdefault(dias_normalizados, dias_normalizados)
+
+        # UN BIT POR DIA DE LA SEMANA (BIT 0 = LUNES)
+        mascara = 0
+        for dia in self.__dias:
+            numero = _NUMERO_DIA.get(dia)
+            if numero is not None:
+                mascara |= 1 << numero
+        self.__mascara = mascara
 
     def verificar_dia(self, dia: str) -> bool:
-        dia = dia.lower()
-        return dia in self.__dias
+        numero = numero_de_dia(dia)
+        if numero is not None:
+            return bool(self.__mascara >> numero & 1)
+        # NOMBRES QUE NO SON DIAS DE LA SEMANA SE COMPARAN COMO TEXTO
+        return dia.lower() in self.__dias
 
     def obtener_especialidad(self):
         return self.__tipo
 
+    def obtener_dias(self) -> tuple[str, ...]:
+        return self.__dias
+
+    def obtener_mascara(self) -> int:
+        return self.__mascara
+
     def __str__(self) -> str:
-        return f"Tipo de especialidad: {self.__tipo}, Días: {self.__dias}"
\ No newline at end of file
+        return f"Tipo de especialidad: {self.__tipo}, Días: {list(self.__dias)}"
@@ -0,0 +1,46 @@
+import logging
+from abc import ABC, abstractmethod
+from src.resultado import ResultadoOperacion
+
+class RegistroEventos(ABC):
+
+    @abstractmethod
+    def registrar(self, resultado: ResultadoOperacion) -> None:
+        ...
+
+class RegistroConsola(RegistroEventos):
+
+    def registrar(self, resultado: ResultadoOperacion) -> None:
+        print(resultado.obtener_mensaje())
+
+class RegistroNulo(RegistroEventos):
+
+    def registrar(self, resultado: ResultadoOperacion) -> None:
+        pass
+
+class RegistroBuffer(RegistroEventos):
+
+    def __init__(self):
+        self.__eventos: list[ResultadoOperacion] = []
+
+    def registrar(self, resultado: ResultadoOperacion) -> None:
+        self.__eventos.append(resultado)
+
+    def obtener_eventos(self) -> list[ResultadoOperacion]:
+        return self.__eventos.copy()
+
+    def vaciar(self) -> list[ResultadoOperacion]:
+        eventos = self.__eventos
+        self.__eventos = []
+        return eventos
+
+class RegistroLogging(RegistroEventos):
+
+    def __init__(self, logger: logging.Logger | None = None):
+        self.__logger = logger or logging.getLogger("clinica")
+
+    def registrar(self, resultado: ResultadoOperacion) -> None:
+        if resultado.obtener_exito():
+            self.__logger.info(resultado.obtener_mensaje())
+        else:
+            self.__logger.warning("%s (%s)", resultado.obtener_mensaje(), resultado.obtener_motivo())
@@ -40,4 +40,8 @@ class TurnoOcupadoException(ClinicaException):
 
 class RecetaInvalidaException(ClinicaException):
     """Excepción receta inválida"""
-    pass
\ No newline at end of file
+    pass
+
+class SnapshotInvalidoException(ClinicaException):
+    """Excepción snapshot inválido o de versión desconocida"""
+    pass
@@ -1,13 +1,25 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterator
 from src.turno import Turno
 from src.paciente import Paciente
 from src.receta import Receta
+from src.renderizado import texto_paciente, linea_turno, linea_receta
+
+TAMANO_PAGINA_HISTORIA = 10
 
 class HistoriaClinica:
 
+    # TURNOS Y RECETAS ORDENADOS POR FECHA, CON LAS FECHAS EN UNA LISTA PARALELA PARA BISECT.
+    # CASI TODO LLEGA EN ORDEN CRONOLOGICO, ASI QUE AGREGAR SUELE SER UN append
+    __slots__ = ("__paciente", "__turnos", "__fechas_turnos", "__recetas", "__fechas_recetas")
+
     def __init__(self, paciente: Paciente):
         self.__paciente = paciente
-        self.__turnos = []
-        self.__recetas = []
+        self.__turnos: list[Turno] = []
+        self.__fechas_turnos: list[datetime] = []
+        self.__recetas: list[Receta] = []
+        self.__fechas_recetas: list[datetime] = []
 
 # OBTENER
 
@@ -17,21 +29,118 @@ class HistoriaClinica:
     def obtener_recetas(self) -> list[Receta]:
         return self.__recetas.copy()
 
+    # RECORRIDOS SIN COPIA: LO QUE SE AGREGUE MIENTRAS TANTO TAMBIEN APARECE AL FINAL
+    def iterar_turnos(self) -> Iterator[Turno]:
+        return iter(self.__turnos)
+
+    def iterar_recetas(self) -> Iterator[Receta]:
+        return iter(self.__recetas)
+
+    # RANGOS [desde, hasta) EN ORDEN CRONOLOGICO: DOS BISECT Y UN SLICE, SIN RECORRER LA HISTORIA
+    def obtener_turnos_entre(self, desde: datetime, hasta: datetime) -> list[Turno]:
+        return self.__turnos[bisect_left(self.__fechas_turnos, desde):bisect_left(self.__fechas_turnos, hasta)]
+
+    def obtener_recetas_entre(self, desde: datetime, hasta: datetime) -> list[Receta]:
+        return self.__recetas[bisect_left(self.__fechas_recetas, desde):bisect_left(self.__fechas_recetas, hasta)]
+
+    # LOS cantidad MAS RECIENTES, DEL MAS NUEVO AL MAS VIEJO
+    def obtener_ultimos_turnos(self, cantidad: int) -> list[Turno]:
+        return self.__turnos[:-cantidad - 1:-1] if cantidad > 0 else []
+
+    def obtener_ultimas_recetas(self, cantidad: int) -> list[Receta]:
+        return self.__recetas[:-cantidad - 1:-1] if cantidad > 0 else []
+
+    def cantidad_turnos(self) -> int:
+        return len(self.__turnos)
+
+    def cantidad_recetas(self) -> int:
+        return len(self.__recetas)
+
 # AGREGAR
 
     def agregar_turno(self, turno: Turno) -> None:
-        self.__turnos.append(turno)
+        self._insertar(self.__turnos, self.__fechas_turnos, turno, turno.obtener_fecha_hora())
 
     def agregar_receta(self, receta: Receta) -> None:
-        self.__recetas.append(receta)
+        self._insertar(self.__recetas, self.__fechas_recetas, receta, receta.obtener_fecha())
+
+    @staticmethod
+    def _insertar(elementos: list, fechas: list[datetime], elemento, fecha: datetime) -> None:
+        if not fechas or fechas[-1] <= fecha:
+            elementos.append(elemento)
+            fechas.append(fecha)
+            return
+        # MISMA FECHA: QUEDA DESPUES DE LOS YA REGISTRADOS (ORDEN DE LLEGADA)
+        i = bisect_right(fechas, fecha)
+        elementos.insert(i, elemento)
+        fechas.insert(i, fecha)
+
+# QUITAR
+
+    def quitar_turno(self, turno: Turno) -> bool:
+        fechas = self.__fechas_turnos
+        i = bisect_left(fechas, turno.obtener_fecha_hora())
+        while i < len(fechas) and fechas[i] == turno.obtener_fecha_hora():
+            if self.__turnos[i] is turno:
+                del self.__turnos[i]
+                del fechas[i]
+                return True
+            i += 1
+        return False
+
+    def quitar_turno_de(self, matricula: str, fecha_hora: datetime) -> Turno | None:
+        # POR CLAVE Y NO POR IDENTIDAD: LA HISTORIA PUEDE TENER SU PROPIA COPIA (CARGADA DEL REPOSITORIO)
+        fechas = self.__fechas_turnos
+        i = bisect_left(fechas, fecha_hora)
+        while i < len(fechas) and fechas[i] == fecha_hora:
+            turno = self.__turnos[i]
+            if turno.obtener_medico().obtener_matricula() == matricula:
+                del self.__turnos[i]
+                del fechas[i]
+                return turno
+            i += 1
+        return None
+
+# MOSTRAR
+
+    def cantidad_paginas(self, tamano: int = TAMANO_PAGINA_HISTORIA) -> int:
+        return max(1, -(-max(len(self.__turnos), len(self.__recetas)) // tamano))
+
+    def renderizar(self, pagina: int = 1, tamano: int = TAMANO_PAGINA_HISTORIA) -> str:
+        # UNA PAGINA (1 = LO MAS RECIENTE) CON UNA LINEA POR TURNO O RECETA: EL COSTO DEPENDE
+        # DEL TAMANO DE LA PAGINA Y NO DE TODO LO QUE EL PACIENTE ACUMULO
+        turnos = self._pagina(self.__turnos, pagina, tamano)
+        recetas = self._pagina(self.__recetas, pagina, tamano)
+        firmas = {}
+        turnos_str = "\n    ".join(linea_turno(t, con_paciente=False, firmas=firmas) for t in turnos) or "Sin turnos registrados"
+        recetas_str = "\n    ".join(linea_receta(r, con_paciente=False, firmas=firmas) for r in recetas) or "Sin recetas registradas"
+
+        return (
+            f"HistoriaClinica(\n"
+            f"  Paciente: {texto_paciente(self.__paciente)},\n"
+            f"  Turnos ({len(self.__turnos)}):\n    {turnos_str},\n"
+            f"  Recetas ({len(self.__recetas)}):\n    {recetas_str}\n"
+            f"  Página {pagina} de {self.cantidad_paginas(tamano)}\n"
+            f")"
+        )
+
+    @staticmethod
+    def _pagina(elementos: list, pagina: int, tamano: int) -> list:
+        if pagina < 1 or tamano < 1:
+            raise ValueError("La página y su tamaño deben ser positivos.")
+        fin = len(elementos) - (pagina - 1) * tamano
+        if fin <= 0:
+            return []
+        return elementos[max(fin - tamano, 0):fin][::-1]
 
     def __str__(self) -> str:
+        # LA HISTORIA COMPLETA EN ORDEN CRONOLOGICO; LA VISTA POR PAGINAS ES renderizar
         turnos_str = "\n    ".join(str(t) for t in self.__turnos) or "Sin turnos registrados"
         recetas_str = "\n    ".join(str(r) for r in self.__recetas) or "Sin recetas registradas"
 
         return (
             f"HistoriaClinica(\n"
-            f"  Paciente: {self.__paciente},\n"
+            f"  Paciente: {texto_paciente(self.__paciente)},\n"
             f"  Turnos:\n    {turnos_str},\n"
             f"  Recetas:\n    {recetas_str}\n"
             f")"
@@ -0,0 +1,204 @@
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterator
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.excepciones import ClinicaException
+from src.resultado import DATO_INVALIDO, DUPLICADO_EN_LOTE
+
+# FORMATOS DE ENTRADA (UN REGISTRO POR LINEA):
+#   PACIENTES  CSV:   nombre,dni,fecha_de_nacimiento
+#              JSONL: {"nombre": ..., "dni": ..., "fecha_de_nacimiento": ...}
+#   MEDICOS    CSV:   nombre,matricula,especialidades   (ej: "cardiologia:lunes|miercoles;pediatria:martes")
+#              JSONL: {"nombre": ..., "matricula": ..., "especialidades": [{"tipo": ..., "dias": [...]}]}
+# EL ARCHIVO DE RECHAZOS ES UN CSV: linea,identificador,motivo,detalle
+
+TAMANO_LOTE = 5000
+
+class ResumenImportacion:
+
+    def __init__(self, importados: int, rechazados: int, ruta_rechazos: str):
+        self.__importados = importados
+        self.__rechazados = rechazados
+        self.__ruta_rechazos = ruta_rechazos
+
+    def obtener_importados(self) -> int:
+        return self.__importados
+
+    def obtener_rechazados(self) -> int:
+        return self.__rechazados
+
+    def obtener_ruta_rechazos(self) -> str:
+        return self.__ruta_rechazos
+
+    def __str__(self) -> str:
+        return f"{self.__importados} registros importados, {self.__rechazados} rechazados (ver {self.__ruta_rechazos})"
+
+# LECTURA
+
+def _leer_registros(ruta: str) -> Iterator[tuple[int, dict | str]]:
+    # (NUMERO DE LINEA, REGISTRO). LAS LINEAS JSON VIAJAN COMO TEXTO: LAS DECODIFICA CADA PROCESO
+    if ruta.endswith(".csv"):
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            lector = csv.DictReader(archivo)
+            for registro in lector:
+                yield lector.line_num, registro
+    else:
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea, texto in enumerate(archivo, 1):
+                if texto.strip():
+                    yield linea, texto
+
+def _decodificar(registro: dict | str) -> dict | None:
+    if isinstance(registro, dict):
+        return registro
+    try:
+        registro = json.loads(registro)
+    except ValueError:
+        return None
+    return registro if isinstance(registro, dict) else None
+
+def _en_lotes(registros: Iterator, tamano: int) -> Iterator[list]:
+    while True:
+        lote = list(islice(registros, tamano))
+        if not lote:
+            return
+        yield lote
+
+# VALIDACION (CORRE EN LOS PROCESOS DEL POOL: SOLO RECIBE Y DEVUELVE TUPLAS Y TEXTO)
+
+def _validar_pacientes(lote: list[tuple[int, dict | str]]) -> tuple[list[tuple], list[tuple]]:
+    validos = []
+    rechazos = []
+    for linea, crudo in lote:
+        registro = _decodificar(crudo)
+        if registro is None:
+            rechazos.append((linea, "", DATO_INVALIDO, "Registro ilegible"))
+            continue
+        dni = str(registro.get("dni") or "")
+        try:
+            paciente = Paciente(str(registro.get("nombre") or ""), dni, str(registro.get("fecha_de_nacimiento") or ""))
+        except ClinicaException as error:
+            rechazos.append((linea, dni, DATO_INVALIDO, str(error)))
+            continue
+        validos.append((linea, paciente.obtener_nombre(), paciente.obtener_dni(), paciente.obtener_fecha_de_nacimiento()))
+    return validos, rechazos
+
+def _validar_medicos(lote: list[tuple[int, dict | str]]) -> tuple[list[tuple], list[tuple]]:
+    validos = []
+    rechazos = []
+    for linea, crudo in lote:
+        registro = _decodificar(crudo)
+        if registro is None:
+            rechazos.append((linea, "", DATO_INVALIDO, "Registro ilegible"))
+            continue
+        matricula = str(registro.get("matricula") or "")
+        try:
+            especialidades = _leer_especialidades(registro.get("especialidades"))
+            if not especialidades:
+                raise ClinicaException("El médico debe tener al menos una especialidad")
+            medico = Medico(str(registro.get("nombre") or "").strip(), matricula, [Especialidad(tipo, dias) for tipo, dias in especialidades])
+        except (ClinicaException, ValueError, TypeError) as error:
+            rechazos.append((linea, matricula, DATO_INVALIDO, str(error)))
+            continue
+        validos.append((linea, medico.obtener_nombre(), medico.obtener_matricula(), [(e.obtener_especialidad(), e.obtener_dias()) for e in medico.obtener_especialidades()]))
+    return validos, rechazos
+
+def _leer_especialidades(valor) -> list[tuple[str, list[str]]]:
+    if isinstance(valor, list):
+        # JSON: CADA ESPECIALIDAD ES {"tipo": ..., "dias": [...]}. UNA MAL FORMADA RECHAZA SOLO ESA FILA
+        especialidades = []
+        for especialidad in valor:
+            if not isinstance(especialidad, dict) or "tipo" not in especialidad or not isinstance(especialidad.get("dias"), list):
+                raise ValueError(f"Especialidad mal formada: {especialidad}")
+            especialidades.append((str(especialidad["tipo"]).strip(), [str(d).strip() for d in especialidad["dias"]]))
+        return especialidades
+    especialidades = []
+    for parte in str(valor or "").split(";"):
+        if not parte.strip():
+            continue
+        tipo, separador, dias = parte.partition(":")
+        if not separador or not tipo.strip():
+            raise ValueError(f"Especialidad mal formada: {parte.strip()}")
+        especialidades.append((tipo.strip(), [d.strip() for d in dias.split("|") if d.strip()]))
+    return especialidades
+
+# IMPORTAR
+
+def importar_pacientes(clinica: Clinica, ruta: str, ruta_rechazos: str | None = None, procesos: int | None = None, tamano_lote: int = TAMANO_LOTE) -> ResumenImportacion:
+    return _importar(
+        clinica, ruta, ruta_rechazos, procesos, tamano_lote, _validar_pacientes,
+        lambda nombre, dni, fecha: Paciente._desde_datos_validados(nombre, dni, fecha),
+        clinica.agregar_pacientes_lote
+    )
+
+def importar_medicos(clinica: Clinica, ruta: str, ruta_rechazos: str | None = None, procesos: int | None = None, tamano_lote: int = TAMANO_LOTE) -> ResumenImportacion:
+    return _importar(
+        clinica, ruta, ruta_rechazos, procesos, tamano_lote, _validar_medicos,
+        lambda nombre, matricula, especialidades: Medico._desde_datos_validados(nombre, matricula, [Especialidad(tipo, list(dias)) for tipo, dias in especialidades]),
+        clinica.agregar_medicos_lote
+    )
+
+def _importar(clinica: Clinica, ruta: str, ruta_rechazos: str | None, procesos: int | None, tamano_lote: int, validar: Callable, construir: Callable, agregar_lote: Callable) -> ResumenImportacion:
+    ruta_rechazos = ruta_rechazos or f"{ruta}.rechazos.csv"
+    lotes = _en_lotes(_leer_registros(ruta), tamano_lote)
+
+    lineas = []
+    objetos = []
+    vistos = set()
+    rechazos = []
+    for validos, rechazados in _validar_en_paralelo(lotes, validar, procesos):
+        rechazos.extend(rechazados)
+        for linea, *datos in validos:
+            # datos[1] ES EL DNI O LA MATRICULA YA NORMALIZADOS
+            if datos[1] in vistos:
+                rechazos.append((linea, datos[1], DUPLICADO_EN_LOTE, "Repetido dentro del archivo"))
+                continue
+            vistos.add(datos[1])
+            lineas.append(linea)
+            objetos.append(construir(*datos))
+
+    # UNA SOLA ALTA MASIVA AL FINAL; LO YA REGISTRADO EN LA CLINICA TAMBIEN VA A RECHAZOS
+    importados = 0
+    for linea, objeto, resultado in zip(lineas, objetos, agregar_lote(objetos)):
+        if resultado:
+            importados += 1
+        else:
+            identificador = objeto.obtener_dni() if isinstance(objeto, Paciente) else objeto.obtener_matricula()
+            rechazos.append((linea, identificador, resultado.obtener_motivo(), resultado.obtener_mensaje()))
+
+    rechazos.sort()
+    with open(ruta_rechazos, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(("linea", "identificador", "motivo", "detalle"))
+        escritor.writerows(rechazos)
+
+    return ResumenImportacion(importados, len(rechazos), ruta_rechazos)
+
+def _validar_en_paralelo(lotes: Iterator[list], validar: Callable, procesos: int | None) -> Iterator[tuple[list, list]]:
+    # procesos=1 VALIDA EN ESTE PROCESO (ARCHIVOS CHICOS, ENTORNOS SIN fork)
+    if procesos == 1:
+        for lote in lotes:
+            yield validar(lote)
+        return
+
+    cantidad = procesos or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=cantidad) as ejecutor:
+        yield from _ventana(ejecutor, lotes, validar, cantidad * 2)
+
+def _ventana(ejecutor: Executor, lotes: Iterator[list], validar: Callable, en_vuelo: int) -> Iterator[tuple[list, list]]:
+    # A LO SUMO en_vuelo LOTES PENDIENTES: EL ARCHIVO SE LEE A MEDIDA QUE LOS PROCESOS AVANZAN
+    # Y LOS RESULTADOS SALEN EN EL ORDEN DEL ARCHIVO
+    pendientes = deque()
+    for lote in lotes:
+        pendientes.append(ejecutor.submit(validar, lote))
+        if len(pendientes) >= en_vuelo:
+            yield pendientes.popleft().result()
+    while pendientes:
+        yield pendientes.popleft().result()
@@ -0,0 +1,185 @@
+import heapq
+import sys
+import threading
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from itertools import takewhile
+from typing import Iterable, Iterator
+from src.paginacion import IndiceOrdenado
+
+SEPARADOR = "\0"
+# MAYOR QUE CUALQUIER CARACTER DE UN NOMBRE: prefijo + FIN ACOTA TODAS LAS CLAVES QUE EMPIEZAN CON prefijo
+FIN = "\U0010ffff"
+
+def plegar(texto: str) -> str:
+    # SIN ACENTOS NI MAYUSCULAS: "Pérez" Y "PEREZ" SE INDEXAN IGUAL
+    if texto.isascii():
+        return texto.lower()
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+@lru_cache(maxsize=65536)
+def _plegar_palabra(palabra: str) -> str:
+    # LOS NOMBRES Y APELLIDOS SE REPITEN MUCHO: CADA PALABRA DISTINTA SE PLIEGA UNA VEZ
+    return sys.intern(plegar(palabra))
+
+def palabras(texto: str) -> list[str]:
+    return list(map(_plegar_palabra, texto.replace(",", " ").replace(".", " ").split()))
+
+def trigramas(palabra: str) -> set[str]:
+    # CON BORDES: LAS PALABRAS CORTAS TAMBIEN TIENEN TRIGRAMAS Y EL INICIO PESA MAS
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+def distancia_edicion(a: str, b: str, maxima: int) -> int:
+    # LEVENSHTEIN CON CORTE: DEVUELVE maxima + 1 APENAS SE SABE QUE LA SUPERA
+    if abs(len(a) - len(b)) > maxima:
+        return maxima + 1
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        actual = [i]
+        for j, cb in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (ca != cb)))
+        if min(actual) > maxima:
+            return maxima + 1
+        anterior = actual
+    return anterior[-1]
+
+class IndiceNombres:
+
+    # DOS ESTRUCTURAS:
+    # - CLAVES "palabra\0dni" ORDENADAS: UN PREFIJO ES UN BISECT MAS UN RECORRIDO CONTIGUO
+    # - TRIGRAMAS SOBRE EL VOCABULARIO (PALABRAS DISTINTAS, NO PACIENTES): LA BUSQUEDA
+    #   APROXIMADA CUESTA SEGUN LA CANTIDAD DE APELLIDOS Y NOMBRES DISTINTOS, NO DE PACIENTES
+    def __init__(self):
+        self.__claves = IndiceOrdenado()
+        self.__palabras_por_dni: dict[str, tuple[str, ...]] = {}
+        # PACIENTES POR PALABRA DEL VOCABULARIO (PARA EMPEZAR POR LA PALABRA MAS SELECTIVA)
+        self.__frecuencias: Counter[str] = Counter()
+        self.__trigramas: dict[str, set[str]] = {}
+        self.__cerrojo = threading.Lock()
+
+# AGREGAR
+
+    def agregar(self, dni: str, nombre: str) -> None:
+        self.agregar_lote([(dni, nombre)])
+
+    def agregar_lote(self, pacientes: Iterable[tuple[str, str]]) -> None:
+        # (dni, nombre). LAS CLAVES NUEVAS SE INSERTAN YA EN SU LUGAR: UNA BUSQUEDA POSTERIOR NO REORDENA NADA
+        claves = []
+        with self.__cerrojo:
+            for dni, nombre in pacientes:
+                if dni in self.__palabras_por_dni:
+                    continue
+                propias = tuple(dict.fromkeys(palabras(nombre)))
+                self.__palabras_por_dni[dni] = propias
+                for palabra in propias:
+                    if palabra not in self.__frecuencias:
+                        for trigrama in trigramas(palabra):
+                            self.__trigramas.setdefault(trigrama, set()).add(palabra)
+                    self.__frecuencias[palabra] += 1
+                    claves.append(palabra + SEPARADOR + dni)
+            self.__claves.agregar_varias(claves)
+
+# BUSCAR
+
+    def buscar_prefijo(self, texto: str, cantidad: int = 20) -> list[str]:
+        # CADA PALABRA DE LA CONSULTA DEBE SER PREFIJO DE ALGUNA PALABRA DEL NOMBRE.
+        # SE RECORRE LA DE MENOS CLAVES (CONTADAS POR BISECT) Y EL RESTO SE VERIFICA POR PACIENTE
+        consulta = palabras(texto)
+        if not consulta or cantidad < 1:
+            return []
+        guia = min(consulta, key=lambda p: self.__claves.contar_entre(p, p + FIN))
+        resto = [p for p in consulta if p is not guia]
+
+        encontrados = []
+        vistos = set()
+        for dni in self._dnis_con_prefijo(guia):
+            if dni in vistos or (resto and not self._tiene_prefijos(dni, resto)):
+                continue
+            vistos.add(dni)
+            encontrados.append(dni)
+            if len(encontrados) == cantidad:
+                break
+        return encontrados
+
+    def buscar_aproximado(self, texto: str, cantidad: int = 20) -> list[str]:
+        # TOLERA ERRORES DE TIPEO: 1 EDICION EN PALABRAS DE HASTA 5 LETRAS, 2 EN LAS MAS LARGAS.
+        # LOS PACIENTES SALEN ORDENADOS POR LA SUMA DE LAS DISTANCIAS DE SUS PALABRAS
+        consulta = palabras(texto)
+        if not consulta or cantidad < 1:
+            return []
+
+        parecidas_por_palabra = [self._parecidas(palabra) for palabra in consulta]
+        if not all(parecidas_por_palabra):
+            return []
+        # LA PALABRA CON MENOS PACIENTES ARMA LOS CANDIDATOS; LAS DEMAS SE BUSCAN ENTRE LAS PALABRAS DE CADA UNO
+        guia, *resto = sorted(parecidas_por_palabra, key=lambda parecidas: sum(self.__frecuencias[p] for p in parecidas))
+
+        # POR NIVEL DE DISTANCIA DE LA GUIA: UN CANDIDATO DEL NIVEL d SUMA AL MENOS d, ASI QUE APENAS HAY
+        # cantidad CON PUNTAJE <= d (O <= d + 1 AL CERRAR EL NIVEL) NINGUNO POSTERIOR PUEDE SUPERARLOS
+        resultados: list[tuple[int, str]] = []
+        vistos = set()
+        for nivel in sorted(set(guia.values())):
+            en_nivel = 0
+            for parecida in [p for p, distancia in guia.items() if distancia == nivel]:
+                for dni in self._dnis_con_palabra(parecida):
+                    if dni in vistos:
+                        continue
+                    vistos.add(dni)
+                    puntaje = self._puntaje(dni, nivel, resto)
+                    if puntaje is None:
+                        continue
+                    resultados.append((puntaje, dni))
+                    if puntaje == nivel:
+                        en_nivel += 1
+                        if en_nivel >= cantidad:
+                            return [dni for _, dni in heapq.nsmallest(cantidad, resultados)]
+            if sum(1 for p, _ in resultados if p <= nivel + 1) >= cantidad:
+                break
+        return [dni for _, dni in heapq.nsmallest(cantidad, resultados)]
+
+    def _puntaje(self, dni: str, puntaje: int, resto: list[dict[str, int]]) -> int | None:
+        propias = self.__palabras_por_dni[dni]
+        for parecidas in resto:
+            distancias = [parecidas[p] for p in propias if p in parecidas]
+            if not distancias:
+                return None
+            puntaje += min(distancias)
+        return puntaje
+
+    def _parecidas(self, palabra: str) -> dict[str, int]:
+        maxima = 1 if len(palabra) <= 5 else 2
+        buscados = trigramas(palabra)
+        # CADA EDICION ROMPE A LO SUMO 3 TRIGRAMAS
+        minimo = max(1, len(buscados) - 3 * maxima)
+        with self.__cerrojo:
+            coincidencias = Counter()
+            for trigrama in buscados:
+                coincidencias.update(self.__trigramas.get(trigrama, ()))
+        parecidas = {}
+        for candidata, compartidos in coincidencias.items():
+            if compartidos < minimo:
+                continue
+            distancia = distancia_edicion(palabra, candidata, maxima)
+            if distancia <= maxima:
+                parecidas[candidata] = distancia
+        return parecidas
+
+    def _dnis_con_prefijo(self, prefijo: str) -> Iterator[str]:
+        # NINGUNA CLAVE ES IGUAL AL PREFIJO (TODAS LLEVAN "\0dni"): EL CURSOR EXCLUSIVO NO SALTEA NADA
+        for clave in takewhile(lambda c: c.startswith(prefijo), self.__claves.iterar(prefijo)):
+            yield clave[clave.index(SEPARADOR) + 1:]
+
+    def _dnis_con_palabra(self, palabra: str) -> Iterator[str]:
+        inicio = palabra + SEPARADOR
+        for clave in takewhile(lambda c: c.startswith(inicio), self.__claves.iterar(inicio)):
+            yield clave[len(inicio):]
+
+    def _tiene_prefijos(self, dni: str, prefijos: list[str]) -> bool:
+        propias = self.__palabras_por_dni.get(dni, ())
+        return all(any(p.startswith(prefijo) for p in propias) for prefijo in prefijos)
+
+    def __len__(self) -> int:
+        return len(self.__palabras_por_dni)
@@ -0,0 +1,172 @@
+import threading
+from datetime import datetime, timedelta
+from heapq import heappush, heappop, heapify
+from itertools import count
+from typing import Callable
+from src.turno import DURACION_TURNO_POR_DEFECTO
+
+# MENOR NUMERO, MAS URGENTE. DENTRO DE LA MISMA PRIORIDAD ATIENDE EL QUE ESPERA HACE MAS
+PRIORIDAD_URGENTE = 0
+PRIORIDAD_NORMAL = 1
+
+# LAS SOLICITUDES QUITADAS SE DESCARTAN AL LLEGAR AL TOPE DEL HEAP; SI SE ACUMULAN MAS QUE
+# ESTAS Y MAS QUE LAS ACTIVAS, SE RECONSTRUYEN TODOS LOS HEAPS
+DESCARTADAS_PARA_COMPACTAR = 64
+
+class SolicitudEspera:
+
+    __slots__ = ("__dni", "__especialidad", "__matricula", "__prioridad", "__secuencia", "__duracion", "__desde", "__hasta")
+
+    def __init__(self, dni: str, especialidad: str, matricula: str | None, prioridad: int, secuencia: int, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, desde: datetime | None = None, hasta: datetime | None = None):
+        self.__dni = dni
+        self.__especialidad = especialidad
+        # SIN MATRICULA SIRVE CUALQUIER MEDICO DE LA ESPECIALIDAD
+        self.__matricula = matricula
+        self.__prioridad = prioridad
+        self.__secuencia = secuencia
+        self.__duracion = duracion
+        self.__desde = desde
+        self.__hasta = hasta
+
+# GETTERS
+
+    def obtener_dni(self) -> str:
+        return self.__dni
+
+    def obtener_especialidad(self) -> str:
+        return self.__especialidad
+
+    def obtener_matricula(self) -> str | None:
+        return self.__matricula
+
+    def obtener_prioridad(self) -> int:
+        return self.__prioridad
+
+    def obtener_secuencia(self) -> int:
+        return self.__secuencia
+
+    def obtener_duracion(self) -> timedelta:
+        return self.__duracion
+
+    def obtener_clave(self) -> tuple[str, str, str | None]:
+        # UN PACIENTE ESPERA UNA SOLA VEZ POR ESPECIALIDAD Y MEDICO
+        return (self.__dni, self.__especialidad, self.__matricula)
+
+    def admite(self, fecha_hora: datetime) -> bool:
+        # EL HORARIO CAE EN LA VENTANA QUE ACEPTA EL PACIENTE (AMBOS EXTREMOS INCLUSIVE)
+        return (self.__desde is None or fecha_hora >= self.__desde) and (self.__hasta is None or fecha_hora <= self.__hasta)
+
+    def __str__(self) -> str:
+        medico = self.__matricula if self.__matricula is not None else "cualquier médico"
+        return f"Espera de {self.__especialidad} con {medico} para el DNI {self.__dni} (prioridad {self.__prioridad})"
+
+class ListaEspera:
+
+    # UN HEAP POR (MEDICO, ESPECIALIDAD) Y OTRO POR ESPECIALIDAD PARA QUIEN ACEPTA CUALQUIER MEDICO.
+    # CADA ENTRADA ES (prioridad, secuencia, solicitud): LA SECUENCIA ES UNICA, ASI QUE LA PRIORIDAD
+    # EMPATA POR ORDEN DE LLEGADA (FIFO) Y NUNCA SE COMPARAN SOLICITUDES. QUITAR ES PEREZOSO:
+    # LA SOLICITUD SALE DE activas Y SU ENTRADA SE DESCARTA CUANDO LLEGA AL TOPE
+    def __init__(self):
+        self.__por_medico: dict[tuple[str, str], list[tuple[int, int, SolicitudEspera]]] = {}
+        self.__por_especialidad: dict[str, list[tuple[int, int, SolicitudEspera]]] = {}
+        self.__activas: dict[tuple[str, str, str | None], SolicitudEspera] = {}
+        self.__secuencias = count()
+        self.__descartadas = 0
+        self.__cerrojo = threading.Lock()
+
+# AGREGAR Y QUITAR
+
+    def agregar(self, dni: str, especialidad: str, matricula: str | None = None, prioridad: int = PRIORIDAD_NORMAL, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, desde: datetime | None = None, hasta: datetime | None = None) -> SolicitudEspera | None:
+        # None SI EL PACIENTE YA ESPERA ESA ESPECIALIDAD CON ESE MEDICO
+        with self.__cerrojo:
+            if (dni, especialidad, matricula) in self.__activas:
+                return None
+            solicitud = SolicitudEspera(dni, especialidad, matricula, prioridad, next(self.__secuencias), duracion, desde, hasta)
+            self.__activas[solicitud.obtener_clave()] = solicitud
+            heappush(self._heap_de(solicitud), (prioridad, solicitud.obtener_secuencia(), solicitud))
+        return solicitud
+
+    def quitar(self, solicitud: SolicitudEspera) -> bool:
+        with self.__cerrojo:
+            if self.__activas.get(solicitud.obtener_clave()) is not solicitud:
+                return False
+            del self.__activas[solicitud.obtener_clave()]
+            self.__descartadas += 1
+            if self.__descartadas > DESCARTADAS_PARA_COMPACTAR and self.__descartadas > len(self.__activas):
+                self._compactar()
+        return True
+
+    def _heap_de(self, solicitud: SolicitudEspera) -> list:
+        if solicitud.obtener_matricula() is None:
+            return self.__por_especialidad.setdefault(solicitud.obtener_especialidad(), [])
+        return self.__por_medico.setdefault((solicitud.obtener_matricula(), solicitud.obtener_especialidad()), [])
+
+    def _compactar(self) -> None:
+        # CON EL CERROJO TOMADO: SOLO QUEDAN LAS ENTRADAS ACTIVAS
+        for heaps in (self.__por_medico, self.__por_especialidad):
+            for clave in list(heaps):
+                heap = [entrada for entrada in heaps[clave] if self._activa(entrada[2])]
+                if heap:
+                    heapify(heap)
+                    heaps[clave] = heap
+                else:
+                    del heaps[clave]
+        self.__descartadas = 0
+
+    def _activa(self, solicitud: SolicitudEspera) -> bool:
+        return self.__activas.get(solicitud.obtener_clave()) is solicitud
+
+    def _limpiar_tope(self, heap: list) -> None:
+        while heap and not self._activa(heap[0][2]):
+            heappop(heap)
+            self.__descartadas -= 1
+
+# ASIGNAR
+
+    def tomar(self, matricula: str, especialidad: str, fecha_hora: datetime, acepta: Callable[[SolicitudEspera], bool]) -> SolicitudEspera | None:
+        # LA PRIMERA SOLICITUD (PRIORIDAD, LUEGO ANTIGUEDAD) ENTRE LAS DE ESE MEDICO Y LAS DE CUALQUIER
+        # MEDICO DE LA ESPECIALIDAD QUE ADMITA EL HORARIO Y QUE acepta APRUEBE. SE COMPARAN LOS TOPES
+        # DE LOS DOS HEAPS: O(log n) POR CANDIDATA REVISADA. LAS QUE NO SIRVEN VUELVEN A SU HEAP.
+        # acepta CORRE CON EL CERROJO DE LA LISTA TOMADO: NO DEBE USAR LA LISTA
+        with self.__cerrojo:
+            del_medico = self.__por_medico.get((matricula, especialidad), [])
+            de_especialidad = self.__por_especialidad.get(especialidad, [])
+            apartadas = []
+            elegida = None
+            while True:
+                self._limpiar_tope(del_medico)
+                self._limpiar_tope(de_especialidad)
+                if not del_medico and not de_especialidad:
+                    break
+                if not de_especialidad or (del_medico and del_medico[0][:2] < de_especialidad[0][:2]):
+                    heap = del_medico
+                else:
+                    heap = de_especialidad
+                entrada = heappop(heap)
+                solicitud = entrada[2]
+                if solicitud.admite(fecha_hora) and acepta(solicitud):
+                    del self.__activas[solicitud.obtener_clave()]
+                    elegida = solicitud
+                    break
+                apartadas.append((heap, entrada))
+            for heap, entrada in apartadas:
+                heappush(heap, entrada)
+        return elegida
+
+# CONSULTAR
+
+    def contiene(self, dni: str, especialidad: str, matricula: str | None = None) -> bool:
+        return (dni, especialidad, matricula) in self.__activas
+
+    def obtener_solicitudes(self, especialidad: str | None = None, dni: str | None = None) -> list[SolicitudEspera]:
+        # EN EL ORDEN EN QUE SE ASIGNARIAN (SIN DISTINGUIR MEDICO)
+        with self.__cerrojo:
+            solicitudes = [
+                s for s in self.__activas.values()
+                if (especialidad is None or s.obtener_especialidad() == especialidad) and (dni is None or s.obtener_dni() == dni)
+            ]
+        solicitudes.sort(key=lambda s: (s.obtener_prioridad(), s.obtener_secuencia()))
+        return solicitudes
+
+    def __len__(self) -> int:
+        return len(self.__activas)
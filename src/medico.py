@@ -1,16 +1,35 @@
-from src.especialidad import Especialidad
-import re
+from src.especialidad import Especialidad, DIAS_SEMANA, numero_de_dia
+from types import MappingProxyType
+from typing import Mapping
+import sys
 from src.excepciones import (
     MedicoInvalidoException,
     MatriculaInvalidaException
 )
+from src.validaciones import normalizar_matricula
+from src.renderizado import texto_medico
+
+_SIN_DIAS_EXTRA: Mapping[str, str] = MappingProxyType({})
 
 class Medico:
+
+    __slots__ = ("__nombre", "__matricula", "__especialidades", "__por_dia", "__dias_extra", "__agenda_semanal", "__nombres_especialidades")
     
     def __init__(self, nombre: str, matricula: str, especialidades: list[Especialidad]):
         self.__nombre = nombre
-        self.__matricula = self._validar_matricula(matricula)
+        self.__matricula = sys.intern(self._validar_matricula(matricula))
         self.__especialidades = especialidades.copy()
+        self._reconstruir_agenda_semanal()
+
+    @classmethod
+    def _desde_datos_validados(cls, nombre: str, matricula: str, especialidades: list[Especialidad]) -> "Medico":
+        # RECONSTRUYE UN MEDICO YA VALIDADO (SNAPSHOTS) SIN VOLVER A VALIDAR
+        medico = cls.__new__(cls)
+        medico.__nombre = nombre
+        medico.__matricula = sys.intern(matricula)
+        medico.__especialidades = list(especialidades)
+        medico._reconstruir_agenda_semanal()
+        return medico
 
 # GETTERS
 
@@ -24,29 +43,47 @@ class Medico:
         return self.__especialidades.copy()
     
     def obtener_especialidad_para_dia(self, dia: str) -> str | None:
-        for especialidad in self.__especialidades:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-        return None
+        numero = numero_de_dia(dia)
+        if numero is not None:
+            return self.__por_dia[numero]
+        return self.__dias_extra.get(dia.lower())
+
+    def obtener_agenda_semanal(self) -> Mapping[str, str]:
+        # VISTA DE SOLO LECTURA ARMADA AL CAMBIAR LAS ESPECIALIDADES, NO EN CADA CONSULTA
+        return self.__agenda_semanal
+
+    def atiende_especialidad(self, especialidad: str) -> bool:
+        return especialidad in self.__nombres_especialidades
     
 # AGREGAR
     
     def agregar_especialidad(self, especialidad: Especialidad) -> None:
         if especialidad not in self.__especialidades:
             self.__especialidades.append(especialidad)
+            self._reconstruir_agenda_semanal()
 
-    def _validar_matricula(self, matricula: str) -> str:
+    def _reconstruir_agenda_semanal(self) -> None:
+        # NUMERO DE DIA -> ESPECIALIDAD (LA PRIMERA QUE ATIENDE ESE DIA, COMO EN EL RECORRIDO ORIGINAL)
+        por_dia: list[str | None] = [None] * 7
+        dias_extra: dict[str, str] = {}
+        for especialidad in self.__especialidades:
+            tipo = especialidad.obtener_especialidad()
+            for dia in especialidad.obtener_dias():
+                numero = numero_de_dia(dia)
+                if numero is None:
+                    dias_extra.setdefault(dia, tipo)
+                elif por_dia[numero] is None:
+                    por_dia[numero] = tipo
 
-        if not matricula:
-            raise MatriculaInvalidaException("La matrícula no puede estar vacía")
-        
-        matricula_limpia = matricula.strip().upper()
-        patron_matricula = r'^M[NP]\d{4,6}$'
-        
-        if not re.match(patron_matricula, matricula_limpia):
-            raise MatriculaInvalidaException("Matrícula inválida. Formato: MN##### o MP##### (4-6 dígitos)")
-        
-        return matricula_limpia
+        self.__por_dia = tuple(por_dia)
+        self.__nombres_especialidades = frozenset(e.obtener_especialidad() for e in self.__especialidades)
+        self.__dias_extra = MappingProxyType(dias_extra) if dias_extra else _SIN_DIAS_EXTRA
+        agenda = {DIAS_SEMANA[numero]: especialidad for numero, especialidad in enumerate(por_dia) if especialidad is not None}
+        agenda.update(dias_extra)
+        self.__agenda_semanal = MappingProxyType(agenda)
+
+    def _validar_matricula(self, matricula: str) -> str:
+        return normalizar_matricula(matricula)
        
     def __str__(self) -> str:
-        return f"Medico: {self.__nombre}, Matricula: {self.__matricula}, Especialidades: {self.__especialidades}"
\ No newline at end of file
+        return texto_medico(self)
\ No newline at end of file
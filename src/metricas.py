@@ -0,0 +1,197 @@
+import functools
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable
+from src.resultado import (
+    ResultadoOperacion,
+    TURNO_OCUPADO,
+    PACIENTE_NO_REGISTRADO,
+    MEDICO_NO_REGISTRADO
+)
+from src.excepciones import (
+    TurnoOcupadoException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException
+)
+
+# LIMITES SUPERIORES DE LOS BUCKETS, EN SEGUNDOS (EL ULTIMO, +Inf, ES IMPLICITO)
+BUCKETS_LATENCIA = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# LAS EXCEPCIONES SE CUENTAN CON EL MISMO MOTIVO QUE EL RESULTADO EQUIVALENTE
+MOTIVOS_POR_EXCEPCION = {
+    TurnoOcupadoException: TURNO_OCUPADO,
+    PacienteNoEncontradoException: PACIENTE_NO_REGISTRADO,
+    MedicoNoEncontradoException: MEDICO_NO_REGISTRADO,
+}
+
+class Histograma:
+
+    __slots__ = ("__limites", "__conteos", "__suma", "__cantidad")
+
+    def __init__(self, limites: tuple[float, ...] = BUCKETS_LATENCIA):
+        self.__limites = limites
+        self.__conteos = [0] * (len(limites) + 1)
+        self.__suma = 0.0
+        self.__cantidad = 0
+
+    def observar(self, valor: float) -> None:
+        self.__conteos[bisect_left(self.__limites, valor)] += 1
+        self.__suma += valor
+        self.__cantidad += 1
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad
+
+    def obtener_suma(self) -> float:
+        return self.__suma
+
+    def obtener_acumulados(self) -> list[tuple[float, int]]:
+        # (LIMITE, OBSERVACIONES <= LIMITE) COMO LOS BUCKETS DE PROMETHEUS, TERMINANDO EN +Inf
+        acumulados = []
+        total = 0
+        for limite, conteo in zip(self.__limites + (float("inf"),), self.__conteos):
+            total += conteo
+            acumulados.append((limite, total))
+        return acumulados
+
+class Metricas:
+
+    # OPCIONAL: UNA CLINICA SIN METRICAS NO ENVUELVE NINGUN METODO Y NO PAGA NADA POR ELLAS
+    def __init__(self, prefijo: str = "clinica"):
+        self.__prefijo = prefijo
+        # LA CANTIDAD DE LLAMADAS DE CADA OPERACION ES LA DE OBSERVACIONES DE SU HISTOGRAMA
+        self.__rechazos: Counter[tuple[str, str]] = Counter()
+        self.__latencias: dict[str, Histograma] = {}
+        self.__tamanos: dict[str, Callable[[], int]] = {}
+        self.__cerrojo = threading.Lock()
+
+# REGISTRAR
+
+    def observar(self, operacion: str, segundos: float, motivos: list[str] | tuple = ()) -> None:
+        histograma = self._histograma(operacion)
+        with self.__cerrojo:
+            histograma.observar(segundos)
+            for motivo in motivos:
+                self.__rechazos[(operacion, motivo)] += 1
+
+    def _histograma(self, operacion: str) -> Histograma:
+        histograma = self.__latencias.get(operacion)
+        if histograma is None:
+            with self.__cerrojo:
+                histograma = self.__latencias.setdefault(operacion, Histograma())
+        return histograma
+
+    def registrar_tamano(self, nombre: str, medir: Callable[[], int]) -> None:
+        # LOS TAMANOS SE CALCULAN RECIEN AL TOMAR UNA INSTANTANEA
+        self.__tamanos[nombre] = medir
+
+    def envolver(self, operacion: str, funcion: Callable) -> Callable:
+        # EL HISTOGRAMA, LOS CONTADORES Y EL CERROJO SE RESUELVEN UNA VEZ: CADA LLAMADA SOLO
+        # LEE EL RELOJ DOS VECES Y ACTUALIZA SU HISTOGRAMA
+        reloj = time.perf_counter
+        histograma = self._histograma(operacion)
+        rechazos = self.__rechazos
+        cerrojo = self.__cerrojo
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = funcion(*args, **kwargs)
+            except Exception as error:
+                duracion = reloj() - inicio
+                with cerrojo:
+                    histograma.observar(duracion)
+                    rechazos[(operacion, MOTIVOS_POR_EXCEPCION.get(type(error), type(error).__name__))] += 1
+                raise
+            duracion = reloj() - inicio
+            with cerrojo:
+                histograma.observar(duracion)
+                if resultado.__class__ is ResultadoOperacion or resultado.__class__ is list:
+                    for motivo in _motivos(resultado):
+                        rechazos[(operacion, motivo)] += 1
+            return resultado
+        return medida
+
+# CONSULTAR
+
+    def instantanea(self) -> dict:
+        with self.__cerrojo:
+            llamadas = {operacion: h.obtener_cantidad() for operacion, h in self.__latencias.items() if h.obtener_cantidad()}
+            rechazos: dict[str, dict[str, int]] = {}
+            for (operacion, motivo), cantidad in self.__rechazos.items():
+                rechazos.setdefault(operacion, {})[motivo] = cantidad
+            latencias = {
+                operacion: {
+                    "cantidad": histograma.obtener_cantidad(),
+                    "suma": histograma.obtener_suma(),
+                    "buckets": histograma.obtener_acumulados(),
+                }
+                for operacion, histograma in self.__latencias.items()
+                if histograma.obtener_cantidad()
+            }
+        tamanos = {nombre: medir() for nombre, medir in self.__tamanos.items()}
+        return {"llamadas": llamadas, "rechazos": rechazos, "latencias": latencias, "tamanos": tamanos}
+
+# EXPORTAR
+
+    def exportar_prometheus(self) -> str:
+        datos = self.instantanea()
+        p = self.__prefijo
+        lineas = [
+            f"# HELP {p}_operaciones_total Llamadas por operación.",
+            f"# TYPE {p}_operaciones_total counter",
+        ]
+        lineas += [f'{p}_operaciones_total{{operacion="{op}"}} {n}' for op, n in sorted(datos["llamadas"].items())]
+
+        lineas += [
+            f"# HELP {p}_rechazos_total Operaciones rechazadas por motivo.",
+            f"# TYPE {p}_rechazos_total counter",
+        ]
+        for operacion, motivos in sorted(datos["rechazos"].items()):
+            lineas += [f'{p}_rechazos_total{{operacion="{operacion}",motivo="{m}"}} {n}' for m, n in sorted(motivos.items())]
+
+        lineas += [
+            f"# HELP {p}_latencia_segundos Duración de cada operación.",
+            f"# TYPE {p}_latencia_segundos histogram",
+        ]
+        for operacion, latencia in sorted(datos["latencias"].items()):
+            for limite, acumulado in latencia["buckets"]:
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                lineas.append(f'{p}_latencia_segundos_bucket{{operacion="{operacion}",le="{le}"}} {acumulado}')
+            lineas.append(f'{p}_latencia_segundos_sum{{operacion="{operacion}"}} {latencia["suma"]!r}')
+            lineas.append(f'{p}_latencia_segundos_count{{operacion="{operacion}"}} {latencia["cantidad"]}')
+
+        lineas += [
+            f"# HELP {p}_tamano Elementos en cada índice.",
+            f"# TYPE {p}_tamano gauge",
+        ]
+        lineas += [f'{p}_tamano{{indice="{nombre}"}} {n}' for nombre, n in sorted(datos["tamanos"].items())]
+        return "\n".join(lineas) + "\n"
+
+    def escribir_prometheus(self, ruta: str) -> None:
+        # REEMPLAZO ATOMICO: QUIEN LEE EL ARCHIVO (textfile collector) NUNCA VE UNO A MEDIO ESCRIBIR
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.exportar_prometheus())
+        os.replace(temporal, ruta)
+
+    def enviar_prometheus(self, direccion: str | tuple[str, int], espera: float = 5.0) -> None:
+        # UNA RUTA ES UN SOCKET UNIX; UNA TUPLA (host, puerto) ES TCP
+        familia = socket.AF_UNIX if isinstance(direccion, str) else socket.AF_INET
+        with socket.socket(familia, socket.SOCK_STREAM) as conexion:
+            conexion.settimeout(espera)
+            conexion.connect(direccion)
+            conexion.sendall(self.exportar_prometheus().encode("utf-8"))
+
+def _motivos(resultado) -> list[str]:
+    # UN RESULTADO RECHAZADO O UNA LISTA DE RESULTADOS (OPERACIONES EN LOTE)
+    if isinstance(resultado, ResultadoOperacion):
+        return [resultado.obtener_motivo() or "sin_motivo"] if not resultado else []
+    if isinstance(resultado, list) and resultado and isinstance(resultado[0], ResultadoOperacion):
+        return [r.obtener_motivo() or "sin_motivo" for r in resultado if not r]
+    return []
@@ -1,12 +1,25 @@
-import re
-from src.excepciones import ( DNIInvalidoException, PacienteInvalidoException ) 
+import sys
+from src.excepciones import PacienteInvalidoException
+from src.validaciones import normalizar_dni
+from src.renderizado import texto_paciente
 
 class Paciente:
 
+    __slots__ = ("__nombre", "__dni", "__fecha_de_nacimiento")
+
     def __init__(self, nombre: str, dni: str, fecha_de_nacimiento: str):
         self.__nombre = self._validar_nombre(nombre)  
         self.__dni = self._validar_dni(dni)
-        self.__fecha_de_nacimiento = fecha_de_nacimiento  
+        self.__fecha_de_nacimiento = sys.intern(fecha_de_nacimiento)
+
+    @classmethod
+    def _desde_datos_validados(cls, nombre: str, dni: str, fecha_de_nacimiento: str) -> "Paciente":
+        # RECONSTRUYE UN PACIENTE YA VALIDADO (SNAPSHOTS) SIN VOLVER A VALIDAR
+        paciente = cls.__new__(cls)
+        paciente.__nombre = nombre
+        paciente.__dni = dni
+        paciente.__fecha_de_nacimiento = sys.intern(fecha_de_nacimiento)
+        return paciente
 
 # VALIDACIONES
 
@@ -22,17 +35,7 @@ class Paciente:
         return nombre_limpio  
 
     def _validar_dni(self, dni: str) -> str:
- 
-        if not dni:
-            raise DNIInvalidoException("El DNI no puede estar vacío")
-        
-        dni_limpio = re.sub(r'[.\s]', '', dni)
-        patron_dni = r'^\d{7,8}$'
-        
-        if not re.match(patron_dni, dni_limpio):
-            raise DNIInvalidoException("DNI inválido. Debe tener 7-8 dígitos")
-        
-        return dni_limpio
+        return normalizar_dni(dni)
 
 # GETTERS
 
@@ -41,6 +44,9 @@ class Paciente:
 
     def obtener_dni(self) -> str:
         return self.__dni
+
+    def obtener_fecha_de_nacimiento(self) -> str:
+        return self.__fecha_de_nacimiento
     
     def __str__(self) -> str:
-        return f"Paciente: {self.__nombre}, DNI: {self.__dni}, Fecha de nacimiento: {self.__fecha_de_nacimiento}"
\ No newline at end of file
+        return texto_paciente(self)
\ No newline at end of file
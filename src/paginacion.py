@@ -0,0 +1,210 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+TAMANO_PAGINA = 20
+
+class Pagina:
+
+    # UNA PAGINA DE UN LISTADO: LOS ELEMENTOS (TUPLA, SOLO LECTURA) Y EL CURSOR PARA PEDIR LA
+    # SIGUIENTE. EL CURSOR ES LA CLAVE DEL ULTIMO ELEMENTO, O None SI NO HAY MAS
+    __slots__ = ("__elementos", "__cursor")
+
+    def __init__(self, elementos: tuple, cursor: Any = None):
+        self.__elementos = elementos
+        self.__cursor = cursor
+
+    def obtener_elementos(self) -> tuple:
+        return self.__elementos
+
+    def obtener_cursor(self) -> Any:
+        return self.__cursor
+
+    def hay_mas(self) -> bool:
+        return self.__cursor is not None
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__elementos)
+
+    def __len__(self) -> int:
+        return len(self.__elementos)
+
+def paginar(elementos: Iterable, tamano: int, clave: Callable) -> Pagina:
+    # elementos VIENE ORDENADO POR clave Y YA POSICIONADO DESPUES DEL CURSOR: SE CONSUME
+    # UN ELEMENTO DE MAS SOLO PARA SABER SI HAY OTRA PAGINA
+    if tamano < 1:
+        raise ValueError("El tamaño de página debe ser positivo.")
+    elementos = tuple(islice(elementos, tamano + 1))
+    if len(elementos) <= tamano:
+        return Pagina(elementos)
+    elementos = elementos[:tamano]
+    return Pagina(elementos, clave(elementos[-1]))
+
+# HASTA ESTA CANTIDAD DE CLAVES NUEVAS SE INSERTAN DE A UNA; CON MAS SE FUSIONAN TRAMO POR TRAMO
+FUSION_POR_INSERCION = 32
+# CLAVES POR TRAMO: UN TRAMO QUE LLEGA AL DOBLE SE PARTE EN DOS Y UNO QUE BAJA DE LA MITAD SE UNE AL SIGUIENTE
+CARGA_TRAMO = 512
+
+class IndiceOrdenado:
+
+    # CLAVES SIEMPRE ORDENADAS, REPARTIDAS EN TRAMOS ORDENADOS DE A LO SUMO 2 * CARGA_TRAMO CLAVES.
+    # maximos[i] ES LA ULTIMA CLAVE DEL TRAMO i: UN BISECT SOBRE maximos UBICA EL TRAMO Y OTRO DENTRO
+    # DEL TRAMO UBICA LA CLAVE. ALTA Y BAJA MUEVEN A LO SUMO UN TRAMO (NO TODO EL INDICE): O(log n)
+    # COMPARACIONES MAS UNA COPIA ACOTADA POR CARGA_TRAMO. LAS LECTURAS NUNCA ORDENAN
+    def __init__(self, claves: Iterable = ()):
+        self.__cerrojo = threading.Lock()
+        self.reconstruir(claves)
+
+    def agregar(self, clave) -> None:
+        with self.__cerrojo:
+            self._insertar(clave)
+
+    def agregar_varias(self, claves: Iterable) -> None:
+        nuevas = sorted(claves)
+        if not nuevas:
+            return
+        with self.__cerrojo:
+            if len(nuevas) <= FUSION_POR_INSERCION:
+                for clave in nuevas:
+                    self._insertar(clave)
+            elif len(nuevas) >= self.__largo:
+                # DOS TRAMOS ORDENADOS: timsort LOS FUSIONA EN TIEMPO LINEAL Y SE VUELVE A TROZAR
+                claves = [clave for tramo in self.__tramos for clave in tramo]
+                claves += nuevas
+                claves.sort()
+                self._trozar(claves)
+            else:
+                self._fusionar(nuevas)
+
+    def _fusionar(self, nuevas: list) -> None:
+        # SOLO CON EL CERROJO TOMADO; nuevas YA ORDENADA. CADA TRAMO RECIBE DE UNA VEZ LAS CLAVES QUE LE
+        # TOCAN (UN BISECT SOBRE nuevas POR TRAMO) Y SE ORDENA UNA SOLA VEZ; LOS QUE NO RECIBEN NADA NO SE COPIAN
+        tramos = []
+        desde = 0
+        ultimo = len(self.__tramos) - 1
+        for i, tramo in enumerate(self.__tramos):
+            hasta = len(nuevas) if i == ultimo else bisect_right(nuevas, self.__maximos[i], desde)
+            if hasta > desde:
+                tramo = tramo + nuevas[desde:hasta]
+                tramo.sort()
+                desde = hasta
+                if len(tramo) >= 2 * CARGA_TRAMO:
+                    tramos += [tramo[j:j + CARGA_TRAMO] for j in range(0, len(tramo), CARGA_TRAMO)]
+                    continue
+            tramos.append(tramo)
+        self.__tramos = tramos
+        self.__maximos = [tramo[-1] for tramo in tramos]
+        self.__largo += len(nuevas)
+
+    def _trozar(self, claves: list) -> None:
+        # SOLO CON EL CERROJO TOMADO; claves YA ORDENADA
+        self.__tramos = [claves[i:i + CARGA_TRAMO] for i in range(0, len(claves), CARGA_TRAMO)]
+        self.__maximos = [tramo[-1] for tramo in self.__tramos]
+        self.__largo = len(claves)
+
+    def _insertar(self, clave) -> None:
+        # SOLO CON EL CERROJO TOMADO
+        tramos = self.__tramos
+        maximos = self.__maximos
+        if not tramos:
+            tramos.append([clave])
+            maximos.append(clave)
+            self.__largo = 1
+            return
+        i = bisect_right(maximos, clave)
+        if i == len(maximos):
+            # MAYOR QUE TODAS: VA AL FINAL DEL ULTIMO TRAMO
+            i -= 1
+            tramos[i].append(clave)
+            maximos[i] = clave
+        else:
+            insort(tramos[i], clave)
+        self.__largo += 1
+        if len(tramos[i]) >= 2 * CARGA_TRAMO:
+            self._partir(i)
+
+    def _partir(self, i: int) -> None:
+        tramo = self.__tramos[i]
+        mitad = len(tramo) // 2
+        self.__tramos[i:i + 1] = [tramo[:mitad], tramo[mitad:]]
+        self.__maximos.insert(i, tramo[mitad - 1])
+
+    def quitar(self, clave) -> bool:
+        with self.__cerrojo:
+            tramos = self.__tramos
+            maximos = self.__maximos
+            i = bisect_left(maximos, clave)
+            if i == len(maximos):
+                return False
+            tramo = tramos[i]
+            j = bisect_left(tramo, clave)
+            if tramo[j] != clave:
+                return False
+            del tramo[j]
+            self.__largo -= 1
+            if not tramo:
+                del tramos[i]
+                del maximos[i]
+                return True
+            maximos[i] = tramo[-1]
+            if len(tramo) < CARGA_TRAMO // 2 and i + 1 < len(tramos):
+                # TRAMOS CHICOS SE UNEN: LA CANTIDAD DE TRAMOS SIGUE SIENDO ~ n / CARGA_TRAMO
+                tramo.extend(tramos[i + 1])
+                del tramos[i + 1]
+                del maximos[i]
+                if len(tramo) >= 2 * CARGA_TRAMO:
+                    self._partir(i)
+            return True
+
+    def reconstruir(self, claves: Iterable) -> None:
+        claves = sorted(claves)
+        with self.__cerrojo:
+            self._trozar(claves)
+
+    def siguientes(self, despues_de, cantidad: int) -> list:
+        with self.__cerrojo:
+            tramos = self.__tramos
+            if despues_de is None:
+                i, j = 0, 0
+            else:
+                i = bisect_right(self.__maximos, despues_de)
+                j = bisect_right(tramos[i], despues_de) if i < len(tramos) else 0
+            claves = []
+            while i < len(tramos) and len(claves) < cantidad:
+                claves += tramos[i][j:j + cantidad - len(claves)]
+                i += 1
+                j = 0
+            return claves
+
+    def contar_entre(self, despues_de, hasta) -> int:
+        # CLAVES EN (despues_de, hasta) SIN RECORRERLAS: BISECT EN LOS TRAMOS DE LOS EXTREMOS Y
+        # EL LARGO DE LOS TRAMOS INTERMEDIOS
+        with self.__cerrojo:
+            i, j = self._ubicar(despues_de, bisect_right)
+            k, m = self._ubicar(hasta, bisect_left)
+            if (i, j) >= (k, m):
+                return 0
+            if i == k:
+                return m - j
+            return len(self.__tramos[i]) - j + sum(len(tramo) for tramo in self.__tramos[i + 1:k]) + m
+
+    def _ubicar(self, clave, bisect: Callable) -> tuple[int, int]:
+        # (TRAMO, POSICION EN EL TRAMO); (len(tramos), 0) SI QUEDA DESPUES DE TODAS
+        i = bisect(self.__maximos, clave)
+        if i == len(self.__tramos):
+            return i, 0
+        return i, bisect(self.__tramos[i], clave)
+
+    def iterar(self, despues_de=None, tanda: int = 256) -> Iterator:
+        # DE A TANDAS, UBICANDO CADA UNA POR BISECT DESDE LA ULTIMA CLAVE ENTREGADA:
+        # NO SE COPIA EL INDICE Y EL RECORRIDO TOLERA ALTAS CONCURRENTES
+        while True:
+            claves = self.siguientes(despues_de, tanda)
+            yield from claves
+            if len(claves) < tanda:
+                return
+            despues_de = claves[-1]
+
+    def __len__(self) -> int:
+        return self.__largo
@@ -2,21 +2,34 @@ from src.paciente import Paciente
 from src.medico import Medico
 from src.excepciones import RecetaInvalidaException
 from datetime import datetime
+from src.renderizado import texto_receta
 
 class Receta:
-    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str]):
+
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__fecha")
+
+    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str], fecha: datetime | None = None):
         if not medicamentos:
             raise ValueError("La receta debe contener al menos un medicamento.")
 
         self.__paciente = paciente
         self.__medico = medico
         self.__medicamentos = medicamentos
-        self.__fecha = datetime.now()
+        self.__fecha = fecha if fecha is not None else datetime.now()
 
-    def __str__(self) -> str:
-        medicamentos_str = ", ".join(self.__medicamentos)
-        fecha_str = self.__fecha.strftime("%d/%m/%Y")
-        return f"Receta: Paciente: {self.__paciente}, Médico: {self.__medico}, Medicamentos: [{medicamentos_str}], Fecha: {fecha_str}  "
+# GETTERS
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente
 
+    def obtener_medico(self) -> Medico:
+        return self.__medico
 
-     
\ No newline at end of file
+    def obtener_medicamentos(self) -> list[str]:
+        return list(self.__medicamentos)
+
+    def obtener_fecha(self) -> datetime:
+        return self.__fecha
+
+    def __str__(self) -> str:
+        return texto_receta(self)
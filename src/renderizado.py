@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.medico import Medico
+    from src.paciente import Paciente
+    from src.turno import Turno
+    from src.receta import Receta
+
+# FORMATOS COMPLETOS (__str__)
+
+def texto_medico(medico: "Medico") -> str:
+    return f"Medico: {medico.obtener_nombre()}, Matricula: {medico.obtener_matricula()}, Especialidades: {medico.obtener_especialidades()}"
+
+def texto_paciente(paciente: "Paciente") -> str:
+    return f"Paciente: {paciente.obtener_nombre()}, DNI: {paciente.obtener_dni()}, Fecha de nacimiento: {paciente.obtener_fecha_de_nacimiento()}"
+
+def texto_turno(turno: "Turno") -> str:
+    return (
+        f"Turno(\n"
+        f"  Paciente: {texto_paciente(turno.obtener_paciente())},\n"
+        f"  Médico: {texto_medico(turno.obtener_medico())},\n"
+        f"  Especialidad: {turno.obtener_especialidad()},\n"
+        # isoformat DA EL MISMO "AAAA-MM-DD HH:MM" QUE strftime EN UNA FRACCION DEL TIEMPO
+        f"  Fecha y hora: {turno.obtener_fecha_hora().isoformat(' ', 'minutes')}\n"
+        f")"
+    )
+
+def texto_receta(receta: "Receta") -> str:
+    medicamentos_str = ", ".join(receta.obtener_medicamentos())
+    fecha_str = receta.obtener_fecha().strftime("%d/%m/%Y")
+    return f"Receta: Paciente: {texto_paciente(receta.obtener_paciente())}, Médico: {texto_medico(receta.obtener_medico())}, Medicamentos: [{medicamentos_str}], Fecha: {fecha_str}  "
+
+# FORMATOS COMPACTOS (UNA LINEA, PARA LISTADOS)
+
+def linea_medico(medico: "Medico") -> str:
+    especialidades = ", ".join(e.obtener_especialidad() for e in medico.obtener_especialidades())
+    return f"{medico.obtener_nombre()} - Matrícula: {medico.obtener_matricula()} - {especialidades}"
+
+def linea_paciente(paciente: "Paciente") -> str:
+    return f"{paciente.obtener_nombre()} - DNI: {paciente.obtener_dni()}"
+
+def firma_medico(medico: "Medico", firmas: dict | None = None) -> str:
+    # "Nombre (MATRICULA)": SE REPITE EN CADA LINEA DE TURNO O RECETA DEL MISMO MEDICO. QUIEN ARMA
+    # UN LISTADO PUEDE PASAR UN DICCIONARIO PROPIO Y CADA FIRMA SE FORMATEA UNA VEZ POR LISTADO;
+    # AL TERMINAR SE DESCARTA CON EL, SIN CACHE GLOBAL QUE RETENGA MEDICOS
+    if firmas is None:
+        return f"{medico.obtener_nombre()} ({medico.obtener_matricula()})"
+    firma = firmas.get(medico)
+    if firma is None:
+        firma = firmas[medico] = f"{medico.obtener_nombre()} ({medico.obtener_matricula()})"
+    return firma
+
+def linea_turno(turno: "Turno", con_paciente: bool = True, firmas: dict | None = None) -> str:
+    # SIN PACIENTE DENTRO DE SU PROPIA HISTORIA CLINICA, DONDE YA SE SABE DE QUIEN ES
+    inicio = f"{turno.obtener_fecha_hora().strftime('%d/%m/%Y %H:%M')} - {turno.obtener_especialidad()}"
+    if con_paciente:
+        inicio += f" - {linea_paciente(turno.obtener_paciente())}"
+    return f"{inicio} con {firma_medico(turno.obtener_medico(), firmas)}"
+
+def linea_receta(receta: "Receta", con_paciente: bool = True, firmas: dict | None = None) -> str:
+    inicio = f"{receta.obtener_fecha().strftime('%d/%m/%Y')} - {', '.join(receta.obtener_medicamentos())}"
+    if con_paciente:
+        inicio += f" - {linea_paciente(receta.obtener_paciente())}"
+    return f"{inicio} - {firma_medico(receta.obtener_medico(), firmas)}"
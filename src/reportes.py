@@ -0,0 +1,190 @@
+from collections import Counter
+from datetime import date, time, timedelta, datetime
+from itertools import compress, repeat
+from operator import add, and_, floordiv, gt, le, mul
+from src.clinica import Clinica
+from src.medico import Medico
+from src.especialidad import DIAS_SEMANA
+from src.tabla_turnos import EPOCA, MINUTOS_POR_DIA
+
+# NUMPY ES OPCIONAL: SIN EL, LAS AGREGACIONES SE HACEN CON Counter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DIA_EPOCA = EPOCA.date()
+MINUTOS_POR_SEMANA = 7 * MINUTOS_POR_DIA
+
+def _a_dia(dia: date) -> int:
+    return (dia - DIA_EPOCA).days
+
+def _semana(dia: int) -> int:
+    # 1970-01-01 FUE JUEVES: SUMANDO 3 LAS SEMANAS EMPIEZAN EN LUNES
+    return (dia + 3) // 7
+
+def _lunes_de_semana(semana: int) -> date:
+    return DIA_EPOCA + timedelta(days=semana * 7 - 3)
+
+class UtilizacionSemanal:
+
+    __slots__ = ("__matricula", "__semana", "__turnos", "__minutos_ocupados", "__minutos_disponibles")
+
+    def __init__(self, matricula: str, semana: date, turnos: int, minutos_ocupados: int, minutos_disponibles: int):
+        self.__matricula = matricula
+        self.__semana = semana
+        self.__turnos = turnos
+        self.__minutos_ocupados = minutos_ocupados
+        self.__minutos_disponibles = minutos_disponibles
+
+    def obtener_matricula(self) -> str:
+        return self.__matricula
+
+    def obtener_semana(self) -> date:
+        return self.__semana
+
+    def obtener_turnos(self) -> int:
+        return self.__turnos
+
+    def obtener_minutos_ocupados(self) -> int:
+        return self.__minutos_ocupados
+
+    def obtener_minutos_disponibles(self) -> int:
+        return self.__minutos_disponibles
+
+    def obtener_utilizacion(self) -> float:
+        if not self.__minutos_disponibles:
+            return 0.0
+        return self.__minutos_ocupados / self.__minutos_disponibles
+
+    def __str__(self) -> str:
+        return f"{self.__matricula} semana del {self.__semana.strftime('%d/%m/%Y')}: {self.__turnos} turnos, {self.obtener_utilizacion():.0%} de ocupación"
+
+# FILTRO COMUN
+
+def _seleccionar(clinica: Clinica, desde: date | None, hasta: date | None):
+    # COLUMNAS DE LA TABLA, SELECTOR DE FILAS ACTIVAS DENTRO DE [desde, hasta] Y ESOS
+    # LIMITES COMO DIAS DESDE LA EPOCA, O None SI EL RANGO QUEDA VACIO (AMBAS RUTAS IGUAL).
+    # SIN NUMPY TODO SE ENCADENA CON map/compress PARA QUE EL RECORRIDO FILA A FILA OCURRA
+    # EN C Y NO EN EL INTERPRETE
+    tabla = clinica.obtener_tabla_turnos()
+    columnas = tabla.obtener_columnas()
+    inicio = columnas["inicio"]
+
+    if np is not None:
+        seleccion = columnas["activo"] != 0
+        if not seleccion.any() and (desde is None or hasta is None):
+            return None
+        primero = _a_dia(desde) if desde is not None else int(inicio[seleccion].min()) // MINUTOS_POR_DIA
+        ultimo = _a_dia(hasta) if hasta is not None else int(inicio[seleccion].max()) // MINUTOS_POR_DIA
+        if primero > ultimo:
+            return None
+        seleccion &= (inicio >= primero * MINUTOS_POR_DIA) & (inicio < (ultimo + 1) * MINUTOS_POR_DIA)
+        return tabla, columnas, seleccion, primero, ultimo
+
+    seleccion = columnas["activo"]
+    if not any(seleccion) and (desde is None or hasta is None):
+        return None
+    primero = _a_dia(desde) if desde is not None else min(compress(inicio, seleccion)) // MINUTOS_POR_DIA
+    ultimo = _a_dia(hasta) if hasta is not None else max(compress(inicio, seleccion)) // MINUTOS_POR_DIA
+    if primero > ultimo:
+        return None
+    if desde is not None or hasta is not None:
+        en_rango = map(and_, map(le, repeat(primero * MINUTOS_POR_DIA), inicio), map(gt, repeat((ultimo + 1) * MINUTOS_POR_DIA), inicio))
+        seleccion = list(map(and_, seleccion, en_rango))
+    return tabla, columnas, seleccion, primero, ultimo
+
+# UTILIZACION POR MEDICO
+
+def utilizacion_por_medico(clinica: Clinica, desde: date | None = None, hasta: date | None = None, hora_inicio: time = time(8, 0), hora_fin: time = time(18, 0)) -> list[UtilizacionSemanal]:
+    # OCUPADO: MINUTOS AGENDADOS. DISPONIBLE: DIAS DE ATENCION DE CADA MEDICO (SUS ESPECIALIDADES) * HORARIO DIARIO
+    seleccionado = _seleccionar(clinica, desde, hasta)
+    if seleccionado is None:
+        return []
+    tabla, columnas, seleccion, primero, ultimo = seleccionado
+
+    semana_inicial = _semana(primero)
+    cantidad_semanas = _semana(ultimo) - semana_inicial + 1
+    tamano = len(tabla.obtener_medicos()) * cantidad_semanas
+
+    # CLAVE = medico * cantidad_semanas + semana RELATIVA AL RANGO
+    if np is not None:
+        semanas = (columnas["inicio"][seleccion] + 3 * MINUTOS_POR_DIA) // MINUTOS_POR_SEMANA - semana_inicial
+        claves = columnas["medico"][seleccion].astype(np.int64) * cantidad_semanas + semanas
+        turnos = np.bincount(claves, minlength=tamano).tolist()
+        minutos = np.bincount(claves, weights=columnas["duracion"][seleccion], minlength=tamano).astype(np.int64).tolist()
+    else:
+        semanas = map(floordiv, map(add, columnas["inicio"], repeat(3 * MINUTOS_POR_DIA)), repeat(MINUTOS_POR_SEMANA))
+        claves = map(add, map(mul, columnas["medico"], repeat(cantidad_semanas)), semanas)
+        # LAS DURACIONES DISTINTAS SON POCAS: SE CUENTA (clave, duracion) EMPAQUETADO EN UN SOLO ENTERO
+        base = max(columnas["duracion"], default=0) + 1
+        turnos = [0] * tamano
+        minutos = [0] * tamano
+        for clave_y_duracion, cantidad in Counter(compress(map(add, map(mul, claves, repeat(base)), columnas["duracion"]), seleccion)).items():
+            clave, duracion = divmod(clave_y_duracion, base)
+            turnos[clave - semana_inicial] += cantidad
+            minutos[clave - semana_inicial] += cantidad * duracion
+
+    minutos_por_dia = (datetime.combine(DIA_EPOCA, hora_fin) - datetime.combine(DIA_EPOCA, hora_inicio)) // timedelta(minutes=1)
+    mascaras_semana = [_mascara_en_rango(semana_inicial + i, primero, ultimo) for i in range(cantidad_semanas)]
+    codificador = tabla.obtener_medicos()
+
+    reporte = []
+    for medico in sorted(clinica.obtener_medicos(), key=lambda m: m.obtener_matricula()):
+        matricula = medico.obtener_matricula()
+        codigo = codificador.obtener_codigo(matricula)
+        mascara_medico = _mascara_de_atencion(medico)
+        for i, mascara_semana in enumerate(mascaras_semana):
+            clave = codigo * cantidad_semanas + i if codigo is not None else None
+            reporte.append(UtilizacionSemanal(
+                matricula,
+                _lunes_de_semana(semana_inicial + i),
+                turnos[clave] if clave is not None else 0,
+                minutos[clave] if clave is not None else 0,
+                bin(mascara_medico & mascara_semana).count("1") * minutos_por_dia
+            ))
+    return reporte
+
+def _mascara_de_atencion(medico: Medico) -> int:
+    # BIT n ENCENDIDO SI EL MEDICO ATIENDE ALGUNA ESPECIALIDAD ESE DIA (0 = LUNES)
+    mascara = 0
+    for numero, dia in enumerate(DIAS_SEMANA):
+        if medico.obtener_especialidad_para_dia(dia) is not None:
+            mascara |= 1 << numero
+    return mascara
+
+def _mascara_en_rango(semana: int, primero: int, ultimo: int) -> int:
+    # DIAS DE LA SEMANA QUE CAEN DENTRO DEL RANGO PEDIDO (LAS SEMANAS DE LOS EXTREMOS PUEDEN SER PARCIALES)
+    lunes = semana * 7 - 3
+    mascara = 0
+    for numero in range(7):
+        if primero <= lunes + numero <= ultimo:
+            mascara |= 1 << numero
+    return mascara
+
+# DEMANDA POR ESPECIALIDAD
+
+def demanda_por_especialidad(clinica: Clinica, desde: date | None = None, hasta: date | None = None) -> dict[str, dict[date, int]]:
+    seleccionado = _seleccionar(clinica, desde, hasta)
+    if seleccionado is None:
+        return {}
+    tabla, columnas, seleccion, primero, ultimo = seleccionado
+
+    # CLAVE = especialidad * cantidad_dias + dia DESDE LA EPOCA (SE RESTA primero AL DECODIFICAR)
+    cantidad_dias = ultimo - primero + 1
+    codificador = tabla.obtener_especialidades()
+
+    if np is not None:
+        claves = columnas["especialidad"][seleccion].astype(np.int64) * cantidad_dias + columnas["inicio"][seleccion] // MINUTOS_POR_DIA - primero
+        conteos = np.bincount(claves, minlength=len(codificador) * cantidad_dias)
+        pares = zip(np.flatnonzero(conteos).tolist(), conteos[conteos != 0].tolist())
+    else:
+        dias = map(floordiv, columnas["inicio"], repeat(MINUTOS_POR_DIA))
+        claves = map(add, map(mul, columnas["especialidad"], repeat(cantidad_dias)), dias)
+        pares = sorted((clave - primero, cantidad) for clave, cantidad in Counter(compress(claves, seleccion)).items())
+
+    demanda: dict[str, dict[date, int]] = {}
+    for clave, cantidad in pares:
+        codigo, dia = divmod(clave, cantidad_dias)
+        demanda.setdefault(codificador.obtener_texto(codigo), {})[DIA_EPOCA + timedelta(days=primero + dia)] = cantidad
+    return demanda
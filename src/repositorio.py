@@ -0,0 +1,132 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+from src.serie_turnos import SerieTurnos
+from src.receta import Receta
+from src.historia_clinica import HistoriaClinica
+
+class RepositorioClinica(ABC):
+
+# PACIENTES
+
+    @abstractmethod
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        ...
+
+    @abstractmethod
+    def obtener_paciente(self, dni: str) -> Paciente | None:
+        ...
+
+    @abstractmethod
+    def listar_pacientes(self, despues_de: str | None = None) -> Iterator[Paciente]:
+        # ORDENADOS POR DNI; despues_de ES EL CURSOR DE PAGINACION (SE EXCLUYE)
+        ...
+
+    def guardar_pacientes(self, pacientes: list[Paciente]) -> None:
+        # LAS IMPLEMENTACIONES PUEDEN REEMPLAZARLO POR UNA SOLA ESCRITURA MASIVA
+        for paciente in pacientes:
+            self.guardar_paciente(paciente)
+
+# MEDICOS
+
+    @abstractmethod
+    def guardar_medico(self, medico: Medico) -> None:
+        ...
+
+    @abstractmethod
+    def obtener_medico(self, matricula: str) -> Medico | None:
+        ...
+
+    @abstractmethod
+    def listar_medicos(self, despues_de: str | None = None) -> Iterator[Medico]:
+        # ORDENADOS POR MATRICULA
+        ...
+
+    def guardar_medicos(self, medicos: list[Medico]) -> None:
+        for medico in medicos:
+            self.guardar_medico(medico)
+
+# TURNOS
+
+    @abstractmethod
+    def guardar_turno(self, turno: Turno) -> None:
+        ...
+
+    @abstractmethod
+    def eliminar_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        ...
+
+    @abstractmethod
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        ...
+
+    @abstractmethod
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        # CONTRA LOS TURNOS Y LAS OCURRENCIAS PENDIENTES DE LAS SERIES DEL MEDICO.
+        # excepto: EL INICIO DE UN TURNO DEL MISMO MEDICO QUE NO CUENTA
+        ...
+
+    @abstractmethod
+    def listar_intervalos_turnos(self, matricula: str, desde: datetime, hasta: datetime) -> list[tuple[datetime, datetime]]:
+        # (inicio, fin) DE LOS TURNOS DEL MEDICO QUE CORTAN [desde, hasta), ORDENADOS POR inicio
+        ...
+
+    @abstractmethod
+    def obtener_turno(self, matricula: str, fecha_hora: datetime, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Turno | None:
+        ...
+
+    @abstractmethod
+    def listar_turnos(self, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico], despues_de: tuple[datetime, str] | None = None) -> Iterator[Turno]:
+        # ORDENADOS POR (fecha_hora, matricula)
+        ...
+
+    @abstractmethod
+    def listar_turnos_por_dni(self, dni: str, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Iterator[Turno]:
+        # ORDENADOS POR fecha_hora
+        ...
+
+    @abstractmethod
+    def listar_turnos_entre(self, desde: datetime, hasta: datetime, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Iterator[Turno]:
+        # LOS QUE EMPIEZAN EN [desde, hasta), ORDENADOS POR (fecha_hora, matricula)
+        ...
+
+    @abstractmethod
+    def listar_filas_turnos(self) -> Iterator[tuple[str, str, str, datetime, timedelta]]:
+        # (matricula, dni, especialidad, fecha_hora, duracion) SIN CONSTRUIR OBJETOS
+        ...
+
+# SERIES DE TURNOS
+
+    @abstractmethod
+    def guardar_serie(self, serie: SerieTurnos) -> None:
+        # ALTA O ACTUALIZACION (OCURRENCIAS EXCLUIDAS Y MATERIALIZADAS) DE LA SERIE CON ESA CLAVE
+        ...
+
+    @abstractmethod
+    def eliminar_serie(self, matricula: str, inicio: datetime) -> bool:
+        ...
+
+    @abstractmethod
+    def listar_series(self) -> Iterator[SerieTurnos]:
+        # ORDENADAS POR (matricula, inicio)
+        ...
+
+# HISTORIAS CLINICAS Y RECETAS
+
+    @abstractmethod
+    def guardar_historia(self, dni: str) -> None:
+        ...
+
+    @abstractmethod
+    def guardar_receta(self, receta: Receta) -> None:
+        ...
+
+    @abstractmethod
+    def cargar_historia(self, paciente: Paciente, buscar_medico: Callable[[str], Medico]) -> HistoriaClinica | None:
+        ...
+
+    def cerrar(self) -> None:
+        pass
@@ -0,0 +1,341 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.serie_turnos import SerieTurnos
+from src.receta import Receta
+from src.historia_clinica import HistoriaClinica
+from src.repositorio import RepositorioClinica
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS especialidades (
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    orden INTEGER NOT NULL,
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL,
+    PRIMARY KEY (matricula, orden)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    fecha_hora TEXT NOT NULL,
+    fin TEXT NOT NULL,
+    dni TEXT NOT NULL REFERENCES pacientes(dni),
+    especialidad TEXT NOT NULL,
+    UNIQUE (matricula, fecha_hora)
+);
+CREATE INDEX IF NOT EXISTS idx_turnos_dni ON turnos(dni);
+CREATE INDEX IF NOT EXISTS idx_turnos_fecha_hora ON turnos(fecha_hora);
+
+-- fin: EL DE LA ULTIMA OCURRENCIA, PARA DESCARTAR POR RANGO LAS SERIES QUE NO PUEDEN SUPERPONERSE
+CREATE TABLE IF NOT EXISTS series (
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    inicio TEXT NOT NULL,
+    fin TEXT NOT NULL,
+    dni TEXT NOT NULL REFERENCES pacientes(dni),
+    especialidad TEXT NOT NULL,
+    frecuencia TEXT NOT NULL,
+    cantidad INTEGER NOT NULL,
+    duracion REAL NOT NULL,
+    excluidas TEXT NOT NULL,
+    materializadas INTEGER NOT NULL,
+    PRIMARY KEY (matricula, inicio)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS historias (
+    dni TEXT PRIMARY KEY REFERENCES pacientes(dni)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes(dni),
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    medicamentos TEXT NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_dni ON recetas(dni);
+"""
+
+# CONSULTAS (TEXTO CONSTANTE: sqlite3 REUTILIZA LA SENTENCIA PREPARADA DE SU CACHE)
+SQL_GUARDAR_PACIENTE = "INSERT OR REPLACE INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+SQL_OBTENER_PACIENTE = "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni = ?"
+SQL_LISTAR_PACIENTES = "SELECT nombre, dni, fecha_nacimiento FROM pacientes ORDER BY dni"
+SQL_LISTAR_PACIENTES_DESDE = "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni > ? ORDER BY dni"
+SQL_GUARDAR_MEDICO = "INSERT OR REPLACE INTO medicos (matricula, nombre) VALUES (?, ?)"
+SQL_BORRAR_ESPECIALIDADES = "DELETE FROM especialidades WHERE matricula = ?"
+SQL_GUARDAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, orden, tipo, dias) VALUES (?, ?, ?, ?)"
+SQL_OBTENER_MEDICO = "SELECT nombre, matricula FROM medicos WHERE matricula = ?"
+SQL_LISTAR_MEDICOS = "SELECT nombre, matricula FROM medicos ORDER BY matricula"
+SQL_LISTAR_MEDICOS_DESDE = "SELECT nombre, matricula FROM medicos WHERE matricula > ? ORDER BY matricula"
+SQL_OBTENER_ESPECIALIDADES = "SELECT tipo, dias FROM especialidades WHERE matricula = ? ORDER BY orden"
+SQL_GUARDAR_TURNO = "INSERT INTO turnos (matricula, fecha_hora, fin, dni, especialidad) VALUES (?, ?, ?, ?, ?)"
+SQL_ELIMINAR_TURNO = "DELETE FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+SQL_EXISTE_TURNO = "SELECT 1 FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+# EL TURNO ANTERIOR MAS CERCANO (UN SOLO SALTO EN EL INDICE (matricula, fecha_hora)) DECIDE LA SUPERPOSICION
+SQL_TURNO_ANTERIOR = "SELECT fin FROM turnos WHERE matricula = ? AND fecha_hora < ? ORDER BY fecha_hora DESC LIMIT 1"
+SQL_TURNO_ANTERIOR_EXCEPTO = "SELECT fin FROM turnos WHERE matricula = ? AND fecha_hora < ? AND fecha_hora <> ? ORDER BY fecha_hora DESC LIMIT 1"
+# LOS QUE EMPIEZAN EN [desde, hasta); EL UNICO QUE PUEDE EMPEZAR ANTES Y SEGUIR OCUPANDO desde ES EL ANTERIOR
+SQL_INTERVALOS_TURNOS = "SELECT fecha_hora, fin FROM turnos WHERE matricula = ? AND fecha_hora >= ? AND fecha_hora < ? ORDER BY fecha_hora"
+SQL_INTERVALO_ANTERIOR = "SELECT fecha_hora, fin FROM turnos WHERE matricula = ? AND fecha_hora < ? ORDER BY fecha_hora DESC LIMIT 1"
+SQL_OBTENER_TURNO = "SELECT dni, matricula, fecha_hora, fin, especialidad FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+SQL_LISTAR_TURNOS = "SELECT dni, matricula, fecha_hora, fin, especialidad FROM turnos ORDER BY fecha_hora, matricula"
+# PAGINACION POR CLAVE: SE RETOMA DESPUES DEL ULTIMO TURNO ENTREGADO SIN RECORRER LOS ANTERIORES
+SQL_LISTAR_TURNOS_DESDE = "SELECT dni, matricula, fecha_hora, fin, especialidad FROM turnos WHERE (fecha_hora, matricula) > (?, ?) ORDER BY fecha_hora, matricula"
+SQL_TURNOS_POR_DNI = "SELECT dni, matricula, fecha_hora, fin, especialidad FROM turnos WHERE dni = ? ORDER BY fecha_hora"
+# RANGO SOBRE idx_turnos_fecha_hora (UN DIA ES [00:00, 00:00 DEL DIA SIGUIENTE))
+SQL_TURNOS_ENTRE = "SELECT dni, matricula, fecha_hora, fin, especialidad FROM turnos WHERE fecha_hora >= ? AND fecha_hora < ? ORDER BY fecha_hora, matricula"
+SQL_GUARDAR_SERIE = "INSERT OR REPLACE INTO series (matricula, inicio, fin, dni, especialidad, frecuencia, cantidad, duracion, excluidas, materializadas) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SQL_ELIMINAR_SERIE = "DELETE FROM series WHERE matricula = ? AND inicio = ?"
+SQL_LISTAR_SERIES = "SELECT dni, matricula, especialidad, inicio, frecuencia, cantidad, duracion, excluidas, materializadas FROM series ORDER BY matricula, inicio"
+# LAS SERIES DEL MEDICO CUYO RANGO [inicio, fin) CORTA AL INTERVALO; LA ARITMETICA DE SerieTurnos DECIDE
+SQL_SERIES_EN_RANGO = "SELECT dni, matricula, especialidad, inicio, frecuencia, cantidad, duracion, excluidas, materializadas FROM series WHERE matricula = ? AND inicio < ? AND fin > ?"
+SQL_GUARDAR_HISTORIA = "INSERT OR IGNORE INTO historias (dni) VALUES (?)"
+SQL_EXISTE_HISTORIA = "SELECT 1 FROM historias WHERE dni = ?"
+SQL_GUARDAR_RECETA = "INSERT INTO recetas (dni, matricula, medicamentos, fecha) VALUES (?, ?, ?, ?)"
+SQL_RECETAS_POR_DNI = "SELECT matricula, medicamentos, fecha FROM recetas WHERE dni = ? ORDER BY id"
+
+# LOS LISTADOS SE LEEN DE A TANDAS PARA NO RETENER EL CERROJO DURANTE TODO EL RECORRIDO
+TAMANO_TANDA = 500
+
+class RepositorioSQLite(RepositorioClinica):
+
+    def __init__(self, ruta: str):
+        self.__conexion = sqlite3.connect(ruta, check_same_thread=False)
+        if ruta != ":memory:":
+            self.__conexion.execute("PRAGMA journal_mode=WAL")
+            self.__conexion.execute("PRAGMA synchronous=NORMAL")
+        self.__conexion.execute("PRAGMA foreign_keys=ON")
+        self.__conexion.executescript(ESQUEMA)
+        # UNA SOLA CONEXION COMPARTIDA ENTRE HILOS: CADA OPERACION LA USA EN EXCLUSIVA
+        self.__cerrojo = threading.RLock()
+
+    def _consultar(self, sql: str, parametros: tuple = ()) -> Iterator[tuple]:
+        with self.__cerrojo:
+            cursor = self.__conexion.execute(sql, parametros)
+            filas = cursor.fetchmany(TAMANO_TANDA)
+        while filas:
+            yield from filas
+            with self.__cerrojo:
+                filas = cursor.fetchmany(TAMANO_TANDA)
+
+# PACIENTES
+
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.execute(SQL_GUARDAR_PACIENTE, (paciente.obtener_dni(), paciente.obtener_nombre(), paciente.obtener_fecha_de_nacimiento()))
+
+    def obtener_paciente(self, dni: str) -> Paciente | None:
+        with self.__cerrojo:
+            fila = self.__conexion.execute(SQL_OBTENER_PACIENTE, (dni,)).fetchone()
+        if fila is None:
+            return None
+        return Paciente(*fila)
+
+    def listar_pacientes(self, despues_de: str | None = None) -> Iterator[Paciente]:
+        if despues_de is None:
+            filas = self._consultar(SQL_LISTAR_PACIENTES)
+        else:
+            filas = self._consultar(SQL_LISTAR_PACIENTES_DESDE, (despues_de,))
+        for fila in filas:
+            yield Paciente(*fila)
+
+    def guardar_pacientes(self, pacientes: list[Paciente]) -> None:
+        # UNA SOLA TRANSACCION Y UNA SENTENCIA PREPARADA PARA TODO EL LOTE
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.executemany(SQL_GUARDAR_PACIENTE, [
+                (p.obtener_dni(), p.obtener_nombre(), p.obtener_fecha_de_nacimiento()) for p in pacientes
+            ])
+
+# MEDICOS
+
+    def guardar_medico(self, medico: Medico) -> None:
+        self.guardar_medicos([medico])
+
+    def guardar_medicos(self, medicos: list[Medico]) -> None:
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.executemany(SQL_GUARDAR_MEDICO, [(m.obtener_matricula(), m.obtener_nombre()) for m in medicos])
+            self.__conexion.executemany(SQL_BORRAR_ESPECIALIDADES, [(m.obtener_matricula(),) for m in medicos])
+            self.__conexion.executemany(SQL_GUARDAR_ESPECIALIDAD, [
+                (m.obtener_matricula(), orden, esp.obtener_especialidad(), ",".join(esp.obtener_dias()))
+                for m in medicos
+                for orden, esp in enumerate(m.obtener_especialidades())
+            ])
+
+    def obtener_medico(self, matricula: str) -> Medico | None:
+        with self.__cerrojo:
+            fila = self.__conexion.execute(SQL_OBTENER_MEDICO, (matricula,)).fetchone()
+        if fila is None:
+            return None
+        return self._construir_medico(*fila)
+
+    def listar_medicos(self, despues_de: str | None = None) -> Iterator[Medico]:
+        if despues_de is None:
+            filas = self._consultar(SQL_LISTAR_MEDICOS)
+        else:
+            filas = self._consultar(SQL_LISTAR_MEDICOS_DESDE, (despues_de,))
+        for fila in filas:
+            yield self._construir_medico(*fila)
+
+    def _construir_medico(self, nombre: str, matricula: str) -> Medico:
+        with self.__cerrojo:
+            filas = self.__conexion.execute(SQL_OBTENER_ESPECIALIDADES, (matricula,)).fetchall()
+        especialidades = [Especialidad(tipo, dias.split(",") if dias else []) for tipo, dias in filas]
+        return Medico(nombre, matricula, especialidades)
+
+# TURNOS
+
+    def guardar_turno(self, turno: Turno) -> None:
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.execute(SQL_GUARDAR_TURNO, (
+                turno.obtener_medico().obtener_matricula(),
+                turno.obtener_fecha_hora().isoformat(sep=" "),
+                turno.obtener_fin().isoformat(sep=" "),
+                turno.obtener_paciente().obtener_dni(),
+                turno.obtener_especialidad()
+            ))
+
+    def eliminar_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        with self.__cerrojo, self.__conexion:
+            return self.__conexion.execute(SQL_ELIMINAR_TURNO, (matricula, fecha_hora.isoformat(sep=" "))).rowcount > 0
+
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        with self.__cerrojo:
+            return self.__conexion.execute(SQL_EXISTE_TURNO, (matricula, fecha_hora.isoformat(sep=" "))).fetchone() is not None
+
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        with self.__cerrojo:
+            if excepto is None:
+                fila = self.__conexion.execute(SQL_TURNO_ANTERIOR, (matricula, fin.isoformat(sep=" "))).fetchone()
+            else:
+                fila = self.__conexion.execute(SQL_TURNO_ANTERIOR_EXCEPTO, (matricula, fin.isoformat(sep=" "), excepto.isoformat(sep=" "))).fetchone()
+            if fila is not None and datetime.fromisoformat(fila[0]) > inicio:
+                return True
+            filas = self.__conexion.execute(SQL_SERIES_EN_RANGO, (matricula, fin.isoformat(sep=" "), inicio.isoformat(sep=" "))).fetchall()
+        return any(self._construir_serie(*fila).superpone(inicio, fin, excepto) for fila in filas)
+
+    def listar_intervalos_turnos(self, matricula: str, desde: datetime, hasta: datetime) -> list[tuple[datetime, datetime]]:
+        with self.__cerrojo:
+            anterior = self.__conexion.execute(SQL_INTERVALO_ANTERIOR, (matricula, desde.isoformat(sep=" "))).fetchone()
+            filas = self.__conexion.execute(SQL_INTERVALOS_TURNOS, (matricula, desde.isoformat(sep=" "), hasta.isoformat(sep=" "))).fetchall()
+        if anterior is not None:
+            filas.insert(0, anterior)
+        intervalos = [(datetime.fromisoformat(inicio), datetime.fromisoformat(fin)) for inicio, fin in filas]
+        if intervalos and intervalos[0][1] <= desde:
+            del intervalos[0]
+        return intervalos
+
+    def obtener_turno(self, matricula: str, fecha_hora: datetime, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Turno | None:
+        with self.__cerrojo:
+            fila = self.__conexion.execute(SQL_OBTENER_TURNO, (matricula, fecha_hora.isoformat(sep=" "))).fetchone()
+        if fila is None:
+            return None
+        dni, matricula, fecha_hora, fin, especialidad = fila
+        return self._construir_turno(buscar_paciente(dni), buscar_medico(matricula), fecha_hora, fin, especialidad)
+
+    def listar_turnos(self, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico], despues_de: tuple[datetime, str] | None = None) -> Iterator[Turno]:
+        if despues_de is None:
+            filas = self._consultar(SQL_LISTAR_TURNOS)
+        else:
+            filas = self._consultar(SQL_LISTAR_TURNOS_DESDE, (despues_de[0].isoformat(sep=" "), despues_de[1]))
+        for dni, matricula, fecha_hora, fin, especialidad in filas:
+            yield self._construir_turno(buscar_paciente(dni), buscar_medico(matricula), fecha_hora, fin, especialidad)
+
+    def listar_turnos_por_dni(self, dni: str, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Iterator[Turno]:
+        for _, matricula, fecha_hora, fin, especialidad in self._consultar(SQL_TURNOS_POR_DNI, (dni,)):
+            yield self._construir_turno(buscar_paciente(dni), buscar_medico(matricula), fecha_hora, fin, especialidad)
+
+    def listar_turnos_entre(self, desde: datetime, hasta: datetime, buscar_paciente: Callable[[str], Paciente], buscar_medico: Callable[[str], Medico]) -> Iterator[Turno]:
+        for dni, matricula, fecha_hora, fin, especialidad in self._consultar(SQL_TURNOS_ENTRE, (desde.isoformat(sep=" "), hasta.isoformat(sep=" "))):
+            yield self._construir_turno(buscar_paciente(dni), buscar_medico(matricula), fecha_hora, fin, especialidad)
+
+    def listar_filas_turnos(self) -> Iterator[tuple[str, str, str, datetime, timedelta]]:
+        for dni, matricula, fecha_hora, fin, especialidad in self._consultar(SQL_LISTAR_TURNOS):
+            inicio = datetime.fromisoformat(fecha_hora)
+            yield matricula, dni, especialidad, inicio, datetime.fromisoformat(fin) - inicio
+
+    def _construir_turno(self, paciente: Paciente, medico: Medico, fecha_hora: str, fin: str, especialidad: str) -> Turno:
+        inicio = datetime.fromisoformat(fecha_hora)
+        return Turno(paciente, medico, inicio, especialidad, datetime.fromisoformat(fin) - inicio)
+
+# SERIES DE TURNOS
+
+    def guardar_serie(self, serie: SerieTurnos) -> None:
+        inicio = serie.obtener_inicio()
+        fin = serie.ocurrencia(serie.obtener_cantidad() - 1) + serie.obtener_duracion()
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.execute(SQL_GUARDAR_SERIE, (
+                serie.obtener_matricula(),
+                inicio.isoformat(sep=" "),
+                fin.isoformat(sep=" "),
+                serie.obtener_dni(),
+                serie.obtener_especialidad(),
+                serie.obtener_frecuencia(),
+                serie.obtener_cantidad(),
+                serie.obtener_duracion().total_seconds(),
+                json.dumps(sorted(serie.obtener_excluidas())),
+                serie.obtener_materializadas()
+            ))
+
+    def eliminar_serie(self, matricula: str, inicio: datetime) -> bool:
+        with self.__cerrojo, self.__conexion:
+            return self.__conexion.execute(SQL_ELIMINAR_SERIE, (matricula, inicio.isoformat(sep=" "))).rowcount > 0
+
+    def listar_series(self) -> Iterator[SerieTurnos]:
+        for fila in self._consultar(SQL_LISTAR_SERIES):
+            yield self._construir_serie(*fila)
+
+    def _construir_serie(self, dni: str, matricula: str, especialidad: str, inicio: str, frecuencia: str, cantidad: int, duracion: float, excluidas: str, materializadas: int) -> SerieTurnos:
+        serie = SerieTurnos(dni, matricula, especialidad, datetime.fromisoformat(inicio), frecuencia, cantidad=cantidad, duracion=timedelta(seconds=duracion), excluidas=json.loads(excluidas))
+        serie._avanzar(materializadas)
+        return serie
+
+# HISTORIAS CLINICAS Y RECETAS
+
+    def guardar_historia(self, dni: str) -> None:
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.execute(SQL_GUARDAR_HISTORIA, (dni,))
+
+    def guardar_receta(self, receta: Receta) -> None:
+        with self.__cerrojo, self.__conexion:
+            self.__conexion.execute(SQL_GUARDAR_RECETA, (
+                receta.obtener_paciente().obtener_dni(),
+                receta.obtener_medico().obtener_matricula(),
+                json.dumps(receta.obtener_medicamentos()),
+                receta.obtener_fecha().isoformat(sep=" ")
+            ))
+
+    def cargar_historia(self, paciente: Paciente, buscar_medico: Callable[[str], Medico]) -> HistoriaClinica | None:
+        dni = paciente.obtener_dni()
+        with self.__cerrojo:
+            if self.__conexion.execute(SQL_EXISTE_HISTORIA, (dni,)).fetchone() is None:
+                return None
+            filas_turnos = self.__conexion.execute(SQL_TURNOS_POR_DNI, (dni,)).fetchall()
+            filas_recetas = self.__conexion.execute(SQL_RECETAS_POR_DNI, (dni,)).fetchall()
+
+        historia = HistoriaClinica(paciente)
+        for _, matricula, fecha_hora, fin, especialidad in filas_turnos:
+            historia.agregar_turno(self._construir_turno(paciente, buscar_medico(matricula), fecha_hora, fin, especialidad))
+        for matricula, medicamentos, fecha in filas_recetas:
+            historia.agregar_receta(Receta(paciente, buscar_medico(matricula), json.loads(medicamentos), datetime.fromisoformat(fecha)))
+        return historia
+
+    def cerrar(self) -> None:
+        with self.__cerrojo:
+            self.__conexion.close()
@@ -0,0 +1,42 @@
+# MOTIVOS DE RECHAZO
+MEDICO_YA_REGISTRADO = "medico_ya_registrado"
+PACIENTE_YA_REGISTRADO = "paciente_ya_registrado"
+PACIENTE_NO_REGISTRADO = "paciente_no_registrado"
+MEDICO_NO_REGISTRADO = "medico_no_registrado"
+ESPECIALIDAD_NO_ATENDIDA = "especialidad_no_atendida"
+DIA_NO_DISPONIBLE = "dia_no_disponible"
+TURNO_OCUPADO = "turno_ocupado"
+DUPLICADO_EN_LOTE = "duplicado_en_lote"
+SUPERPUESTO_EN_LOTE = "superpuesto_en_lote"
+DATO_INVALIDO = "dato_invalido"
+SERIE_RECHAZADA = "serie_rechazada"
+TURNO_NO_ENCONTRADO = "turno_no_encontrado"
+YA_EN_LISTA_ESPERA = "ya_en_lista_espera"
+
+class ResultadoOperacion:
+
+    def __init__(self, exito: bool, mensaje: str, motivo: str | None = None, objeto: object | None = None):
+        self.__exito = exito
+        self.__mensaje = mensaje
+        self.__motivo = motivo
+        self.__objeto = objeto
+
+# GETTERS
+
+    def obtener_exito(self) -> bool:
+        return self.__exito
+
+    def obtener_mensaje(self) -> str:
+        return self.__mensaje
+
+    def obtener_motivo(self) -> str | None:
+        return self.__motivo
+
+    def obtener_objeto(self) -> object | None:
+        return self.__objeto
+
+    def __bool__(self) -> bool:
+        return self.__exito
+
+    def __str__(self) -> str:
+        return self.__mensaje
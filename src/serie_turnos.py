@@ -0,0 +1,141 @@
+import sys
+from datetime import datetime, date, timedelta
+from typing import Iterable, Iterator
+from src.turno import DURACION_TURNO_POR_DEFECTO
+
+FRECUENCIAS = {
+    "semanal": timedelta(weeks=1),
+    "quincenal": timedelta(weeks=2),
+}
+
+class SerieTurnos:
+
+    # UN TURNO QUE SE REPITE (MISMO MEDICO, DIA Y HORA) GUARDADO COMO REGLA: LAS OCURRENCIAS
+    # SE CALCULAN AL RECORRERLAS Y LOS Turno RECIEN SE CREAN AL MATERIALIZARLAS. LAS PRIMERAS
+    # materializadas YA SON TURNOS DE LA AGENDA; LAS excluidas QUEDARON SIN AGENDAR (ESTABAN OCUPADAS)
+    __slots__ = ("__dni", "__matricula", "__especialidad", "__inicio", "__frecuencia", "__intervalo", "__cantidad", "__duracion", "__excluidas", "__materializadas")
+
+    def __init__(self, dni: str, matricula: str, especialidad: str, inicio: datetime, frecuencia: str = "semanal", cantidad: int | None = None, hasta: date | None = None, duracion: timedelta = DURACION_TURNO_POR_DEFECTO, excluidas: Iterable[int] = ()):
+        if frecuencia not in FRECUENCIAS:
+            raise ValueError(f"Frecuencia desconocida: {frecuencia}. Opciones: {', '.join(FRECUENCIAS)}")
+        if (cantidad is None) == (hasta is None):
+            raise ValueError("La serie necesita una cantidad de ocurrencias o una fecha final (solo una de las dos).")
+        intervalo = FRECUENCIAS[frecuencia]
+        if duracion <= timedelta(0) or duracion > intervalo:
+            raise ValueError("La duración del turno debe ser positiva y menor que la frecuencia de la serie.")
+        if hasta is not None:
+            # hasta ES INCLUSIVE: LA ULTIMA OCURRENCIA PUEDE CAER ESE MISMO DIA
+            ultimo = datetime.combine(hasta, inicio.time())
+            cantidad = (ultimo - inicio) // intervalo + 1 if ultimo >= inicio else 0
+        if cantidad < 1:
+            raise ValueError("La serie debe tener al menos una ocurrencia.")
+
+        self.__dni = dni
+        self.__matricula = sys.intern(matricula)
+        self.__especialidad = sys.intern(especialidad)
+        self.__inicio = inicio
+        self.__frecuencia = frecuencia
+        self.__intervalo = intervalo
+        self.__cantidad = cantidad
+        self.__duracion = duracion
+        self.__excluidas = frozenset(i for i in excluidas if 0 <= i < cantidad)
+        self.__materializadas = 0
+
+# GETTERS
+
+    def obtener_dni(self) -> str:
+        return self.__dni
+
+    def obtener_matricula(self) -> str:
+        return self.__matricula
+
+    def obtener_especialidad(self) -> str:
+        return self.__especialidad
+
+    def obtener_inicio(self) -> datetime:
+        return self.__inicio
+
+    def obtener_frecuencia(self) -> str:
+        return self.__frecuencia
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad
+
+    def obtener_duracion(self) -> timedelta:
+        return self.__duracion
+
+    def obtener_excluidas(self) -> frozenset[int]:
+        return self.__excluidas
+
+    def obtener_materializadas(self) -> int:
+        return self.__materializadas
+
+    def obtener_clave(self) -> tuple[str, datetime]:
+        # UN MEDICO NO PUEDE TENER DOS SERIES QUE EMPIECEN A LA MISMA HORA
+        return (self.__matricula, self.__inicio)
+
+    def excluyendo(self, indices: Iterable[int]) -> "SerieTurnos":
+        # LA MISMA REGLA SIN ALGUNAS OCURRENCIAS (LAS QUE NO SE PUDIERON AGENDAR)
+        return SerieTurnos(self.__dni, self.__matricula, self.__especialidad, self.__inicio, self.__frecuencia, cantidad=self.__cantidad, duracion=self.__duracion, excluidas=self.__excluidas.union(indices))
+
+# OCURRENCIAS
+
+    def ocurrencia(self, indice: int) -> datetime:
+        if not 0 <= indice < self.__cantidad:
+            raise IndexError("La serie no tiene esa ocurrencia.")
+        return self.__inicio + indice * self.__intervalo
+
+    def fechas(self) -> Iterator[datetime]:
+        # TODAS LAS OCURRENCIAS DE LA REGLA, INCLUIDAS LAS EXCLUIDAS, SIN ARMAR UNA LISTA
+        fecha = self.__inicio
+        for _ in range(self.__cantidad):
+            yield fecha
+            fecha += self.__intervalo
+
+    def pendientes(self, limite: int | None = None) -> Iterator[tuple[int, datetime]]:
+        # (INDICE, FECHA) DE LAS OCURRENCIAS AUN NO MATERIALIZADAS NI EXCLUIDAS, CON INDICE MENOR A limite
+        limite = self.__cantidad if limite is None else min(limite, self.__cantidad)
+        for indice in range(self.__materializadas, limite):
+            if indice not in self.__excluidas:
+                yield indice, self.__inicio + indice * self.__intervalo
+
+    def ocurrencias_antes_de(self, fecha: datetime) -> int:
+        # CUANTAS OCURRENCIAS EMPIEZAN ANTES DE fecha (SIN RECORRERLAS)
+        return max(0, min(self.__cantidad, -((self.__inicio - fecha) // self.__intervalo)))
+
+    def cantidad_pendientes(self) -> int:
+        excluidas = sum(1 for i in self.__excluidas if i >= self.__materializadas)
+        return self.__cantidad - self.__materializadas - excluidas
+
+    def contiene(self, fecha_hora: datetime) -> bool:
+        # ALGUNA OCURRENCIA PENDIENTE EMPIEZA EXACTAMENTE EN fecha_hora
+        indice, resto = divmod(fecha_hora - self.__inicio, self.__intervalo)
+        return not resto and self.__materializadas <= indice < self.__cantidad and indice not in self.__excluidas
+
+    def superpone(self, inicio: datetime, fin: datetime, excepto: datetime | None = None) -> bool:
+        # ARITMETICA EN LUGAR DE RECORRER: LAS OCURRENCIAS j CON inicio_j < fin Y fin_j > inicio
+        # SON UN RANGO CONTIGUO DE INDICES, QUE SE RECORTA A LAS PENDIENTES. excepto NO CUENTA
+        desde = max(self.__materializadas, (inicio - self.__inicio - self.__duracion) // self.__intervalo + 1)
+        hasta = min(self.__cantidad - 1, -((self.__inicio - fin) // self.__intervalo) - 1)
+        return any(
+            j not in self.__excluidas and (excepto is None or self.__inicio + j * self.__intervalo != excepto)
+            for j in range(desde, hasta + 1)
+        )
+
+    def _excluir(self, fecha_hora: datetime) -> None:
+        # SOLO CLINICA, CON EL CERROJO DEL MEDICO: UNA OCURRENCIA CANCELADA DEJA DE OCUPAR SU HORARIO
+        indice = (fecha_hora - self.__inicio) // self.__intervalo
+        self.__excluidas = self.__excluidas | {indice}
+
+    def _avanzar(self, materializadas: int) -> None:
+        # SOLO CLINICA, CON EL CERROJO DEL MEDICO: LAS PRIMERAS materializadas YA SON TURNOS
+        self.__materializadas = max(self.__materializadas, min(materializadas, self.__cantidad))
+
+    def __len__(self) -> int:
+        return self.__cantidad
+
+    def __str__(self) -> str:
+        return (
+            f"Serie {self.__frecuencia} de {self.__especialidad} con {self.__matricula} para el DNI {self.__dni}: "
+            f"{self.__cantidad} turnos desde {self.__inicio.strftime('%d/%m/%Y %H:%M')}, {self.__materializadas} materializados"
+        )
@@ -0,0 +1,219 @@
+import gc
+import io
+import os
+import pickle
+import threading
+import zlib
+from datetime import datetime, timedelta
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+from src.historia_clinica import HistoriaClinica
+from src.bitacora import Bitacora
+from src.serie_turnos import SerieTurnos
+from src.excepciones import SnapshotInvalidoException
+
+# FORMATO: MAGIA + VERSION (1 BYTE) + PICKLE COMPRIMIDO CON ZLIB QUE SOLO CONTIENE
+# TUPLAS, LISTAS, TEXTO Y ENTEROS. LOS TURNOS Y RECETAS REFERENCIAN A PACIENTES
+# Y MEDICOS POR DNI / MATRICULA, Y LAS HISTORIAS A LOS TURNOS POR POSICION. LAS SERIES
+# DE TURNOS SE GUARDAN COMO REGLA, CON CUANTAS OCURRENCIAS YA SE MATERIALIZARON.
+MAGIA = b"CLINICA-SNAPSHOT"
+VERSION = 3
+
+EPOCA = datetime(1970, 1, 1)
+MICROSEGUNDO = timedelta(microseconds=1)
+
+def _a_micros(fecha: datetime) -> int:
+    return (fecha - EPOCA) // MICROSEGUNDO
+
+def _desde_micros(micros: int) -> datetime:
+    return EPOCA + timedelta(microseconds=micros)
+
+class _LectorSeguro(pickle.Unpickler):
+
+    # EL SNAPSHOT SOLO TIENE TIPOS BASICOS: CUALQUIER CLASE ES UN ARCHIVO ADULTERADO
+    def find_class(self, modulo: str, nombre: str):
+        raise SnapshotInvalidoException(f"El snapshot referencia un tipo no permitido: {modulo}.{nombre}")
+
+# GUARDAR
+
+def guardar_snapshot(clinica: Clinica, ruta: str, nivel_compresion: int = 1) -> None:
+    # SE RECORREN COPIAS DE LAS COLECCIONES (list() SOBRE UN dict NO LIBERA EL GIL): UN ALTA
+    # CONCURRENTE NO ROMPE EL RECORRIDO. PARA UN ESTADO CONSISTENTE CON LA BITACORA, compactar_bitacora
+    pacientes = [
+        (p.obtener_nombre(), p.obtener_dni(), p.obtener_fecha_de_nacimiento())
+        for p in list(clinica.obtener_pacientes_dict().values())
+    ]
+    medicos = [
+        (m.obtener_nombre(), m.obtener_matricula(), [(e.obtener_especialidad(), e.obtener_dias()) for e in m.obtener_especialidades()])
+        for m in list(clinica.obtener_medicos_dict().values())
+    ]
+
+    # TABLA UNICA DE TURNOS: LOS DE LA AGENDA Y LOS QUE SOLO ESTAN EN UNA HISTORIA
+    turnos = []
+    posiciones: dict[int, int] = {}
+
+    def _registrar(turno: Turno, en_agenda: bool) -> int:
+        posicion = posiciones.get(id(turno))
+        if posicion is None:
+            posicion = len(turnos)
+            posiciones[id(turno)] = posicion
+            turnos.append((
+                turno.obtener_paciente().obtener_dni(),
+                turno.obtener_medico().obtener_matricula(),
+                _a_micros(turno.obtener_fecha_hora()),
+                turno.obtener_especialidad(),
+                turno.obtener_duracion() // MICROSEGUNDO,
+                en_agenda
+            ))
+        return posicion
+
+    for turno in clinica.obtener_turnos():
+        _registrar(turno, True)
+
+    historias = []
+    for dni, historia in list(clinica.obtener_historias_clinicas_dict().items()):
+        historias.append((
+            dni,
+            [_registrar(t, False) for t in historia.obtener_turnos()],
+            [(r.obtener_medico().obtener_matricula(), r.obtener_medicamentos(), _a_micros(r.obtener_fecha())) for r in historia.obtener_recetas()]
+        ))
+
+    series = [
+        (
+            s.obtener_dni(), s.obtener_matricula(), s.obtener_especialidad(), _a_micros(s.obtener_inicio()), s.obtener_frecuencia(),
+            s.obtener_cantidad(), s.obtener_duracion() // MICROSEGUNDO, sorted(s.obtener_excluidas()), s.obtener_materializadas()
+        )
+        for s in clinica.obtener_series()
+    ]
+
+    datos = zlib.compress(pickle.dumps((pacientes, medicos, turnos, historias, series), protocol=pickle.HIGHEST_PROTOCOL), nivel_compresion)
+
+    # ESCRITURA ATOMICA: NUNCA QUEDA UN SNAPSHOT A MEDIO ESCRIBIR
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(MAGIA)
+        archivo.write(bytes([VERSION]))
+        archivo.write(datos)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+# CARGAR
+
+def cargar_snapshot(ruta: str, **opciones_clinica) -> Clinica:
+    with open(ruta, "rb") as archivo:
+        contenido = archivo.read()
+
+    if not contenido.startswith(MAGIA):
+        raise SnapshotInvalidoException("El archivo no es un snapshot de la clínica")
+    version = contenido[len(MAGIA)]
+    if version != VERSION:
+        raise SnapshotInvalidoException(f"Versión de snapshot no soportada: {version}")
+
+    try:
+        datos = zlib.decompress(contenido[len(MAGIA) + 1:])
+        filas_pacientes, filas_medicos, filas_turnos, filas_historias, filas_series = _LectorSeguro(io.BytesIO(datos)).load()
+    except (zlib.error, pickle.UnpicklingError, ValueError, EOFError) as error:
+        raise SnapshotInvalidoException(f"Snapshot dañado: {error}") from error
+
+    # EL RECOLECTOR DE CICLOS SE PAUSA: CREAR MILLONES DE OBJETOS SIN CICLOS LO DISPARA EN VANO
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        return _reconstruir(filas_pacientes, filas_medicos, filas_turnos, filas_historias, filas_series, opciones_clinica)
+    finally:
+        if gc_activo:
+            gc.enable()
+
+def _reconstruir(filas_pacientes, filas_medicos, filas_turnos, filas_historias, filas_series, opciones_clinica) -> Clinica:
+    # LOS DATOS YA FUERON VALIDADOS AL CREARSE: SE RECONSTRUYEN SIN REVALIDAR
+    pacientes = {dni: Paciente._desde_datos_validados(nombre, dni, fecha) for nombre, dni, fecha in filas_pacientes}
+    medicos = {
+        matricula: Medico._desde_datos_validados(nombre, matricula, [Especialidad(tipo, list(dias)) for tipo, dias in especialidades])
+        for nombre, matricula, especialidades in filas_medicos
+    }
+
+    # LAS FECHAS REPETIDAS (MISMO HORARIO EN DISTINTOS MEDICOS) SE CONSTRUYEN UNA VEZ
+    fechas: dict[int, datetime] = {}
+    turnos = []
+    en_agenda = []
+    duraciones: dict[int, timedelta] = {}
+    for dni, matricula, micros, especialidad, micros_duracion, agendado in filas_turnos:
+        fecha_hora = fechas.get(micros)
+        if fecha_hora is None:
+            fecha_hora = fechas[micros] = _desde_micros(micros)
+        duracion = duraciones.get(micros_duracion)
+        if duracion is None:
+            duracion = duraciones[micros_duracion] = timedelta(microseconds=micros_duracion)
+        turno = Turno(pacientes[dni], medicos[matricula], fecha_hora, especialidad, duracion)
+        turnos.append(turno)
+        if agendado:
+            en_agenda.append(turno)
+
+    historias = {}
+    for dni, posiciones, recetas in filas_historias:
+        paciente = pacientes[dni]
+        historia = HistoriaClinica(paciente)
+        for posicion in posiciones:
+            historia.agregar_turno(turnos[posicion])
+        for matricula, medicamentos, micros in recetas:
+            historia.agregar_receta(Receta(paciente, medicos[matricula], medicamentos, _desde_micros(micros)))
+        historias[dni] = historia
+
+    # LA CLINICA CONSTRUYE SUS INDICES EN UNA SOLA PASADA SOBRE LOS TURNOS
+    clinica = Clinica(medicos, pacientes, en_agenda, historias, **opciones_clinica)
+    for dni, matricula, especialidad, micros, frecuencia, cantidad, micros_duracion, excluidas, materializadas in filas_series:
+        serie = SerieTurnos(dni, matricula, especialidad, _desde_micros(micros), frecuencia, cantidad=cantidad, duracion=timedelta(microseconds=micros_duracion), excluidas=excluidas)
+        serie._avanzar(materializadas)
+        clinica._aplicar_serie(serie)
+    return clinica
+
+# COMPACTAR
+
+def compactar_bitacora(clinica: Clinica, bitacora: Bitacora, ruta: str) -> None:
+    # EL SNAPSHOT ABSORBE TODO LO REGISTRADO Y RECIEN ENTONCES SE VACIA LA BITACORA. LAS ESCRITURAS
+    # SE DETIENEN DURANTE TODA LA SECUENCIA: NINGUN REGISTRO PUEDE ENTRAR A LA BITACORA DESPUES DE
+    # LA FOTO Y PERDERSE AL TRUNCAR. PRIMERO LOS CERROJOS DE LA CLINICA (QUIEN ESCRIBE YA TIENE EL
+    # SUYO CUANDO PIDE EL DE LA BITACORA) Y DESPUES EL DE LA BITACORA
+    with clinica.escrituras_detenidas(), bitacora.exclusiva():
+        bitacora.sincronizar()
+        guardar_snapshot(clinica, ruta)
+        bitacora.truncar()
+
+def compactar_si_hace_falta(clinica: Clinica, bitacora: Bitacora, ruta: str) -> bool:
+    # COMPACTA SOLO SI LA BITACORA SUPERO SU UMBRAL DE REGISTROS
+    if not bitacora.necesita_compactacion():
+        return False
+    compactar_bitacora(clinica, bitacora, ruta)
+    return True
+
+class CompactadorPeriodico:
+
+    # HILO DE FONDO QUE CADA intervalo SEGUNDOS REVISA EL UMBRAL DE LA BITACORA Y COMPACTA SI HACE FALTA
+    def __init__(self, clinica: Clinica, bitacora: Bitacora, ruta: str, intervalo: float = 60.0):
+        self.__clinica = clinica
+        self.__bitacora = bitacora
+        self.__ruta = ruta
+        self.__intervalo = intervalo
+        self.__detener = threading.Event()
+        self.__hilo: threading.Thread | None = None
+
+    def iniciar(self) -> None:
+        if self.__hilo is None:
+            self.__detener.clear()
+            self.__hilo = threading.Thread(target=self._recorrer, name="compactador-bitacora", daemon=True)
+            self.__hilo.start()
+
+    def detener(self) -> None:
+        if self.__hilo is not None:
+            self.__detener.set()
+            self.__hilo.join()
+            self.__hilo = None
+
+    def _recorrer(self) -> None:
+        while not self.__detener.wait(self.__intervalo):
+            compactar_si_hace_falta(self.__clinica, self.__bitacora, self.__ruta)
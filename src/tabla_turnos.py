@@ -0,0 +1,183 @@
+import threading
+from array import array
+from collections import Counter
+from datetime import datetime, date, timedelta
+from itertools import compress
+from src.turno import Turno
+
+# NUMPY ES OPCIONAL: SIN EL, LOS CONTEOS USAN Counter SOBRE LOS MISMOS BUFFERS
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EPOCA = datetime(1970, 1, 1)
+MINUTO = timedelta(minutes=1)
+MINUTOS_POR_DIA = 24 * 60
+
+def a_minutos(fecha_hora: datetime) -> int:
+    return (fecha_hora - EPOCA) // MINUTO
+
+def desde_minutos(minutos: int) -> datetime:
+    return EPOCA + timedelta(minutes=minutos)
+
+def _vista(columna: array):
+    # VISTA SIN COPIA DE VIDA CORTA: MIENTRAS EXISTA, EL array NO PUEDE CRECER.
+    # np.frombuffer NO ACEPTA BUFFERS VACIOS
+    if not len(columna):
+        return np.empty(0, dtype=columna.typecode)
+    return np.frombuffer(columna, dtype=columna.typecode)
+
+class CodificadorTexto:
+
+    # TEXTO <-> CODIGO ENTERO DENSO (0, 1, 2, ...) EN ORDEN DE APARICION
+    def __init__(self):
+        self.__codigos: dict[str, int] = {}
+        self.__textos: list[str] = []
+
+    def codificar(self, texto: str) -> int:
+        codigo = self.__codigos.get(texto)
+        if codigo is None:
+            codigo = self.__codigos[texto] = len(self.__textos)
+            self.__textos.append(texto)
+        return codigo
+
+    def obtener_codigo(self, texto: str) -> int | None:
+        return self.__codigos.get(texto)
+
+    def obtener_texto(self, codigo: int) -> str:
+        return self.__textos[codigo]
+
+    def obtener_textos(self) -> list[str]:
+        return list(self.__textos)
+
+    def __len__(self) -> int:
+        return len(self.__textos)
+
+class TablaTurnos:
+
+    # UNA COLUMNA POR ATRIBUTO, UNA FILA POR TURNO. LAS FILAS NUNCA SE BORRAN:
+    # UN TURNO DADO DE BAJA QUEDA CON activo = 0
+    def __init__(self):
+        self.__medicos = CodificadorTexto()
+        self.__pacientes = CodificadorTexto()
+        self.__especialidades = CodificadorTexto()
+
+        self.__medico = array("i")
+        self.__paciente = array("i")
+        self.__especialidad = array("i")
+        self.__inicio = array("q")
+        self.__duracion = array("i")
+        self.__activo = array("B")
+        # (CODIGO DE MEDICO, MINUTOS) -> FILA DEL TURNO ACTIVO: DAR DE BAJA UN TURNO ES O(1)
+        self.__posiciones: dict[tuple[int, int], int] = {}
+        # LAS COLUMNAS CRECEN JUNTAS: UN SOLO CERROJO PARA AGREGAR, DAR DE BAJA Y LEER
+        # (UNA VISTA NUMPY VIVA TAMBIEN IMPIDE QUE UN array CREZCA)
+        self.__cerrojo = threading.Lock()
+
+# AGREGAR
+
+    def agregar(self, turno: Turno) -> int:
+        return self.agregar_fila(
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_paciente().obtener_dni(),
+            turno.obtener_especialidad(),
+            turno.obtener_fecha_hora(),
+            turno.obtener_duracion()
+        )
+
+    def agregar_fila(self, matricula: str, dni: str, especialidad: str, fecha_hora: datetime, duracion: timedelta) -> int:
+        minutos = a_minutos(fecha_hora)
+        with self.__cerrojo:
+            posicion = len(self.__activo)
+            codigo = self.__medicos.codificar(matricula)
+            self.__posiciones[(codigo, minutos)] = posicion
+            self.__medico.append(codigo)
+            self.__paciente.append(self.__pacientes.codificar(dni))
+            self.__especialidad.append(self.__especialidades.codificar(especialidad))
+            self.__inicio.append(minutos)
+            self.__duracion.append(duracion // MINUTO)
+            self.__activo.append(1)
+        return posicion
+
+    def desactivar(self, posicion: int) -> None:
+        with self.__cerrojo:
+            self.__activo[posicion] = 0
+            clave = (self.__medico[posicion], self.__inicio[posicion])
+            if self.__posiciones.get(clave) == posicion:
+                del self.__posiciones[clave]
+
+    def desactivar_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        codigo = self.__medicos.obtener_codigo(matricula)
+        if codigo is None:
+            return False
+        with self.__cerrojo:
+            posicion = self.__posiciones.pop((codigo, a_minutos(fecha_hora)), None)
+            if posicion is None:
+                return False
+            self.__activo[posicion] = 0
+        return True
+
+# OBTENER
+
+    def obtener_columnas(self) -> dict:
+        # COPIA DE CADA COLUMNA (UN memcpy): ARREGLOS NUMPY SI ESTA DISPONIBLE, SINO array
+        columnas = {
+            "medico": self.__medico,
+            "paciente": self.__paciente,
+            "especialidad": self.__especialidad,
+            "inicio": self.__inicio,
+            "duracion": self.__duracion,
+            "activo": self.__activo
+        }
+        with self.__cerrojo:
+            if np is not None:
+                return {nombre: _vista(columna).copy() for nombre, columna in columnas.items()}
+            return {nombre: array(columna.typecode, columna) for nombre, columna in columnas.items()}
+
+    def obtener_medicos(self) -> CodificadorTexto:
+        return self.__medicos
+
+    def obtener_pacientes(self) -> CodificadorTexto:
+        return self.__pacientes
+
+    def obtener_especialidades(self) -> CodificadorTexto:
+        return self.__especialidades
+
+    def cantidad_activos(self) -> int:
+        with self.__cerrojo:
+            return self.__activo.count(1)
+
+    def __len__(self) -> int:
+        return len(self.__activo)
+
+# CONTAR
+
+    def contar_por_medico(self) -> dict[str, int]:
+        return self._contar_codigos(self.__medico, self.__medicos)
+
+    def contar_por_paciente(self) -> dict[str, int]:
+        return self._contar_codigos(self.__paciente, self.__pacientes)
+
+    def contar_por_especialidad(self) -> dict[str, int]:
+        return self._contar_codigos(self.__especialidad, self.__especialidades)
+
+    def contar_por_dia(self) -> dict[date, int]:
+        inicio_epoca = EPOCA.date()
+        with self.__cerrojo:
+            if np is not None:
+                dias, conteos = np.unique(_vista(self.__inicio)[_vista(self.__activo) != 0] // MINUTOS_POR_DIA, return_counts=True)
+                pares = zip(dias.tolist(), conteos.tolist())
+            else:
+                pares = sorted(Counter(minuto // MINUTOS_POR_DIA for minuto in compress(self.__inicio, self.__activo)).items())
+        return {inicio_epoca + timedelta(days=dia): cantidad for dia, cantidad in pares}
+
+    def _contar_codigos(self, columna: array, codificador: CodificadorTexto) -> dict[str, int]:
+        with self.__cerrojo:
+            if np is not None:
+                conteos = np.bincount(_vista(columna)[_vista(self.__activo) != 0], minlength=len(codificador)).tolist()
+            else:
+                conteos = [0] * len(codificador)
+                for codigo, cantidad in Counter(compress(columna, self.__activo)).items():
+                    conteos[codigo] = cantidad
+        return {codificador.obtener_texto(codigo): cantidad for codigo, cantidad in enumerate(conteos) if cantidad}
@@ -1,15 +1,25 @@
-import datetime
+import sys
+from datetime import datetime, timedelta
 from src.medico import Medico
 from src.paciente import Paciente
 from src.especialidad import Especialidad
+from src.renderizado import texto_turno
+
+DURACION_TURNO_POR_DEFECTO = timedelta(minutes=30)
 
 class Turno:
 
-    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str):
+    __slots__ = ("__paciente", "__medico", "__fecha_hora", "__especialidad", "__duracion")
+
+    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str, duracion: timedelta = DURACION_TURNO_POR_DEFECTO):
+        if duracion <= timedelta(0):
+            raise ValueError("La duración del turno debe ser positiva.")
+
         self.__paciente = paciente
         self.__medico = medico
         self.__fecha_hora = fecha_hora
-        self.__especialidad = especialidad
+        self.__especialidad = sys.intern(especialidad)
+        self.__duracion = duracion
 
     def obtener_medico(self) -> Medico:
         return self.__medico
@@ -19,13 +29,15 @@ class Turno:
 
     def obtener_fecha_hora(self) -> datetime:
         return self.__fecha_hora
+
+    def obtener_especialidad(self) -> str:
+        return self.__especialidad
+
+    def obtener_duracion(self) -> timedelta:
+        return self.__duracion
+
+    def obtener_fin(self) -> datetime:
+        return self.__fecha_hora + self.__duracion
     
     def __str__(self) -> str:
-        return (
-            f"Turno(\n"
-            f"  Paciente: {self.__paciente},\n"
-            f"  Médico: {self.__medico},\n"
-            f"  Especialidad: {self.__especialidad},\n"
-            f"  Fecha y hora: {self.__fecha_hora.strftime('%Y-%m-%d %H:%M')}\n"
-            f")"
-        )
\ No newline at end of file
+        return texto_turno(self)
\ No newline at end of file
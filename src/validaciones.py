@@ -0,0 +1,52 @@
+import re
+from typing import Iterable
+from src.excepciones import DNIInvalidoException, MatriculaInvalidaException
+
+# PATRONES COMPILADOS UNA SOLA VEZ (SIN PASAR POR LA CACHE DEL MODULO re EN CADA LLAMADA)
+PATRON_SEPARADORES_DNI = re.compile(r"[.\s]")
+PATRON_DNI = re.compile(r"\d{7,8}")
+PATRON_MATRICULA = re.compile(r"M[NP]\d{4,6}")
+
+# DNI
+
+def normalizar_dni(dni: str) -> str:
+    if not dni:
+        raise DNIInvalidoException("El DNI no puede estar vacío")
+
+    # CAMINO RAPIDO: YA VIENE NORMALIZADO (SOLO DIGITOS), SIN REGEX NI COPIAS
+    if 7 <= len(dni) <= 8 and dni.isdecimal():
+        return dni
+
+    dni_limpio = PATRON_SEPARADORES_DNI.sub("", dni)
+    if PATRON_DNI.fullmatch(dni_limpio) is None:
+        raise DNIInvalidoException("DNI inválido. Debe tener 7-8 dígitos")
+    return dni_limpio
+
+def validar_dnis(dnis: Iterable[str]) -> list[str | None]:
+    # UN RESULTADO POR DNI, EN EL MISMO ORDEN: EL DNI NORMALIZADO O None SI ES INVALIDO
+    resultados = []
+    agregar = resultados.append
+    for dni in dnis:
+        if dni and 7 <= len(dni) <= 8 and dni.isdecimal():
+            agregar(dni)
+            continue
+        try:
+            agregar(normalizar_dni(dni))
+        except DNIInvalidoException:
+            agregar(None)
+    return resultados
+
+# MATRICULA
+
+def normalizar_matricula(matricula: str) -> str:
+    if not matricula:
+        raise MatriculaInvalidaException("La matrícula no puede estar vacía")
+
+    # CAMINO RAPIDO: "MN"/"MP" EN MAYUSCULAS SEGUIDO DE 4 A 6 DIGITOS
+    if 6 <= len(matricula) <= 8 and matricula[0] == "M" and matricula[1] in "NP" and matricula[2:].isdecimal():
+        return matricula
+
+    matricula_limpia = matricula.strip().upper()
+    if PATRON_MATRICULA.fullmatch(matricula_limpia) is None:
+        raise MatriculaInvalidaException("Matrícula inválida. Formato: MN##### o MP##### (4-6 dígitos)")
+    return matricula_limpia
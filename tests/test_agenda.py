@@ -0,0 +1,142 @@
+import unittest
+from datetime import datetime, date, timedelta
+from src.agenda import AgendaTurnos
+from src.turno import Turno
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.excepciones import TurnoOcupadoException
+
+
+class TestAgendaTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.especialidad = Especialidad("cardiologia", ["lunes", "miercoles"])
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [self.especialidad])
+        self.paciente1 = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.paciente2 = Paciente("Maria Gonzalez", "87654321", "20/10/1975")
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+        self.turno = Turno(self.paciente1, self.medico, self.fecha, "cardiologia")
+
+    def test_agenda_vacia(self):
+        agenda = AgendaTurnos()
+        self.assertEqual(len(agenda), 0)
+        self.assertFalse(agenda.existe("MN1234", self.fecha))
+
+    def test_agregar_turno(self):
+        agenda = AgendaTurnos()
+        agenda.agregar(self.turno)
+        self.assertTrue(agenda.existe("MN1234", self.fecha))
+        self.assertEqual(agenda.obtener("MN1234", self.fecha), self.turno)
+        self.assertEqual(len(agenda), 1)
+
+    def test_agregar_turno_duplicado_error(self):
+        agenda = AgendaTurnos([self.turno])
+        duplicado = Turno(self.paciente2, self.medico, self.fecha, "cardiologia")
+        with self.assertRaises(TurnoOcupadoException):
+            agenda.agregar(duplicado)
+        self.assertEqual(len(agenda), 1)
+
+    def test_agregar_turno_superpuesto_error(self):
+        agenda = AgendaTurnos([self.turno])
+        superpuesto = Turno(self.paciente2, self.medico, datetime(2025, 6, 16, 10, 5), "cardiologia")
+        with self.assertRaises(TurnoOcupadoException):
+            agenda.agregar(superpuesto)
+
+    def test_turnos_contiguos_no_se_superponen(self):
+        agenda = AgendaTurnos([self.turno])
+        contiguo = Turno(self.paciente2, self.medico, datetime(2025, 6, 16, 10, 30), "cardiologia")
+        agenda.agregar(contiguo)
+        self.assertEqual(len(agenda), 2)
+
+    def test_superpone(self):
+        agenda = AgendaTurnos([Turno(self.paciente1, self.medico, self.fecha, "cardiologia", timedelta(hours=1))])
+        self.assertTrue(agenda.superpone("MN1234", datetime(2025, 6, 16, 10, 50), datetime(2025, 6, 16, 11, 20)))
+        self.assertTrue(agenda.superpone("MN1234", datetime(2025, 6, 16, 9, 45), datetime(2025, 6, 16, 10, 15)))
+        self.assertFalse(agenda.superpone("MN1234", datetime(2025, 6, 16, 11, 0), datetime(2025, 6, 16, 11, 30)))
+        self.assertFalse(agenda.superpone("MP5678", self.fecha, datetime(2025, 6, 16, 11, 0)))
+
+    def test_quitar_libera_el_horario_en_todos_los_indices(self):
+        agenda = AgendaTurnos([self.turno])
+        self.assertIs(agenda.quitar("MN1234", self.fecha), self.turno)
+        self.assertIsNone(agenda.quitar("MN1234", self.fecha))
+        self.assertFalse(agenda.existe("MN1234", self.fecha))
+        self.assertFalse(agenda.superpone("MN1234", self.fecha, self.fecha + timedelta(minutes=30)))
+        self.assertEqual(agenda.obtener_por_dni("12345678"), [])
+        self.assertEqual(agenda.obtener_por_fecha(self.fecha.date()), [])
+        self.assertEqual(list(agenda.iterar()), [])
+        agenda.agregar(Turno(self.paciente2, self.medico, self.fecha, "cardiologia"))
+        self.assertEqual(len(agenda), 1)
+
+    def test_iterar_en_orden_cronologico_entre_dias_y_medicos(self):
+        otro_medico = Medico("Dra. Ana Ruiz", "MN0001", [self.especialidad])
+        fechas = [self.fecha + timedelta(days=d, hours=h) for d in (9, 0, 2) for h in (3, 0, 1)]
+        agenda = AgendaTurnos()
+        for fecha in fechas:
+            agenda.agregar(Turno(self.paciente1, self.medico, fecha, "cardiologia"))
+            agenda.agregar(Turno(self.paciente2, otro_medico, fecha, "cardiologia"))
+        esperado = sorted((fecha, matricula) for fecha in fechas for matricula in ("MN0001", "MN1234"))
+
+        recorrido = [(t.obtener_fecha_hora(), t.obtener_medico().obtener_matricula()) for t in agenda.iterar()]
+        self.assertEqual(recorrido, esperado)
+
+        # RETOMAR DESDE UN CURSOR DESPUES DE CAMBIOS EN SU DIA Y EN UNO YA ORDENADO
+        cursor = esperado[3]
+        agenda.quitar(esperado[4][1], esperado[4][0])
+        agenda.agregar(Turno(self.paciente1, self.medico, self.fecha + timedelta(days=2, hours=5), "cardiologia"))
+        agenda.quitar(esperado[-1][1], esperado[-1][0])
+        esperado = sorted(esperado[5:-1] + [(self.fecha + timedelta(days=2, hours=5), "MN1234")])
+        self.assertEqual([(t.obtener_fecha_hora(), t.obtener_medico().obtener_matricula()) for t in agenda.iterar(cursor)], esperado)
+
+    def test_superpone_excepto(self):
+        agenda = AgendaTurnos([self.turno])
+        corrido = datetime(2025, 6, 16, 10, 15)
+        self.assertTrue(agenda.superpone("MN1234", corrido, corrido + timedelta(minutes=30)))
+        self.assertFalse(agenda.superpone("MN1234", corrido, corrido + timedelta(minutes=30), excepto=self.fecha))
+
+    def test_obtener_por_dni(self):
+        otro = Turno(self.paciente2, self.medico, datetime(2025, 6, 18, 10, 0), "cardiologia")
+        agenda = AgendaTurnos([self.turno, otro])
+        self.assertEqual(agenda.obtener_por_dni("12345678"), [self.turno])
+        self.assertEqual(agenda.obtener_por_dni("99999999"), [])
+
+    def test_obtener_por_fecha(self):
+        mismo_dia = Turno(self.paciente2, self.medico, datetime(2025, 6, 16, 11, 0), "cardiologia")
+        agenda = AgendaTurnos([self.turno, mismo_dia])
+        self.assertEqual(len(agenda.obtener_por_fecha(date(2025, 6, 16))), 2)
+        self.assertEqual(agenda.obtener_por_fecha(date(2025, 6, 17)), [])
+
+    def test_obtener_turnos_devuelve_copia(self):
+        agenda = AgendaTurnos([self.turno])
+        turnos = agenda.obtener_turnos()
+        turnos.clear()
+        self.assertEqual(len(agenda.obtener_turnos()), 1)
+
+    def test_huecos_libres_agenda_vacia(self):
+        agenda = AgendaTurnos()
+        huecos = list(agenda.huecos_libres("MN1234", datetime(2025, 6, 16, 8, 0), datetime(2025, 6, 16, 10, 0), timedelta(minutes=30)))
+        self.assertEqual(len(huecos), 4)
+        self.assertEqual(huecos[0], datetime(2025, 6, 16, 8, 0))
+
+    def test_huecos_libres_salta_turnos_ocupados(self):
+        agenda = AgendaTurnos([
+            Turno(self.paciente1, self.medico, datetime(2025, 6, 16, 8, 0), "cardiologia"),
+            Turno(self.paciente2, self.medico, datetime(2025, 6, 16, 8, 45), "cardiologia"),
+        ])
+        huecos = list(agenda.huecos_libres("MN1234", datetime(2025, 6, 16, 8, 0), datetime(2025, 6, 16, 10, 0), timedelta(minutes=30)))
+        self.assertEqual(huecos, [datetime(2025, 6, 16, 9, 30)])
+
+    def test_huecos_libres_respeta_duracion_de_cada_turno(self):
+        agenda = AgendaTurnos([Turno(self.paciente1, self.medico, datetime(2025, 6, 16, 8, 0), "cardiologia", timedelta(minutes=90))])
+        huecos = list(agenda.huecos_libres("MN1234", datetime(2025, 6, 16, 8, 0), datetime(2025, 6, 16, 10, 0), timedelta(minutes=30)))
+        self.assertEqual(huecos, [datetime(2025, 6, 16, 9, 30)])
+
+    def test_huecos_libres_otro_medico_no_afecta(self):
+        agenda = AgendaTurnos([self.turno])
+        huecos = list(agenda.huecos_libres("MP5678", self.fecha, self.fecha + timedelta(minutes=30), timedelta(minutes=30)))
+        self.assertEqual(huecos, [self.fecha])
+
+
+if __name__ == '__main__':
+    unittest.main()
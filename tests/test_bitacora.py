@@ -0,0 +1,268 @@
+import unittest
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+from datetime import datetime, timedelta
+from src.bitacora import Bitacora, OP_TURNO, OP_RECETA
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.eventos import RegistroNulo
+from src.snapshot import cargar_snapshot, compactar_bitacora, compactar_si_hace_falta, CompactadorPeriodico
+from src.serie_turnos import SerieTurnos
+
+
+class TestBitacora(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.log")
+        self.ruta_snapshot = os.path.join(self.directorio.name, "clinica.snap")
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes"])])
+        self.paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _nueva_clinica(self, bitacora: Bitacora) -> Clinica:
+        return Clinica({}, {}, [], {}, registro=RegistroNulo(), bitacora=bitacora)
+
+    def test_registrar_y_leer(self):
+        bitacora = Bitacora(self.ruta)
+        bitacora.registrar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        bitacora.registrar_receta("12345678", "MN1234", ["Aspirina"], self.fecha)
+
+        registros = list(bitacora.leer())
+        bitacora.cerrar()
+
+        self.assertEqual([r["op"] for r in registros], [OP_TURNO, OP_RECETA])
+        self.assertEqual(registros[0]["fecha_hora"], "2025-06-16T10:00:00")
+
+    def test_linea_truncada_se_descarta(self):
+        bitacora = Bitacora(self.ruta)
+        bitacora.registrar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        bitacora.cerrar()
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(b'{"op": "turno", "dni"')
+
+        bitacora = Bitacora(self.ruta)
+        self.assertEqual(len(list(bitacora.leer())), 1)
+        bitacora.cerrar()
+
+    def test_registros_despues_de_una_linea_truncada_no_se_pierden(self):
+        """Test lo registrado después de una caída a mitad de línea se reproduce"""
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        bitacora.cerrar()
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(b'{"op": "turno", "dni"')
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.reproducir_bitacora()
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 3)
+        self.assertTrue(clinica.validar_turno_duplicado("MN1234", self.fecha))
+        bitacora.cerrar()
+
+    def test_group_commit_agrupa_fsync(self):
+        """Test cada registro vuelve recién con el fsync de su grupo y el grupo comparte un fsync"""
+        bitacora = Bitacora(self.ruta, lote_fsync=3, intervalo_fsync=60)
+        with mock.patch("src.bitacora.os.fsync", wraps=os.fsync) as fsync:
+            hilos = [
+                threading.Thread(target=bitacora.registrar_turno, args=("12345678", "MN1234", "cardiologia", self.fecha + timedelta(weeks=i)))
+                for i in range(2)
+            ]
+            for hilo in hilos:
+                hilo.start()
+            time.sleep(0.05)
+            # EL LOTE NO SE LLENO: NINGUNO DE LOS DOS PUEDE DARSE POR PERSISTIDO
+            self.assertTrue(all(hilo.is_alive() for hilo in hilos))
+            self.assertEqual(fsync.call_count, 0)
+
+            bitacora.registrar_turno("12345678", "MN1234", "cardiologia", self.fecha + timedelta(weeks=2))
+            for hilo in hilos:
+                hilo.join(5)
+            self.assertFalse(any(hilo.is_alive() for hilo in hilos))
+            self.assertEqual(fsync.call_count, 1)
+        bitacora.cerrar()
+
+    def test_intervalo_fsync_sin_mas_escrituras(self):
+        """Test un registro solo no espera a que se llene el lote: lo sincroniza el temporizador"""
+        bitacora = Bitacora(self.ruta, lote_fsync=1000, intervalo_fsync=0.01)
+        bitacora.registrar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        self.assertGreater(os.path.getsize(self.ruta), 0)
+        bitacora.cerrar()
+
+    def test_reproducir_tras_caida(self):
+        """Test una clínica nueva reconstruye el estado desde la bitácora"""
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        clinica.emitir_receta("12345678", "MN1234", ["Aspirina"])
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 4)
+        self.assertTrue(clinica.validar_turno_duplicado("MN1234", self.fecha))
+        self.assertEqual(len(clinica.obtener_historia_clinica_por_DNI("12345678").obtener_recetas()), 1)
+        bitacora.cerrar()
+
+    def test_compactar_en_snapshot(self):
+        bitacora = Bitacora(self.ruta, umbral_compactacion=2)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        self.assertFalse(bitacora.necesita_compactacion())
+        clinica.agregar_paciente(self.paciente)
+        self.assertTrue(bitacora.necesita_compactacion())
+
+        compactar_bitacora(clinica, bitacora, self.ruta_snapshot)
+        self.assertEqual(os.path.getsize(self.ruta), 0)
+        self.assertFalse(bitacora.necesita_compactacion())
+
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = cargar_snapshot(self.ruta_snapshot, registro=RegistroNulo(), bitacora=bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 1)
+        self.assertEqual(len(clinica.obtener_turnos()), 1)
+        bitacora.cerrar()
+
+    def test_reproducir_series_y_materializaciones(self):
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agendar_serie(SerieTurnos("12345678", "MN1234", "cardiologia", self.fecha, cantidad=6))
+        clinica.materializar_series(self.fecha + timedelta(weeks=2))
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 4)
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+        self.assertEqual(clinica.obtener_series()[0].obtener_materializadas(), 2)
+        self.assertTrue(clinica.validar_turno_duplicado("MN1234", self.fecha + timedelta(weeks=5)))
+        self.assertEqual(clinica.reproducir_bitacora(), 0)
+        bitacora.cerrar()
+
+    def test_compactar_con_escrituras_concurrentes_no_pierde_registros(self):
+        """Test lo que se registra mientras se compacta queda en el snapshot o en la bitácora"""
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        medicos = [Medico(f"Dr. {i}", f"MN{1000 + i}", [Especialidad("cardiologia", ["lunes"])]) for i in range(4)]
+        for medico in medicos:
+            clinica.agregar_medico(medico)
+        clinica.agregar_paciente(self.paciente)
+
+        def agendar(medico: Medico) -> None:
+            for semana in range(150):
+                clinica.agendar_turno("12345678", medico.obtener_matricula(), "cardiologia", self.fecha + timedelta(weeks=semana))
+
+        hilos = [threading.Thread(target=agendar, args=(medico,)) for medico in medicos]
+        for hilo in hilos:
+            hilo.start()
+        while any(hilo.is_alive() for hilo in hilos):
+            compactar_bitacora(clinica, bitacora, self.ruta_snapshot)
+        for hilo in hilos:
+            hilo.join()
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        recuperada = cargar_snapshot(self.ruta_snapshot, registro=RegistroNulo(), bitacora=bitacora)
+        recuperada.reproducir_bitacora()
+        self.assertEqual(len(recuperada.obtener_turnos()), 600)
+        bitacora.cerrar()
+
+    def test_compactar_solo_al_superar_el_umbral(self):
+        bitacora = Bitacora(self.ruta, umbral_compactacion=2)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        self.assertFalse(compactar_si_hace_falta(clinica, bitacora, self.ruta_snapshot))
+        self.assertFalse(os.path.exists(self.ruta_snapshot))
+        clinica.agregar_paciente(self.paciente)
+        self.assertTrue(compactar_si_hace_falta(clinica, bitacora, self.ruta_snapshot))
+        self.assertEqual(os.path.getsize(self.ruta), 0)
+        bitacora.cerrar()
+
+    def test_compactador_periodico(self):
+        bitacora = Bitacora(self.ruta, umbral_compactacion=2)
+        clinica = self._nueva_clinica(bitacora)
+        compactador = CompactadorPeriodico(clinica, bitacora, self.ruta_snapshot, intervalo=0.01)
+        compactador.iniciar()
+        try:
+            clinica.agregar_medico(self.medico)
+            clinica.agregar_paciente(self.paciente)
+            limite = time.monotonic() + 5
+            while os.path.getsize(self.ruta) and time.monotonic() < limite:
+                time.sleep(0.01)
+        finally:
+            compactador.detener()
+        self.assertEqual(os.path.getsize(self.ruta), 0)
+        self.assertTrue(os.path.exists(self.ruta_snapshot))
+        bitacora.cerrar()
+
+    def test_reproducir_cancelaciones_y_reprogramaciones(self):
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha + timedelta(weeks=1))
+        clinica.cancelar_turno("MN1234", self.fecha)
+        clinica.reprogramar_turno("MN1234", self.fecha + timedelta(weeks=1), self.fecha + timedelta(weeks=2))
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 6)
+        self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos()], [self.fecha + timedelta(weeks=2)])
+        # UNA SEGUNDA PASADA VUELVE A CANCELAR LO QUE REAGENDA: EL ESTADO FINAL ES EL MISMO
+        clinica.reproducir_bitacora()
+        self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos()], [self.fecha + timedelta(weeks=2)])
+        bitacora.cerrar()
+
+    def test_reproducir_es_idempotente(self):
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.emitir_receta("12345678", "MN1234", ["Aspirina"])
+
+        self.assertEqual(clinica.reproducir_bitacora(), 0)
+        self.assertEqual(len(clinica.obtener_historia_clinica_por_DNI("12345678").obtener_recetas()), 1)
+        bitacora.cerrar()
+
+    def test_reproducir_especialidad_agregada(self):
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_especialidad_a_medico("MN1234", Especialidad("neurologia", ["viernes"]))
+        self.assertEqual(clinica.reproducir_bitacora(), 0)
+        bitacora.cerrar()
+
+        bitacora = Bitacora(self.ruta)
+        clinica = self._nueva_clinica(bitacora)
+        self.assertEqual(clinica.reproducir_bitacora(), 2)
+        medico = clinica.obtener_medico_por_matricula("MN1234")
+        self.assertEqual([e.obtener_especialidad() for e in medico.obtener_especialidades()], ["cardiologia", "neurologia"])
+        bitacora.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
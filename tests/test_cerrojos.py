@@ -0,0 +1,37 @@
+import unittest
+import threading
+from src.cerrojos import CerrojosPorClave
+
+
+class TestCerrojosPorClave(unittest.TestCase):
+
+    def test_misma_clave_mismo_cerrojo(self):
+        cerrojos = CerrojosPorClave(16)
+        self.assertIs(cerrojos.obtener("MN1234"), cerrojos.obtener("MN1234"))
+        self.assertEqual(len(cerrojos), 16)
+
+    def test_cerrojo_reentrante(self):
+        cerrojos = CerrojosPorClave(4)
+        with cerrojos.obtener("12345678"):
+            with cerrojos.obtener("12345678"):
+                pass
+
+    def test_todos_bloquea_cualquier_clave(self):
+        cerrojos = CerrojosPorClave(8)
+        tomado = []
+        with cerrojos.todos():
+            hilo = threading.Thread(target=lambda: tomado.append(cerrojos.obtener("MN1234").acquire(timeout=0.05)))
+            hilo.start()
+            hilo.join()
+            # EL MISMO HILO PUEDE SEGUIR USANDO LAS CLAVES (REENTRANTES)
+            with cerrojos.obtener("MN1234"):
+                pass
+        self.assertEqual(tomado, [False])
+
+    def test_cantidad_invalida_error(self):
+        with self.assertRaises(ValueError):
+            CerrojosPorClave(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
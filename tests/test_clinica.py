@@ -1,12 +1,25 @@
 import unittest
 import sys
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from src.clinica import Clinica
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
 from src.historia_clinica import HistoriaClinica
+from src.eventos import RegistroBuffer, RegistroNulo
+from src.resultado import (
+    PACIENTE_YA_REGISTRADO,
+    PACIENTE_NO_REGISTRADO,
+    MEDICO_NO_REGISTRADO,
+    MEDICO_YA_REGISTRADO,
+    DIA_NO_DISPONIBLE,
+    TURNO_OCUPADO,
+    DUPLICADO_EN_LOTE,
+    SUPERPUESTO_EN_LOTE,
+    TURNO_NO_ENCONTRADO
+)
 from src.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
@@ -142,6 +155,205 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", fecha_turno)
 
+    def test_agendar_turno_superpuesto(self):
+        """Test un turno que se superpone con otro del mismo médico se rechaza"""
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0))
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 5))
+
+    def test_agendar_turno_con_duracion(self):
+        """Test la duración del turno define hasta cuándo queda ocupado el médico"""
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0), timedelta(minutes=15))
+
+        resultado = self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 15))
+
+        self.assertTrue(resultado)
+        self.assertTrue(self.clinica.validar_superposicion("MN1234", datetime(2025, 6, 16, 10, 20)))
+
+    def test_agendar_turno_devuelve_resultado_con_turno(self):
+        """Test agendar turno devuelve un resultado tipado con el turno creado"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+
+        resultado = self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+
+        self.assertTrue(resultado.obtener_exito())
+        self.assertEqual(resultado.obtener_objeto().obtener_fecha_hora(), fecha_turno)
+
+    # ===== TESTS REGISTRO DE EVENTOS =====
+
+    def test_registro_buffer_recibe_eventos_sin_imprimir(self):
+        """Test la clínica envía los eventos al registro configurado"""
+        registro = RegistroBuffer()
+        clinica = Clinica({"MN1234": self.medico1}, {"12345678": self.paciente1}, [], {}, registro=registro)
+
+        clinica.agregar_paciente(self.paciente2)
+        clinica.agregar_paciente(self.paciente2)
+        clinica.agendar_turno("99999999", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0))
+
+        motivos = [e.obtener_motivo() for e in registro.obtener_eventos()]
+        self.assertEqual(motivos, [None, PACIENTE_YA_REGISTRADO, PACIENTE_NO_REGISTRADO])
+
+    def test_registro_recibe_turno_ocupado_antes_de_la_excepcion(self):
+        """Test el rechazo por turno ocupado se registra aunque se lance la excepción"""
+        registro = RegistroBuffer()
+        clinica = Clinica({"MN1234": self.medico1}, {"12345678": self.paciente1}, [], {}, registro=registro)
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+        self.assertEqual(registro.obtener_eventos()[-1].obtener_motivo(), TURNO_OCUPADO)
+
+    # ===== TESTS AGENDAR TURNOS EN LOTE =====
+
+    def test_agendar_turnos_lote_exitoso(self):
+        """Test agendar varios turnos válidos en lote"""
+        filas = [
+            ("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0)),
+            ("87654321", "MP5678", "neurologia", datetime(2025, 6, 17, 10, 0)),
+        ]
+
+        resultados = self.clinica.agendar_turnos_lote(filas)
+
+        self.assertEqual(len(resultados), 2)
+        self.assertTrue(all(resultados))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        self.assertEqual(len(self.historia1.obtener_turnos()), 1)
+
+    def test_agendar_turnos_lote_reporta_por_fila(self):
+        """Test el lote informa el motivo de rechazo de cada fila sin lanzar excepciones"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", datetime(2025, 6, 23, 10, 0))
+        filas = [
+            ("99999999", "MN1234", "cardiologia", fecha_turno),
+            ("12345678", "MN9999", "cardiologia", fecha_turno),
+            ("12345678", "MN1234", "cardiologia", datetime(2025, 6, 20, 10, 0)),
+            ("12345678", "MN1234", "cardiologia", datetime(2025, 6, 23, 10, 0)),
+            ("12345678", "MN1234", "cardiologia", fecha_turno),
+            ("87654321", "MN1234", "cardiologia", fecha_turno),
+        ]
+
+        resultados = self.clinica.agendar_turnos_lote(filas)
+
+        motivos = [r.obtener_motivo() for r in resultados]
+        self.assertEqual(motivos, [
+            PACIENTE_NO_REGISTRADO,
+            MEDICO_NO_REGISTRADO,
+            DIA_NO_DISPONIBLE,
+            TURNO_OCUPADO,
+            None,
+            DUPLICADO_EN_LOTE,
+        ])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turnos_lote_superpuesto_dentro_del_lote(self):
+        """Test un turno que pisa a otro del mismo lote se distingue de uno que pisa un turno previo"""
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 9, 0))
+        filas = [
+            ("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0)),
+            ("87654321", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 15)),
+            ("87654321", "MN1234", "cardiologia", datetime(2025, 6, 16, 9, 15)),
+            ("87654321", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 30)),
+        ]
+
+        motivos = [r.obtener_motivo() for r in self.clinica.agendar_turnos_lote(filas)]
+
+        self.assertEqual(motivos, [None, SUPERPUESTO_EN_LOTE, TURNO_OCUPADO, None])
+
+    # ===== TESTS CANCELAR Y REPROGRAMAR =====
+
+    def test_cancelar_turno_libera_el_horario(self):
+        """Test el horario cancelado se puede volver a agendar en el acto"""
+        fecha = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha)
+
+        resultado = self.clinica.cancelar_turno("MN1234", fecha)
+
+        self.assertTrue(resultado)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.obtener_historia_clinica_por_DNI("12345678").obtener_turnos(), [])
+        self.assertEqual(self.clinica.obtener_tabla_turnos().cantidad_activos(), 0)
+        self.assertFalse(self.clinica.validar_turno_duplicado("MN1234", fecha))
+        libres = self.clinica.buscar_turnos_libres("cardiologia", fecha, datetime(2025, 6, 16, 11, 0))
+        self.assertEqual(libres, [(fecha, self.medico1)])
+        self.assertTrue(self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", fecha))
+
+    def test_cancelar_turno_inexistente(self):
+        """Test cancelar un turno que no existe"""
+        resultado = self.clinica.cancelar_turno("MN1234", datetime(2025, 6, 16, 10, 0))
+        self.assertFalse(resultado)
+        self.assertEqual(resultado.obtener_motivo(), TURNO_NO_ENCONTRADO)
+
+    def test_reprogramar_turno(self):
+        """Test el turno se mueve y el horario viejo queda libre"""
+        fecha = datetime(2025, 6, 16, 10, 0)
+        nueva = datetime(2025, 6, 18, 11, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha)
+
+        resultado = self.clinica.reprogramar_turno("MN1234", fecha, nueva)
+
+        self.assertTrue(resultado)
+        self.assertEqual(resultado.obtener_objeto().obtener_fecha_hora(), nueva)
+        self.assertFalse(self.clinica.validar_turno_duplicado("MN1234", fecha))
+        self.assertTrue(self.clinica.validar_turno_duplicado("MN1234", nueva))
+        historia = self.clinica.obtener_historia_clinica_por_DNI("12345678")
+        self.assertEqual([t.obtener_fecha_hora() for t in historia.obtener_turnos()], [nueva])
+
+    def test_reprogramar_puede_pisar_su_propio_horario(self):
+        """Test correr un turno 15 minutos no choca consigo mismo"""
+        fecha = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha)
+        self.assertTrue(self.clinica.reprogramar_turno("MN1234", fecha, fecha + timedelta(minutes=15)))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_reprogramar_rechazado_no_cambia_nada(self):
+        """Test un horario ocupado o un día no atendido dejan el turno original"""
+        fecha = datetime(2025, 6, 16, 10, 0)
+        ocupado = datetime(2025, 6, 16, 11, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha)
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", ocupado)
+
+        self.assertEqual(self.clinica.reprogramar_turno("MN1234", fecha, ocupado).obtener_motivo(), TURNO_OCUPADO)
+        self.assertEqual(self.clinica.reprogramar_turno("MN1234", fecha, datetime(2025, 6, 17, 10, 0)).obtener_motivo(), DIA_NO_DISPONIBLE)
+        self.assertTrue(self.clinica.validar_turno_duplicado("MN1234", fecha))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    # ===== TESTS BUSCAR TURNOS LIBRES =====
+
+    def test_buscar_turnos_libres_primer_hueco(self):
+        """Test el primer hueco libre es la apertura del primer día que se atiende la especialidad"""
+        libres = self.clinica.buscar_turnos_libres("cardiologia", datetime(2025, 6, 14, 0, 0), datetime(2025, 6, 30, 0, 0))
+
+        self.assertEqual(libres, [(datetime(2025, 6, 16, 8, 0), self.medico1)])
+
+    def test_buscar_turnos_libres_saltea_ocupados(self):
+        """Test los turnos ya agendados no se ofrecen como libres"""
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 8, 0))
+
+        libres = self.clinica.buscar_turnos_libres("cardiologia", datetime(2025, 6, 16, 8, 0), datetime(2025, 6, 30, 0, 0), cantidad=2)
+
+        self.assertEqual([f for f, _ in libres], [datetime(2025, 6, 16, 8, 30), datetime(2025, 6, 16, 9, 0)])
+
+    def test_buscar_turnos_libres_combina_medicos_en_orden(self):
+        """Test los huecos de varios médicos se devuelven ordenados por fecha"""
+        esp = Especialidad("cardiologia", ["martes"])
+        medico3 = Medico("Dr. Luis Martinez", "MN9999", [esp])
+        self.clinica.agregar_medico(medico3)
+
+        libres = self.clinica.buscar_turnos_libres("cardiologia", datetime(2025, 6, 16, 17, 0), datetime(2025, 6, 18, 0, 0), duracion=timedelta(hours=1), cantidad=3)
+
+        self.assertEqual(libres, [
+            (datetime(2025, 6, 16, 17, 0), self.medico1),
+            (datetime(2025, 6, 17, 8, 0), medico3),
+            (datetime(2025, 6, 17, 9, 0), medico3),
+        ])
+
+    def test_buscar_turnos_libres_sin_resultados(self):
+        """Test especialidad que nadie atiende"""
+        libres = self.clinica.buscar_turnos_libres("pediatria", datetime(2025, 6, 16), datetime(2025, 6, 30))
+        self.assertEqual(libres, [])
+
     # ===== TESTS EMITIR RECETA =====
     
     def test_emitir_receta_exitoso(self):
@@ -213,6 +425,65 @@ class TestClinica(unittest.TestCase):
         self.assertEqual(len(turnos), 0)
         self.assertIsInstance(turnos, list)
 
+    def test_obtener_turnos_por_dni(self):
+        """Test obtener turnos de un paciente"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+
+        self.assertEqual(len(self.clinica.obtener_turnos_por_dni("12345678")), 1)
+        self.assertEqual(len(self.clinica.obtener_turnos_por_dni("87654321")), 0)
+
+    def test_obtener_turnos_por_fecha(self):
+        """Test obtener turnos de un día"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+
+        self.assertEqual(len(self.clinica.obtener_turnos_por_fecha(fecha_turno.date())), 1)
+
+    def test_agregar_pacientes_lote(self):
+        """Test alta masiva de pacientes: agrega los nuevos y rechaza los ya registrados"""
+        nuevo = Paciente("Lucia Fernandez", "33333333", "01/02/1990")
+        resultados = self.clinica.agregar_pacientes_lote([nuevo, Paciente("Repetido", "12345678", "01/01/1990")])
+
+        self.assertTrue(resultados[0])
+        self.assertEqual(resultados[1].obtener_motivo(), PACIENTE_YA_REGISTRADO)
+        self.assertIs(self.clinica.obtener_paciente_por_dni("33333333"), nuevo)
+        self.assertEqual(self.clinica.obtener_paciente_por_dni("12345678"), self.paciente1)
+
+    def test_agregar_lote_repetido_en_el_lote_y_en_los_indices(self):
+        """Test el alta masiva rechaza claves repetidas dentro del lote y deja a los nuevos en los índices"""
+        primero = Paciente("Lucia Fernandez", "33333333", "01/02/1990")
+        resultados = self.clinica.agregar_pacientes_lote([primero, Paciente("Otra Lucia", "33333333", "01/01/1990")])
+        self.assertTrue(resultados[0])
+        self.assertEqual(resultados[1].obtener_motivo(), PACIENTE_YA_REGISTRADO)
+        self.assertIs(self.clinica.obtener_paciente_por_dni("33333333"), primero)
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("lucia")], ["33333333"])
+
+        medico = Medico("Dra. Ana Ruiz", "MN9999", [Especialidad("pediatria", ["martes"])])
+        resultados = self.clinica.agregar_medicos_lote([medico, Medico("Dr. Otro", "MN9999", [Especialidad("pediatria", ["jueves"])])])
+        self.assertTrue(resultados[0])
+        self.assertEqual(resultados[1].obtener_motivo(), MEDICO_YA_REGISTRADO)
+        self.assertIs(self.clinica.obtener_medico_por_matricula("MN9999"), medico)
+
+    def test_tabla_turnos_refleja_agenda(self):
+        """Test la tabla columnar cuenta los turnos agendados"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+        tabla = self.clinica.obtener_tabla_turnos()
+
+        self.assertEqual(len(tabla), 1)
+        self.assertEqual(tabla.contar_por_medico(), {"MN1234": 1})
+        self.assertEqual(tabla.contar_por_dia(), {fecha_turno.date(): 1})
+
+    def test_validar_turno_duplicado(self):
+        """Test validar turno duplicado por matrícula y fecha"""
+        fecha_turno = datetime(2025, 6, 16, 10, 0)
+        self.assertFalse(self.clinica.validar_turno_duplicado("MN1234", fecha_turno))
+
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", fecha_turno)
+        self.assertTrue(self.clinica.validar_turno_duplicado("MN1234", fecha_turno))
+        self.assertFalse(self.clinica.validar_turno_duplicado("MP5678", fecha_turno))
+
     def test_obtener_pacientes(self):
         """Test obtener lista de pacientes"""
         pacientes = self.clinica.obtener_pacientes()
@@ -227,6 +498,46 @@ class TestClinica(unittest.TestCase):
         self.assertIn(self.medico1, medicos)
         self.assertIn(self.medico2, medicos)
 
+    # ===== TESTS LISTADOS PAGINADOS =====
+
+    def test_paginar_pacientes_con_cursor(self):
+        """Test los pacientes se recorren por DNI de a una página"""
+        self.clinica.agregar_paciente(Paciente("Carla Diaz", "30000000", "01/01/1990"))
+        primera = self.clinica.paginar_pacientes(tamano=2)
+        self.assertEqual([p.obtener_dni() for p in primera], ["12345678", "30000000"])
+        segunda = self.clinica.paginar_pacientes(primera.obtener_cursor(), tamano=2)
+        self.assertEqual([p.obtener_dni() for p in segunda], ["87654321"])
+        self.assertFalse(segunda.hay_mas())
+
+    def test_iterar_pacientes_por_prefijo(self):
+        """Test filtrar pacientes por prefijo de nombre sin distinguir mayúsculas"""
+        self.assertEqual([p.obtener_dni() for p in self.clinica.iterar_pacientes(prefijo_nombre="maria")], ["87654321"])
+
+    def test_iterar_medicos_por_especialidad(self):
+        """Test filtrar médicos por especialidad"""
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.iterar_medicos(especialidad="neurologia")], ["MP5678"])
+
+    def test_paginar_turnos_por_rango_y_medico(self):
+        """Test los turnos se listan en orden cronológico dentro del rango"""
+        lunes = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", lunes + timedelta(days=2))
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", lunes)
+        self.clinica.agendar_turno("87654321", "MP5678", "neurologia", lunes + timedelta(days=1))
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", lunes + timedelta(days=7))
+
+        pagina = self.clinica.paginar_turnos(tamano=1, desde=lunes.date(), hasta=(lunes + timedelta(days=2)).date(), matricula="MN1234")
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina], [lunes])
+        pagina = self.clinica.paginar_turnos(pagina.obtener_cursor(), tamano=1, desde=lunes.date(), hasta=(lunes + timedelta(days=2)).date(), matricula="MN1234")
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina], [lunes + timedelta(days=2)])
+        self.assertFalse(pagina.hay_mas())
+        self.assertEqual(len(list(self.clinica.iterar_turnos())), 4)
+
+    def test_buscar_pacientes_por_nombre(self):
+        """Test buscar pacientes por apellido parcial y con errores de tipeo"""
+        self.clinica.agregar_paciente(Paciente("Lucía Rodríguez", "30000000", "01/01/1990"))
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("rodr", aproximado=False)], ["12345678", "30000000"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("Gonzales")], ["87654321"])
+
     # ===== TESTS VALIDAR MÉTODOS =====
     
     def test_validar_existencia_paciente_existente(self):
@@ -262,5 +573,70 @@ class TestClinica(unittest.TestCase):
         self.assertEqual(resultado, "viernes")
 
 
+
+class TestClinicaConcurrente(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: varios médicos y pacientes compartidos por muchos hilos"""
+        self.especialidad = Especialidad("cardiologia", ["lunes"])
+        self.clinica = Clinica({}, {}, [], {}, registro=RegistroNulo())
+        for i in range(8):
+            self.clinica.agregar_medico(Medico(f"Dr. Medico {i}", f"MN{1000 + i}", [self.especialidad]))
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{10000000 + i}", "01/01/1990"))
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+
+    def _en_paralelo(self, cantidad, funcion):
+        barrera = threading.Barrier(cantidad)
+        resultados = [None] * cantidad
+
+        def trabajar(indice):
+            barrera.wait()
+            resultados[indice] = funcion(indice)
+
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(cantidad)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        return resultados
+
+    def test_mismo_horario_se_agenda_una_sola_vez(self):
+        """Test muchos hilos pidiendo el mismo horario: exactamente uno lo obtiene"""
+        def agendar(indice):
+            try:
+                return bool(self.clinica.agendar_turno(f"{10000000 + indice % 8}", "MN1000", "cardiologia", self.fecha))
+            except TurnoOcupadoException:
+                return False
+
+        resultados = self._en_paralelo(16, agendar)
+        self.assertEqual(resultados.count(True), 1)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.obtener_tabla_turnos()), 1)
+
+    def test_medicos_distintos_no_se_bloquean(self):
+        """Test hilos con médicos distintos agendan todos sus turnos"""
+        def agendar(indice):
+            return all(
+                self.clinica.agendar_turno(f"{10000000 + indice}", f"MN{1000 + indice}", "cardiologia", self.fecha + timedelta(minutes=30 * j))
+                for j in range(10)
+            )
+
+        self.assertTrue(all(self._en_paralelo(8, agendar)))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 80)
+        self.assertEqual(self.clinica.obtener_tabla_turnos().contar_por_medico(), {f"MN{1000 + i}": 10 for i in range(8)})
+
+    def test_recetas_concurrentes_crean_una_sola_historia(self):
+        """Test recetas simultáneas para un DNI sin historia comparten una única historia"""
+        self._en_paralelo(12, lambda indice: self.clinica.emitir_receta("10000000", "MN1000", [f"Medicamento {indice}"]))
+
+        historia = self.clinica.obtener_historia_clinica_por_DNI("10000000")
+        self.assertEqual(len(historia.obtener_recetas()), 12)
+
+    def test_registro_concurrente_de_un_mismo_paciente(self):
+        """Test el mismo paciente agregado por varios hilos se registra una vez"""
+        resultados = self._en_paralelo(10, lambda indice: bool(self.clinica.agregar_paciente(Paciente("Nuevo Paciente", "99999999", "01/01/1990"))))
+        self.assertEqual(resultados.count(True), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import unittest
+from datetime import datetime, time
+from src.clinica import Clinica
+from src.clinica_async import AsyncClinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.eventos import RegistroNulo
+from src.excepciones import TurnoOcupadoException
+
+
+class ClinicaContada(Clinica):
+    """Clínica que cuenta las llamadas a agendar_turno y puede demorarlas"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.llamadas = 0
+        self.liberar = threading.Event()
+        self.liberar.set()
+
+    def agendar_turno(self, *args, **kwargs):
+        self.llamadas += 1
+        self.liberar.wait(5)
+        return super().agendar_turno(*args, **kwargs)
+
+
+class TestAsyncClinica(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = ClinicaContada({}, {}, [], {}, registro=RegistroNulo())
+        self.clinica.agregar_medico(Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes"])]))
+        self.clinica.agregar_paciente(Paciente("Carlos Rodriguez", "12345678", "15/05/1980"))
+        self.clinica.agregar_paciente(Paciente("Maria Gonzalez", "87654321", "20/10/1975"))
+        self.async_clinica = AsyncClinica(self.clinica, hilos=4)
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+
+    def tearDown(self):
+        self.clinica.liberar.set()
+        self.async_clinica.cerrar()
+
+    async def test_agendar_turno(self):
+        resultado = await self.async_clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        self.assertTrue(resultado)
+        self.assertEqual(len(await self.async_clinica.obtener_turnos()), 1)
+        self.assertEqual(self.async_clinica.pedidos_en_curso(), 0)
+
+    async def test_pedidos_identicos_se_combinan(self):
+        self.clinica.liberar.clear()
+        pedidos = [asyncio.create_task(self.async_clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        self.clinica.liberar.set()
+        resultados = await asyncio.gather(*pedidos)
+
+        self.assertEqual(self.clinica.llamadas, 1)
+        self.assertTrue(all(resultados))
+        self.assertTrue(all(r is resultados[0] for r in resultados))
+
+    async def test_pedidos_distintos_mismo_horario(self):
+        self.clinica.liberar.clear()
+        primero = asyncio.create_task(self.async_clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha))
+        segundo = asyncio.create_task(self.async_clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.fecha))
+        await asyncio.sleep(0.05)
+        # EL SEGUNDO ESPERA AL PRIMERO SIN LLEGAR AL EJECUTOR
+        self.assertEqual(self.clinica.llamadas, 1)
+        self.clinica.liberar.set()
+
+        self.assertTrue(await primero)
+        with self.assertRaises(TurnoOcupadoException):
+            await segundo
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    async def test_cancelar_pedido_no_cancela_la_operacion(self):
+        self.clinica.liberar.clear()
+        pedido = asyncio.create_task(self.async_clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha))
+        await asyncio.sleep(0.05)
+        pedido.cancel()
+        self.clinica.liberar.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await pedido
+        # UN PEDIDO NUEVO PARA EL MISMO HORARIO VE EL TURNO YA AGENDADO
+        with self.assertRaises(TurnoOcupadoException):
+            await self.async_clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.fecha)
+
+    async def test_recetas_e_historia(self):
+        mensaje = await self.async_clinica.emitir_receta("12345678", "MN1234", ["Aspirina"])
+        self.assertIn("Receta emitida", mensaje)
+        historia = await self.async_clinica.obtener_historia_clinica_por_DNI("12345678")
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+
+    async def test_listados(self):
+        await self.async_clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        self.assertEqual(len(await self.async_clinica.obtener_pacientes()), 2)
+        self.assertEqual(len(await self.async_clinica.obtener_medicos()), 1)
+        self.assertEqual(len(await self.async_clinica.obtener_turnos_por_dni("12345678")), 1)
+        self.assertEqual(len(await self.async_clinica.obtener_turnos_por_fecha(self.fecha.date())), 1)
+        libres = await self.async_clinica.buscar_turnos_libres("cardiologia", self.fecha, datetime(2025, 6, 16, 18, 0))
+        self.assertEqual(libres[0][0], datetime(2025, 6, 16, 10, 30))
+
+    async def test_buscar_turnos_libres_respeta_el_horario(self):
+        libres = await self.async_clinica.buscar_turnos_libres("cardiologia", self.fecha, datetime(2025, 6, 16, 18, 0), hora_inicio=time(14, 0), hora_fin=time(16, 0))
+        self.assertEqual(libres[0][0], datetime(2025, 6, 16, 14, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,6 +36,23 @@ class TestEspecialidad(unittest.TestCase):
         especialidad = Especialidad("cardiologia", [])
         self.assertFalse(especialidad.verificar_dia("lunes"))
     
+    def test_obtener_dias(self):
+        especialidad = Especialidad("cardiologia", ["Lunes", "MIERCOLES"])
+        self.assertEqual(especialidad.obtener_dias(), ("lunes", "miercoles"))
+    
+    def test_mascara_de_dias(self):
+        especialidad = Especialidad("cardiologia", ["lunes", "miercoles", "domingo"])
+        self.assertEqual(especialidad.obtener_mascara(), 0b1000101)
+
+    def test_verificar_dia_con_y_sin_tilde(self):
+        especialidad = Especialidad("cardiologia", ["miercoles", "sábado"])
+        self.assertTrue(especialidad.verificar_dia("miércoles"))
+        self.assertTrue(especialidad.verificar_dia("sabado"))
+
+    def test_sin_dict_por_instancia(self):
+        especialidad = Especialidad("cardiologia", ["lunes"])
+        self.assertFalse(hasattr(especialidad, "__dict__"))
+
     def test_str_representation(self):
         especialidad = Especialidad("cardiologia", ["lunes", "miercoles"])
         expected = "Tipo de especialidad: cardiologia, Días: ['lunes', 'miercoles']"
@@ -0,0 +1,58 @@
+import unittest
+import io
+import logging
+from contextlib import redirect_stdout
+from src.eventos import RegistroEventos, RegistroConsola, RegistroNulo, RegistroBuffer, RegistroLogging
+from src.resultado import ResultadoOperacion, TURNO_OCUPADO
+
+
+class TestRegistroEventos(unittest.TestCase):
+
+    def setUp(self):
+        self.exito = ResultadoOperacion(True, "Paciente agregado")
+        self.fallo = ResultadoOperacion(False, "Turno ocupado", TURNO_OCUPADO)
+
+    def test_registro_consola_imprime_mensaje(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            RegistroConsola().registrar(self.exito)
+        self.assertEqual(salida.getvalue(), "Paciente agregado\n")
+
+    def test_registro_nulo_no_imprime(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            RegistroNulo().registrar(self.exito)
+        self.assertEqual(salida.getvalue(), "")
+
+    def test_registro_buffer_acumula_y_vacia(self):
+        registro = RegistroBuffer()
+        registro.registrar(self.exito)
+        registro.registrar(self.fallo)
+
+        self.assertEqual(registro.obtener_eventos(), [self.exito, self.fallo])
+        self.assertEqual(registro.vaciar(), [self.exito, self.fallo])
+        self.assertEqual(registro.obtener_eventos(), [])
+
+    def test_registro_logging_usa_nivel_segun_resultado(self):
+        logger = logging.getLogger("clinica.test")
+        with self.assertLogs(logger, level="INFO") as capturado:
+            registro = RegistroLogging(logger)
+            registro.registrar(self.exito)
+            registro.registrar(self.fallo)
+
+        self.assertEqual(capturado.records[0].levelno, logging.INFO)
+        self.assertEqual(capturado.records[1].levelno, logging.WARNING)
+        self.assertIn(TURNO_OCUPADO, capturado.output[1])
+
+    def test_registro_sin_registrar_no_se_puede_instanciar(self):
+        class RegistroIncompleto(RegistroEventos):
+            pass
+
+        with self.assertRaises(TypeError):
+            RegistroEventos()
+        with self.assertRaises(TypeError):
+            RegistroIncompleto()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -115,6 +115,62 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertNotIn("Sin turnos registrados", str_historia)
         self.assertNotIn("Sin recetas registradas", str_historia)
 
+    def test_turnos_quedan_ordenados_por_fecha(self):
+        historia = HistoriaClinica(self.paciente)
+        tarde = Turno(self.paciente, self.medico, datetime(2025, 6, 18, 10, 0), "cardiologia")
+        temprano = Turno(self.paciente, self.medico, self.fecha_turno, "cardiologia")
+        historia.agregar_turno(tarde)
+        historia.agregar_turno(temprano)
+        self.assertEqual(historia.obtener_turnos(), [temprano, tarde])
+
+    def test_turnos_entre_fechas(self):
+        historia = HistoriaClinica(self.paciente)
+        turnos = [Turno(self.paciente, self.medico, datetime(2025, mes, 2, 10, 0), "cardiologia") for mes in range(1, 7)]
+        for turno in turnos:
+            historia.agregar_turno(turno)
+        self.assertEqual(historia.obtener_turnos_entre(datetime(2025, 3, 1), datetime(2025, 5, 1)), turnos[2:4])
+        self.assertEqual(historia.obtener_turnos_entre(datetime(2026, 1, 1), datetime(2026, 2, 1)), [])
+
+    def test_ultimas_recetas(self):
+        historia = HistoriaClinica(self.paciente)
+        recetas = [Receta(self.paciente, self.medico, ["Aspirina"], datetime(2025, 1, dia)) for dia in range(1, 8)]
+        for receta in recetas:
+            historia.agregar_receta(receta)
+        self.assertEqual(historia.obtener_ultimas_recetas(3), [recetas[6], recetas[5], recetas[4]])
+        self.assertEqual(historia.obtener_ultimas_recetas(0), [])
+        self.assertEqual(len(historia.obtener_ultimas_recetas(20)), 7)
+
+    def test_quitar_turno(self):
+        historia = HistoriaClinica(self.paciente)
+        turno = Turno(self.paciente, self.medico, self.fecha_turno, "cardiologia")
+        otro = Turno(self.paciente, self.medico, self.fecha_turno, "cardiologia")
+        historia.agregar_turno(turno)
+        historia.agregar_turno(otro)
+        self.assertTrue(historia.quitar_turno(turno))
+        self.assertFalse(historia.quitar_turno(turno))
+        self.assertEqual(historia.obtener_turnos(), [otro])
+
+    def test_renderizar_pagina(self):
+        historia = HistoriaClinica(self.paciente)
+        for dia in range(1, 26):
+            historia.agregar_turno(Turno(self.paciente, self.medico, datetime(2025, 1, dia, 10, 0), "cardiologia"))
+        self.assertEqual(historia.cantidad_paginas(), 3)
+        primera = historia.renderizar()
+        self.assertIn("25/01/2025 10:00", primera)
+        self.assertNotIn("15/01/2025 10:00", primera)
+        ultima = historia.renderizar(3)
+        self.assertIn("01/01/2025 10:00", ultima)
+        self.assertIn("Página 3 de 3", ultima)
+
+    def test_str_muestra_la_historia_completa(self):
+        historia = HistoriaClinica(self.paciente)
+        for dia in range(1, 26):
+            historia.agregar_turno(Turno(self.paciente, self.medico, datetime(2025, 1, dia, 10, 0), "cardiologia"))
+        str_historia = str(historia)
+        self.assertEqual(str_historia.count("Turno("), 25)
+        self.assertLess(str_historia.index("2025-01-01 10:00"), str_historia.index("2025-01-25 10:00"))
+        self.assertNotIn("Página", str_historia)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.eventos import RegistroBuffer
+from src.repositorio_sqlite import RepositorioSQLite
+from src.importador import importar_pacientes, importar_medicos
+from src.resultado import DATO_INVALIDO, DUPLICADO_EN_LOTE, PACIENTE_YA_REGISTRADO
+
+
+class TestImportador(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+        self.registro = RegistroBuffer()
+        self.clinica = Clinica({}, {}, [], {}, registro=self.registro)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def _leer_rechazos(self, resumen):
+        with open(resumen.obtener_ruta_rechazos(), newline="", encoding="utf-8") as archivo:
+            return list(csv.DictReader(archivo))
+
+    def test_importar_pacientes_csv(self):
+        """Test importa los válidos y deja los inválidos y repetidos en el archivo de rechazos"""
+        self.clinica.agregar_paciente(Paciente("Ya Registrado", "11111111", "01/01/1970"))
+        self.registro.vaciar()
+        ruta = self._escribir("pacientes.csv", (
+            "nombre,dni,fecha_de_nacimiento\n"
+            "Carlos Rodriguez,12.345.678,15/05/1980\n"
+            "Sin Dni,,01/01/1990\n"
+            "Maria Gonzalez,87654321,20/10/1975\n"
+            "Otra Vez,12345678,01/01/2000\n"
+            "DNI Corto,123,01/01/2000\n"
+            "Ya Registrado,11111111,01/01/1970\n"
+        ))
+
+        resumen = importar_pacientes(self.clinica, ruta, procesos=1)
+
+        self.assertEqual(resumen.obtener_importados(), 2)
+        self.assertEqual(resumen.obtener_rechazados(), 4)
+        self.assertEqual(self.clinica.obtener_paciente_por_dni("12345678").obtener_nombre(), "Carlos Rodriguez")
+        # EL ALTA MASIVA NO GENERA UN EVENTO POR PACIENTE
+        self.assertEqual(self.registro.obtener_eventos(), [])
+
+        rechazos = self._leer_rechazos(resumen)
+        self.assertEqual([(r["linea"], r["identificador"], r["motivo"]) for r in rechazos], [
+            ("3", "", DATO_INVALIDO),
+            ("5", "12345678", DUPLICADO_EN_LOTE),
+            ("6", "123", DATO_INVALIDO),
+            ("7", "11111111", PACIENTE_YA_REGISTRADO)
+        ])
+
+    def test_importar_pacientes_jsonl_en_paralelo(self):
+        """Test la validación en un pool de procesos da el mismo resultado y respeta el orden"""
+        lineas = [json.dumps({"nombre": f"Paciente {i}", "dni": str(10000000 + i), "fecha_de_nacimiento": "01/01/1990"}) for i in range(250)]
+        lineas.insert(100, "{no es json")
+        ruta = self._escribir("pacientes.jsonl", "\n".join(lineas) + "\n")
+
+        resumen = importar_pacientes(self.clinica, ruta, procesos=2, tamano_lote=40)
+
+        self.assertEqual(resumen.obtener_importados(), 250)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 250)
+        self.assertEqual([r["linea"] for r in self._leer_rechazos(resumen)], ["101"])
+
+    def test_importar_medicos(self):
+        """Test importa médicos desde CSV y JSON Lines"""
+        ruta_csv = self._escribir("medicos.csv", (
+            "nombre,matricula,especialidades\n"
+            "Dr. Juan Perez,MN1234,cardiologia:lunes|miércoles;pediatria:martes\n"
+            "Dr. Sin Especialidad,MN5555,\n"
+            "Dr. Matricula Mala,XX1,cardiologia:lunes\n"
+        ))
+        ruta_jsonl = self._escribir("medicos.jsonl", json.dumps(
+            {"nombre": "Dra. Ana Gomez", "matricula": "MP5678", "especialidades": [{"tipo": "neurologia", "dias": ["jueves"]}]}
+        ) + "\n")
+
+        resumen_csv = importar_medicos(self.clinica, ruta_csv, procesos=1)
+        resumen_jsonl = importar_medicos(self.clinica, ruta_jsonl, procesos=1)
+
+        self.assertEqual(resumen_csv.obtener_importados(), 1)
+        self.assertEqual(resumen_csv.obtener_rechazados(), 2)
+        self.assertEqual(resumen_jsonl.obtener_importados(), 1)
+        medico = self.clinica.obtener_medico_por_matricula("MN1234")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "pediatria")
+        self.assertEqual(medico.obtener_especialidad_para_dia("miércoles"), "cardiologia")
+        self.assertTrue(self.clinica.obtener_medico_por_matricula("MP5678").atiende_especialidad("neurologia"))
+
+    def test_especialidades_mal_formadas_se_rechazan_sin_cortar_la_importacion(self):
+        """Test una especialidad sin tipo o sin días va a rechazos y el resto se importa"""
+        filas = [
+            {"nombre": "Dr. Sin Dias", "matricula": "MN1111", "especialidades": [{"tipo": "cardiologia"}]},
+            {"nombre": "Dr. Sin Tipo", "matricula": "MN2222", "especialidades": [{"dias": ["lunes"]}]},
+            {"nombre": "Dr. Texto", "matricula": "MN3333", "especialidades": ["cardiologia"]},
+            {"nombre": "Dra. Ana Gomez", "matricula": "MP5678", "especialidades": [{"tipo": "neurologia", "dias": ["jueves"]}]},
+        ]
+        ruta = self._escribir("medicos.jsonl", "".join(json.dumps(fila) + "\n" for fila in filas))
+
+        for procesos in (1, 2):
+            clinica = Clinica({}, {}, [], {}, registro=RegistroBuffer())
+            resumen = importar_medicos(clinica, ruta, procesos=procesos)
+
+            self.assertEqual(resumen.obtener_importados(), 1)
+            self.assertEqual(resumen.obtener_rechazados(), 3)
+            self.assertEqual({r["motivo"] for r in self._leer_rechazos(resumen)}, {DATO_INVALIDO})
+            self.assertTrue(clinica.validar_existencia_medico("MP5678"))
+
+    def test_importar_persiste_en_repositorio(self):
+        """Test el alta masiva llega al repositorio en una sola escritura"""
+        repositorio = RepositorioSQLite(":memory:")
+        clinica = Clinica({}, {}, [], {}, registro=RegistroBuffer(), repositorio=repositorio)
+        ruta = self._escribir("pacientes.csv", "nombre,dni,fecha_de_nacimiento\nCarlos Rodriguez,12345678,15/05/1980\n")
+        try:
+            importar_pacientes(clinica, ruta, procesos=1)
+            self.assertIsNotNone(repositorio.obtener_paciente("12345678"))
+        finally:
+            repositorio.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
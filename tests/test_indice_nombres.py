@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+from src.indice_nombres import IndiceNombres, plegar, distancia_edicion
+
+
+class TestPlegar(unittest.TestCase):
+
+    def test_sin_acentos_ni_mayusculas(self):
+        self.assertEqual(plegar("José PÉREZ Muñoz"), "jose perez munoz")
+
+    def test_distancia_edicion_con_corte(self):
+        self.assertEqual(distancia_edicion("rodriguez", "rodrigez", 2), 1)
+        self.assertEqual(distancia_edicion("perez", "gomez", 1), 2)
+
+
+class TestIndiceNombres(unittest.TestCase):
+
+    def setUp(self):
+        self.indice = IndiceNombres()
+        self.indice.agregar_lote([
+            ("1", "María González"),
+            ("2", "Juan Gonzalez"),
+            ("3", "Ana Rodríguez"),
+            ("4", "Mario Gómez"),
+        ])
+        self.indice.agregar("5", "María Rodríguez")
+
+    def test_prefijo_de_cualquier_palabra(self):
+        self.assertEqual(self.indice.buscar_prefijo("gonz"), ["1", "2"])
+        self.assertEqual(self.indice.buscar_prefijo("ROD"), ["3", "5"])
+
+    def test_altas_intercaladas_con_busquedas(self):
+        self.indice.agregar_lote((str(100 + i), f"Paciente Apellido{i:03d}") for i in range(200))
+        self.assertEqual(self.indice.buscar_prefijo("gonz"), ["1", "2"])
+        self.indice.agregar("6", "Ana Gonzaga")
+        self.assertEqual(self.indice.buscar_prefijo("gonz"), ["6", "1", "2"])
+        self.assertEqual(self.indice.buscar_prefijo("apellido19", cantidad=50), [str(100 + i) for i in range(190, 200)])
+
+    def test_lotes_repartidos_en_tramos_chicos(self):
+        # TRAMOS DE 8 CLAVES: LOS LOTES SE FUSIONAN TRAMO POR TRAMO Y LAS ALTAS SUELTAS PARTEN TRAMOS
+        with mock.patch("src.paginacion.CARGA_TRAMO", 8):
+            indice = IndiceNombres()
+            indice.agregar_lote((str(1000 + i), f"Paciente Apellido{i:03d}") for i in range(0, 300, 3))
+            indice.agregar_lote((str(1000 + i), f"Paciente Apellido{i:03d}") for i in range(1, 300, 3))
+            for i in range(2, 300, 3):
+                indice.agregar(str(1000 + i), f"Paciente Apellido{i:03d}")
+            self.assertEqual(indice.buscar_prefijo("apellido1", cantidad=200), [str(1000 + i) for i in range(100, 200)])
+            self.assertEqual(len(indice.buscar_prefijo("paciente", cantidad=500)), 300)
+
+    def test_prefijo_con_varias_palabras(self):
+        self.assertEqual(self.indice.buscar_prefijo("mar rodr"), ["5"])
+        self.assertEqual(self.indice.buscar_prefijo("juan rodr"), [])
+
+    def test_prefijo_respeta_cantidad(self):
+        self.assertEqual(len(self.indice.buscar_prefijo("m", cantidad=2)), 2)
+
+    def test_aproximado_tolera_errores(self):
+        self.assertEqual(self.indice.buscar_aproximado("Rodrigez"), ["3", "5"])
+        self.assertEqual(self.indice.buscar_aproximado("maria gonzales"), ["1"])
+
+    def test_aproximado_ordena_por_distancia(self):
+        self.assertEqual(self.indice.buscar_aproximado("maria")[:2], ["1", "5"])
+        self.assertIn("4", self.indice.buscar_aproximado("maria"))
+
+    def test_sin_coincidencias(self):
+        self.assertEqual(self.indice.buscar_prefijo("xyz"), [])
+        self.assertEqual(self.indice.buscar_aproximado("xyzw"), [])
+        self.assertEqual(self.indice.buscar_prefijo(""), [])
+
+    def test_dni_repetido_no_se_indexa_dos_veces(self):
+        self.indice.agregar("1", "María González")
+        self.assertEqual(len(self.indice), 5)
+        self.assertEqual(self.indice.buscar_prefijo("gonzalez"), ["1", "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+from datetime import datetime, timedelta
+from src.lista_espera import ListaEspera, PRIORIDAD_URGENTE, PRIORIDAD_NORMAL
+from src.serie_turnos import SerieTurnos
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.historia_clinica import HistoriaClinica
+from src.eventos import RegistroNulo
+from src.resultado import YA_EN_LISTA_ESPERA, PACIENTE_NO_REGISTRADO, ESPECIALIDAD_NO_ATENDIDA
+
+
+class TestListaEspera(unittest.TestCase):
+
+    def setUp(self):
+        self.lista = ListaEspera()
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+        self.todas = lambda solicitud: True
+
+    def test_prioridad_y_orden_de_llegada(self):
+        self.lista.agregar("1", "cardiologia")
+        self.lista.agregar("2", "cardiologia", prioridad=PRIORIDAD_URGENTE)
+        self.lista.agregar("3", "cardiologia")
+        tomados = [self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas).obtener_dni() for _ in range(3)]
+        self.assertEqual(tomados, ["2", "1", "3"])
+        self.assertIsNone(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas))
+
+    def test_combina_las_del_medico_y_las_de_la_especialidad(self):
+        self.lista.agregar("1", "cardiologia", "MP5678")
+        self.lista.agregar("2", "cardiologia")
+        self.lista.agregar("3", "cardiologia", "MN1234")
+        self.assertEqual(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas).obtener_dni(), "2")
+        self.assertEqual(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas).obtener_dni(), "3")
+        self.assertIsNone(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas))
+        self.assertEqual(len(self.lista), 1)
+
+    def test_las_rechazadas_conservan_su_lugar(self):
+        self.lista.agregar("1", "cardiologia", hasta=self.fecha - timedelta(days=1))
+        self.lista.agregar("2", "cardiologia")
+        self.lista.agregar("3", "cardiologia")
+        elegida = self.lista.tomar("MN1234", "cardiologia", self.fecha, lambda s: s.obtener_dni() != "2")
+        self.assertEqual(elegida.obtener_dni(), "3")
+        self.assertEqual([s.obtener_dni() for s in self.lista.obtener_solicitudes()], ["1", "2"])
+        self.assertEqual(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas).obtener_dni(), "2")
+
+    def test_duplicada_y_quitar(self):
+        solicitud = self.lista.agregar("1", "cardiologia")
+        self.assertIsNone(self.lista.agregar("1", "cardiologia"))
+        self.assertIsNotNone(self.lista.agregar("1", "cardiologia", "MN1234"))
+        self.assertTrue(self.lista.quitar(solicitud))
+        self.assertFalse(self.lista.quitar(solicitud))
+        self.assertFalse(self.lista.contiene("1", "cardiologia"))
+        self.assertEqual(self.lista.tomar("MP5678", "cardiologia", self.fecha, self.todas), None)
+
+    def test_muchas_quitadas_se_compactan(self):
+        solicitudes = [self.lista.agregar(str(i), "cardiologia") for i in range(200)]
+        for solicitud in solicitudes[:150]:
+            self.lista.quitar(solicitud)
+        self.assertEqual(len(self.lista), 50)
+        self.assertEqual(self.lista.tomar("MN1234", "cardiologia", self.fecha, self.todas).obtener_dni(), "150")
+
+
+class TestClinicaListaEspera(unittest.TestCase):
+
+    def setUp(self):
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes"]), Especialidad("pediatria", ["martes"])])
+        self.pacientes = {dni: Paciente(nombre, dni, "15/05/1980") for dni, nombre in (("11111111", "Ana Diaz"), ("22222222", "Luis Gomez"), ("33333333", "Eva Sosa"))}
+        self.clinica = Clinica(
+            {"MN1234": self.medico},
+            dict(self.pacientes),
+            [],
+            {dni: HistoriaClinica(p) for dni, p in self.pacientes.items()},
+            registro=RegistroNulo()
+        )
+        self.fecha = datetime(2025, 6, 16, 10, 0)  # LUNES
+
+    def test_cancelar_asigna_el_horario_al_primero_en_espera(self):
+        self.clinica.agendar_turno("11111111", "MN1234", "cardiologia", self.fecha)
+        self.clinica.agregar_a_lista_espera("22222222", "cardiologia")
+        self.clinica.agregar_a_lista_espera("33333333", "cardiologia", "MN1234", prioridad=PRIORIDAD_URGENTE)
+
+        resultado = self.clinica.cancelar_turno("MN1234", self.fecha)
+
+        turno = resultado.obtener_objeto()
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "33333333")
+        self.assertEqual(turno.obtener_fecha_hora(), self.fecha)
+        self.assertEqual(self.clinica.obtener_turnos(), [turno])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_DNI("33333333").obtener_turnos()), 1)
+        self.assertEqual([s.obtener_dni() for s in self.clinica.obtener_lista_espera().obtener_solicitudes()], ["22222222"])
+
+    def test_solo_la_especialidad_que_el_medico_atiende_ese_dia(self):
+        self.clinica.agendar_turno("11111111", "MN1234", "cardiologia", self.fecha)
+        self.clinica.agregar_a_lista_espera("22222222", "pediatria", "MN1234")
+        resultado = self.clinica.cancelar_turno("MN1234", self.fecha)
+        self.assertIsNone(resultado.obtener_objeto())
+        self.assertEqual(len(self.clinica.obtener_lista_espera()), 1)
+
+    def test_la_duracion_de_la_solicitud_debe_entrar_en_el_hueco(self):
+        self.clinica.agendar_turno("11111111", "MN1234", "cardiologia", self.fecha)
+        self.clinica.agendar_turno("11111111", "MN1234", "cardiologia", self.fecha + timedelta(minutes=30))
+        self.clinica.agregar_a_lista_espera("22222222", "cardiologia", duracion=timedelta(hours=1))
+        self.clinica.agregar_a_lista_espera("33333333", "cardiologia")
+        turno = self.clinica.cancelar_turno("MN1234", self.fecha).obtener_objeto()
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "33333333")
+
+    def test_reprogramar_libera_el_horario_viejo(self):
+        self.clinica.agendar_turno("11111111", "MN1234", "cardiologia", self.fecha)
+        self.clinica.agregar_a_lista_espera("22222222", "cardiologia")
+        self.clinica.reprogramar_turno("MN1234", self.fecha, self.fecha + timedelta(weeks=1))
+        self.assertEqual(self.clinica.obtener_turnos_por_dni("22222222")[0].obtener_fecha_hora(), self.fecha)
+
+    def test_cancelar_ocurrencia_de_serie_asigna_el_horario(self):
+        self.clinica.agendar_serie(SerieTurnos("11111111", "MN1234", "cardiologia", self.fecha, cantidad=4))
+        self.clinica.agregar_a_lista_espera("22222222", "cardiologia", desde=self.fecha + timedelta(days=1))
+        turno = self.clinica.cancelar_turno("MN1234", self.fecha + timedelta(weeks=2)).obtener_objeto()
+        self.assertEqual(turno.obtener_fecha_hora(), self.fecha + timedelta(weeks=2))
+        self.assertFalse(self.clinica.obtener_series()[0].contiene(self.fecha + timedelta(weeks=2)))
+
+    def test_agregar_a_lista_espera_validaciones(self):
+        self.assertEqual(self.clinica.agregar_a_lista_espera("99999999", "cardiologia").obtener_motivo(), PACIENTE_NO_REGISTRADO)
+        self.assertEqual(self.clinica.agregar_a_lista_espera("11111111", "neurologia", "MN1234").obtener_motivo(), ESPECIALIDAD_NO_ATENDIDA)
+        solicitud = self.clinica.agregar_a_lista_espera("11111111", "cardiologia").obtener_objeto()
+        self.assertEqual(self.clinica.agregar_a_lista_espera("11111111", "cardiologia").obtener_motivo(), YA_EN_LISTA_ESPERA)
+        self.assertTrue(self.clinica.quitar_de_lista_espera(solicitud))
+        self.assertEqual(solicitud.obtener_prioridad(), PRIORIDAD_NORMAL)
+
+
+if __name__ == '__main__':
+    unittest.main()
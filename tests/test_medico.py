@@ -80,6 +80,58 @@ class TestMedico(unittest.TestCase):
         resultado = medico.obtener_especialidad_para_dia("viernes")
         self.assertIsNone(resultado)
     
+    def test_obtener_especialidad_para_dia_case_insensitive(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        self.assertEqual(medico.obtener_especialidad_para_dia("LUNES"), "cardiologia")
+    
+    def test_obtener_especialidad_para_dia_primera_especialidad_gana(self):
+        esp_clinica = Especialidad("clinica", ["lunes", "viernes"])
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia, esp_clinica])
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "cardiologia")
+        self.assertEqual(medico.obtener_especialidad_para_dia("viernes"), "clinica")
+    
+    def test_atiende_especialidad(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        self.assertTrue(medico.atiende_especialidad("cardiologia"))
+        self.assertFalse(medico.atiende_especialidad("neurologia"))
+    
+    def test_agenda_semanal_inmutable(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        with self.assertRaises(TypeError):
+            medico.obtener_agenda_semanal()["viernes"] = "cardiologia"
+    
+    def test_agregar_especialidad_actualiza_agenda_semanal(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        medico.agregar_especialidad(self.esp_neurologia)
+        self.assertTrue(medico.atiende_especialidad("neurologia"))
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "neurologia")
+    
+    def test_especialidad_para_dia_con_y_sin_tilde(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        self.assertEqual(medico.obtener_especialidad_para_dia("miércoles"), "cardiologia")
+        self.assertEqual(medico.obtener_especialidad_para_dia("Miercoles"), "cardiologia")
+        self.assertIsNone(medico.obtener_especialidad_para_dia("viernes"))
+
+    def test_agenda_semanal_por_dia(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia, self.esp_neurologia])
+        self.assertEqual(dict(medico.obtener_agenda_semanal()), {
+            "lunes": "cardiologia", "martes": "neurologia", "miércoles": "cardiologia", "jueves": "neurologia"
+        })
+
+    def test_agenda_semanal_es_una_vista_que_sigue_los_cambios(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        agenda = medico.obtener_agenda_semanal()
+        self.assertIs(medico.obtener_agenda_semanal(), agenda)
+        medico.agregar_especialidad(self.esp_neurologia)
+        self.assertEqual(medico.obtener_agenda_semanal()["martes"], "neurologia")
+        # OTRO MEDICO CON LAS MISMAS ESPECIALIDADES NO COMPARTE ESTADO
+        otro = Medico("Dr. Otro", "MN5678", [self.esp_cardiologia])
+        self.assertNotIn("martes", otro.obtener_agenda_semanal())
+
+    def test_sin_dict_por_instancia(self):
+        medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
+        self.assertFalse(hasattr(medico, "__dict__"))
+
     def test_agregar_especialidad_nueva(self):
         medico = Medico("Dr. Test", "MN1234", [self.esp_cardiologia])
         medico.agregar_especialidad(self.esp_neurologia)
@@ -0,0 +1,112 @@
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from src.metricas import Metricas, Histograma
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.eventos import RegistroNulo
+from src.resultado import PACIENTE_NO_REGISTRADO, DIA_NO_DISPONIBLE, TURNO_OCUPADO
+from src.excepciones import TurnoOcupadoException
+
+
+class TestHistograma(unittest.TestCase):
+
+    def test_buckets_acumulados(self):
+        histograma = Histograma((0.1, 1.0))
+        for valor in (0.05, 0.5, 0.7, 3.0):
+            histograma.observar(valor)
+        self.assertEqual(histograma.obtener_acumulados(), [(0.1, 1), (1.0, 3), (float("inf"), 4)])
+        self.assertEqual(histograma.obtener_cantidad(), 4)
+        self.assertAlmostEqual(histograma.obtener_suma(), 4.25)
+
+
+class TestMetricas(unittest.TestCase):
+
+    def setUp(self):
+        self.metricas = Metricas()
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes"])])
+        self.paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.clinica = Clinica(
+            {"MN1234": self.medico}, {"12345678": self.paciente}, [], {},
+            registro=RegistroNulo(), metricas=self.metricas
+        )
+        self.lunes = datetime(2025, 6, 16, 10, 0)
+
+    def test_cuenta_llamadas_y_rechazos_por_motivo(self):
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.lunes)
+        self.clinica.agendar_turno("99999999", "MN1234", "cardiologia", self.lunes)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 17, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.lunes)
+
+        instantanea = self.metricas.instantanea()
+        self.assertEqual(instantanea["llamadas"]["agendar_turno"], 4)
+        self.assertEqual(instantanea["rechazos"]["agendar_turno"], {
+            PACIENTE_NO_REGISTRADO: 1, DIA_NO_DISPONIBLE: 1, TURNO_OCUPADO: 1
+        })
+        self.assertEqual(instantanea["latencias"]["agendar_turno"]["cantidad"], 4)
+        self.assertEqual(instantanea["tamanos"]["turnos"], 1)
+        self.assertEqual(instantanea["tamanos"]["pacientes"], 1)
+
+    def test_rechazos_en_lote(self):
+        self.clinica.agregar_pacientes_lote([self.paciente, Paciente("Ana Lopez", "87654321", "01/01/1990")])
+        self.assertEqual(self.metricas.instantanea()["rechazos"]["agregar_pacientes_lote"], {"paciente_ya_registrado": 1})
+
+    def test_clinica_sin_metricas_no_envuelve(self):
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo())
+        self.assertIsNone(clinica.obtener_metricas())
+        self.assertNotIn("agendar_turno", vars(clinica))
+
+    def test_exportar_prometheus(self):
+        self.clinica.agendar_turno("99999999", "MN1234", "cardiologia", self.lunes)
+        texto = self.metricas.exportar_prometheus()
+        self.assertIn('clinica_operaciones_total{operacion="agendar_turno"} 1', texto)
+        self.assertIn('clinica_rechazos_total{operacion="agendar_turno",motivo="paciente_no_registrado"} 1', texto)
+        self.assertIn('clinica_latencia_segundos_bucket{operacion="agendar_turno",le="+Inf"} 1', texto)
+        self.assertIn('clinica_latencia_segundos_count{operacion="agendar_turno"} 1', texto)
+        self.assertIn('clinica_tamano{indice="medicos"} 1', texto)
+        self.assertIn("# TYPE clinica_latencia_segundos histogram", texto)
+
+    def test_escribir_prometheus_en_archivo(self):
+        directorio = tempfile.mkdtemp()
+        ruta = os.path.join(directorio, "clinica.prom")
+        try:
+            self.metricas.escribir_prometheus(ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertEqual(archivo.read(), self.metricas.exportar_prometheus())
+            self.assertEqual(os.listdir(directorio), ["clinica.prom"])
+        finally:
+            os.remove(ruta)
+            os.rmdir(directorio)
+
+    def test_enviar_prometheus_por_socket(self):
+        servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        servidor.bind(("127.0.0.1", 0))
+        servidor.listen(1)
+        recibido = []
+
+        def atender():
+            conexion, _ = servidor.accept()
+            with conexion:
+                partes = []
+                while parte := conexion.recv(4096):
+                    partes.append(parte)
+                recibido.append(b"".join(partes).decode("utf-8"))
+
+        hilo = threading.Thread(target=atender)
+        hilo.start()
+        try:
+            self.metricas.enviar_prometheus(servidor.getsockname())
+            hilo.join(5)
+        finally:
+            servidor.close()
+        self.assertEqual(recibido, [self.metricas.exportar_prometheus()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+from unittest import mock
+from src.paginacion import Pagina, IndiceOrdenado, paginar
+
+
+class TestPaginar(unittest.TestCase):
+
+    def test_pagina_con_cursor_si_hay_mas(self):
+        pagina = paginar(iter(range(10)), 4, lambda n: n)
+        self.assertEqual(pagina.obtener_elementos(), (0, 1, 2, 3))
+        self.assertEqual(pagina.obtener_cursor(), 3)
+        self.assertTrue(pagina.hay_mas())
+
+    def test_ultima_pagina_sin_cursor(self):
+        pagina = paginar(iter(range(4)), 4, lambda n: n)
+        self.assertEqual(list(pagina), [0, 1, 2, 3])
+        self.assertFalse(pagina.hay_mas())
+        self.assertEqual(len(paginar(iter(()), 4, lambda n: n)), 0)
+
+    def test_tamano_invalido_error(self):
+        with self.assertRaises(ValueError):
+            paginar(iter(range(3)), 0, lambda n: n)
+
+
+class TestIndiceOrdenado(unittest.TestCase):
+
+    def test_queda_ordenado_al_agregar(self):
+        indice = IndiceOrdenado(["c", "a"])
+        indice.agregar("b")
+        indice.agregar("d")
+        self.assertEqual(list(indice.iterar()), ["a", "b", "c", "d"])
+        self.assertEqual(len(indice), 4)
+
+    def test_agregar_varias_fusiona_en_orden(self):
+        indice = IndiceOrdenado(range(0, 1000, 2))
+        indice.agregar_varias([5, 1, 3])
+        indice.agregar_varias(range(999, 0, -10))
+        indice.agregar_varias(range(-500, 2000, 3))
+        claves = indice.siguientes(None, 10000)
+        self.assertEqual(claves, sorted(claves))
+        self.assertEqual(len(claves), 500 + 3 + 100 + 834)
+        self.assertTrue(indice.quitar(5))
+        self.assertFalse(indice.quitar(5))
+
+    def test_siguientes_despues_del_cursor(self):
+        indice = IndiceOrdenado(range(10))
+        self.assertEqual(indice.siguientes(4, 3), [5, 6, 7])
+        self.assertEqual(indice.siguientes(None, 2), [0, 1])
+
+    def test_iterar_de_a_tandas_con_altas_en_el_medio(self):
+        indice = IndiceOrdenado(range(0, 20, 2))
+        recorrido = []
+        for clave in indice.iterar(tanda=3):
+            recorrido.append(clave)
+            if clave == 4:
+                indice.agregar(11)
+        self.assertEqual(recorrido, [0, 2, 4, 6, 8, 10, 11, 12, 14, 16, 18])
+
+    def test_tramos_se_parten_y_se_unen_sin_perder_el_orden(self):
+        # TRAMOS DE 4 CLAVES: CADA OPERACION PARTE O UNE TRAMOS; SE COMPARA CONTRA UNA LISTA ORDENADA
+        azar = random.Random(7)
+        with mock.patch("src.paginacion.CARGA_TRAMO", 4):
+            indice = IndiceOrdenado(range(0, 60, 3))
+            esperado = sorted(range(0, 60, 3))
+            for _ in range(2000):
+                clave = azar.randrange(100)
+                # CLAVES UNICAS, COMO EN TODOS LOS USOS (EL CURSOR DE iterar SALTEA REPETIDAS)
+                if azar.random() < 0.55 and clave not in esperado:
+                    indice.agregar(clave)
+                    esperado.insert(bisect_right(esperado, clave), clave)
+                elif azar.random() < 0.5:
+                    presente = clave in esperado
+                    self.assertEqual(indice.quitar(clave), presente)
+                    if presente:
+                        esperado.pop(bisect_left(esperado, clave))
+                desde, hasta = sorted((azar.randrange(100), azar.randrange(100)))
+                self.assertEqual(indice.contar_entre(desde, hasta), max(0, bisect_left(esperado, hasta) - bisect_right(esperado, desde)))
+                self.assertEqual(indice.siguientes(desde, 5), esperado[bisect_right(esperado, desde):][:5])
+            self.assertEqual(list(indice.iterar(tanda=3)), esperado)
+            self.assertEqual(len(indice), len(esperado))
+
+    def test_agregar_varias_fusiona_tramo_por_tramo(self):
+        azar = random.Random(11)
+        with mock.patch("src.paginacion.CARGA_TRAMO", 4):
+            indice = IndiceOrdenado(range(0, 400, 4))
+            esperado = list(range(0, 400, 4))
+            for tamano in (3, 40, 90, 500, 33):
+                lote = azar.sample([c for c in range(-100, 1000) if c not in esperado], tamano)
+                indice.agregar_varias(lote)
+                esperado = sorted(esperado + lote)
+                self.assertEqual(indice.siguientes(None, 10000), esperado)
+                self.assertEqual(len(indice), len(esperado))
+                self.assertEqual(indice.contar_entre(100, 300), bisect_left(esperado, 300) - bisect_right(esperado, 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,14 @@ class TestReceta(unittest.TestCase):
         receta = Receta(self.paciente_valido, self.medico_valido, medicamentos)
         self.assertIsNotNone(receta)
     
+    def test_obtener_datos_receta(self):
+        fecha = datetime(2025, 6, 16, 10, 30)
+        receta = Receta(self.paciente_valido, self.medico_valido, ["Paracetamol"], fecha)
+        self.assertEqual(receta.obtener_paciente(), self.paciente_valido)
+        self.assertEqual(receta.obtener_medico(), self.medico_valido)
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol"])
+        self.assertEqual(receta.obtener_fecha(), fecha)
+    
     def test_str_representation(self):
         medicamentos = ["Paracetamol", "Ibuprofeno"]
         receta = Receta(self.paciente_valido, self.medico_valido, medicamentos)
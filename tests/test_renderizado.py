@@ -0,0 +1,68 @@
+import unittest
+from datetime import datetime
+from src.renderizado import (
+    firma_medico,
+    texto_turno,
+    linea_medico,
+    linea_paciente,
+    linea_turno,
+    linea_receta
+)
+from src.turno import Turno
+from src.receta import Receta
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestRenderizado(unittest.TestCase):
+
+    def setUp(self):
+        self.cardiologia = Especialidad("cardiologia", ["lunes", "miercoles"])
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [self.cardiologia])
+        self.paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.turno = Turno(self.paciente, self.medico, datetime(2025, 6, 16, 10, 0), "cardiologia")
+
+    def test_firma_se_reutiliza_dentro_de_un_listado(self):
+        firmas = {}
+        self.assertIs(firma_medico(self.medico, firmas), firma_medico(self.medico, firmas))
+        self.assertEqual(firmas, {self.medico: "Dr. Juan Perez (MN1234)"})
+        self.assertEqual(firma_medico(self.medico), "Dr. Juan Perez (MN1234)")
+
+    def test_agregar_especialidad_invalida_el_texto(self):
+        antes = str(self.medico)
+        turno_antes = str(self.turno)
+        linea_medico(self.medico)
+        self.medico.agregar_especialidad(Especialidad("pediatria", ["viernes"]))
+        self.assertNotEqual(str(self.medico), antes)
+        self.assertNotEqual(str(self.turno), turno_antes)
+        self.assertIn("pediatria", linea_medico(self.medico))
+
+    def test_otro_medico_con_la_misma_matricula_no_reutiliza_el_texto(self):
+        str(self.medico)
+        otro = Medico("Dra. Ana Lopez", "MN1234", [self.cardiologia])
+        self.assertIn("Dra. Ana Lopez", str(otro))
+
+    def test_texto_turno_igual_al_formato_completo(self):
+        esperado = (
+            f"Turno(\n"
+            f"  Paciente: {self.paciente},\n"
+            f"  Médico: {self.medico},\n"
+            f"  Especialidad: cardiologia,\n"
+            f"  Fecha y hora: 2025-06-16 10:00\n"
+            f")"
+        )
+        self.assertEqual(texto_turno(self.turno), esperado)
+
+    def test_lineas_compactas(self):
+        receta = Receta(self.paciente, self.medico, ["Aspirina", "Ibuprofeno"], datetime(2025, 6, 16))
+        self.assertEqual(linea_paciente(self.paciente), "Carlos Rodriguez - DNI: 12345678")
+        self.assertEqual(linea_medico(self.medico), "Dr. Juan Perez - Matrícula: MN1234 - cardiologia")
+        self.assertEqual(linea_turno(self.turno), "16/06/2025 10:00 - cardiologia - Carlos Rodriguez - DNI: 12345678 con Dr. Juan Perez (MN1234)")
+        self.assertEqual(linea_turno(self.turno, con_paciente=False), "16/06/2025 10:00 - cardiologia con Dr. Juan Perez (MN1234)")
+        self.assertEqual(linea_receta(receta, con_paciente=False), "16/06/2025 - Aspirina, Ibuprofeno - Dr. Juan Perez (MN1234)")
+        self.assertNotIn("\n", linea_turno(self.turno))
+
+
+if __name__ == '__main__':
+    unittest.main()
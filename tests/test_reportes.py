@@ -0,0 +1,100 @@
+import unittest
+from datetime import datetime, date, timedelta
+from unittest import mock
+import src.reportes
+import src.tabla_turnos
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.eventos import RegistroNulo
+from src.reportes import utilizacion_por_medico, demanda_por_especialidad
+
+
+class CasosReportes:
+
+    # LOS MISMOS CASOS PARA LAS DOS RUTAS (NUMPY Y PYTHON PURO): DEBEN DAR LO MISMO
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica({}, {}, [], {}, registro=RegistroNulo())
+        self.clinica.agregar_medico(Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes", "miércoles"])]))
+        self.clinica.agregar_medico(Medico("Dra. Ana Gomez", "MP5678", [Especialidad("pediatria", ["lunes"])]))
+        self.clinica.agregar_paciente(Paciente("Carlos Rodriguez", "12345678", "15/05/1980"))
+        self.clinica.agregar_paciente(Paciente("Maria Gonzalez", "87654321", "20/10/1975"))
+
+        # LUNES 16/06/2025 Y MIERCOLES 18/06/2025; LUNES 23/06/2025 DE LA SEMANA SIGUIENTE
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", datetime(2025, 6, 16, 10, 0))
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", datetime(2025, 6, 18, 10, 0), timedelta(minutes=60))
+        self.clinica.agendar_turno("12345678", "MP5678", "pediatria", datetime(2025, 6, 16, 11, 0))
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", datetime(2025, 6, 23, 9, 0))
+
+    def test_reportes_sin_turnos(self):
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo())
+        self.assertEqual(utilizacion_por_medico(clinica), [])
+        self.assertEqual(demanda_por_especialidad(clinica), {})
+
+    def test_utilizacion_por_medico_y_semana(self):
+        reporte = utilizacion_por_medico(self.clinica)
+        filas = {(f.obtener_matricula(), f.obtener_semana()): f for f in reporte}
+        self.assertEqual(len(reporte), 4)
+
+        primera = filas[("MN1234", date(2025, 6, 16))]
+        self.assertEqual(primera.obtener_turnos(), 2)
+        self.assertEqual(primera.obtener_minutos_ocupados(), 90)
+        self.assertEqual(primera.obtener_minutos_disponibles(), 2 * 600)
+        self.assertAlmostEqual(primera.obtener_utilizacion(), 90 / 1200)
+
+        # LA SEGUNDA SEMANA SOLO INCLUYE EL LUNES DENTRO DEL RANGO
+        segunda = filas[("MN1234", date(2025, 6, 23))]
+        self.assertEqual(segunda.obtener_turnos(), 1)
+        self.assertEqual(segunda.obtener_minutos_disponibles(), 600)
+
+        sin_turnos = filas[("MP5678", date(2025, 6, 23))]
+        self.assertEqual(sin_turnos.obtener_turnos(), 0)
+        self.assertEqual(sin_turnos.obtener_minutos_disponibles(), 600)
+
+    def test_utilizacion_en_rango(self):
+        reporte = utilizacion_por_medico(self.clinica, date(2025, 6, 16), date(2025, 6, 22))
+        self.assertEqual({f.obtener_matricula(): f.obtener_turnos() for f in reporte}, {"MN1234": 2, "MP5678": 1})
+
+    def test_demanda_por_especialidad(self):
+        demanda = demanda_por_especialidad(self.clinica)
+        self.assertEqual(demanda, {
+            "cardiologia": {date(2025, 6, 16): 1, date(2025, 6, 18): 1, date(2025, 6, 23): 1},
+            "pediatria": {date(2025, 6, 16): 1}
+        })
+
+    def test_demanda_excluye_turnos_dados_de_baja(self):
+        self.clinica.obtener_tabla_turnos().desactivar(0)
+        demanda = demanda_por_especialidad(self.clinica, date(2025, 6, 16), date(2025, 6, 16))
+        self.assertEqual(demanda, {"pediatria": {date(2025, 6, 16): 1}})
+
+
+    def test_rango_vacio_o_invertido(self):
+        """Test un rango sin días devuelve un reporte vacío en vez de fallar"""
+        self.assertEqual(utilizacion_por_medico(self.clinica, date(2025, 7, 1)), [])
+        self.assertEqual(demanda_por_especialidad(self.clinica, date(2025, 7, 1)), {})
+        self.assertEqual(utilizacion_por_medico(self.clinica, date(2025, 6, 20), date(2025, 6, 10)), [])
+        self.assertEqual(demanda_por_especialidad(self.clinica, date(2025, 6, 20), date(2025, 6, 10)), {})
+        self.assertEqual(demanda_por_especialidad(self.clinica, None, date(2025, 6, 1)), {})
+
+
+@unittest.skipIf(src.reportes.np is None, "numpy no está instalado")
+class TestReportesNumpy(CasosReportes, unittest.TestCase):
+    pass
+
+
+class TestReportesPython(CasosReportes, unittest.TestCase):
+
+    def setUp(self):
+        # SIN NUMPY AUNQUE ESTE INSTALADO: LA TABLA DEVUELVE array Y LOS REPORTES USAN Counter
+        for modulo in (src.reportes, src.tabla_turnos):
+            parche = mock.patch.object(modulo, "np", None)
+            parche.start()
+            self.addCleanup(parche.stop)
+        super().setUp()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,314 @@
+import unittest
+from unittest import mock
+import os
+import tempfile
+from datetime import datetime, date, timedelta
+from src.repositorio import RepositorioClinica
+from src.repositorio_sqlite import RepositorioSQLite
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+from src.serie_turnos import SerieTurnos
+from src.eventos import RegistroNulo
+from src.excepciones import TurnoOcupadoException
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.repositorio = RepositorioSQLite(":memory:")
+        self.especialidad = Especialidad("cardiologia", ["lunes", "miercoles"])
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [self.especialidad])
+        self.paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+
+    def tearDown(self):
+        self.repositorio.cerrar()
+
+    def test_repositorio_base_es_abstracto(self):
+        with self.assertRaises(TypeError):
+            RepositorioClinica()
+        self.assertIsInstance(self.repositorio, RepositorioClinica)
+
+    def test_guardar_y_obtener_paciente(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        paciente = self.repositorio.obtener_paciente("12345678")
+        self.assertEqual(str(paciente), str(self.paciente))
+        self.assertIsNone(self.repositorio.obtener_paciente("99999999"))
+
+    def test_guardar_y_obtener_medico_con_especialidades(self):
+        self.repositorio.guardar_medico(self.medico)
+        medico = self.repositorio.obtener_medico("MN1234")
+        self.assertEqual(medico.obtener_nombre(), "Dr. Juan Perez")
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "cardiologia")
+        self.assertIsNone(self.repositorio.obtener_medico("MN9999"))
+
+    def test_existe_turno(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha, "cardiologia"))
+
+        self.assertTrue(self.repositorio.existe_turno("MN1234", self.fecha))
+        self.assertFalse(self.repositorio.existe_turno("MN1234", datetime(2025, 6, 16, 11, 0)))
+
+    def test_existe_superposicion(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha, "cardiologia"))
+
+        self.assertTrue(self.repositorio.existe_superposicion("MN1234", datetime(2025, 6, 16, 10, 10), datetime(2025, 6, 16, 10, 40)))
+        self.assertFalse(self.repositorio.existe_superposicion("MN1234", datetime(2025, 6, 16, 10, 30), datetime(2025, 6, 16, 11, 0)))
+
+    def test_guardar_listar_y_eliminar_serie(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", self.fecha, cantidad=4, excluidas=[2])
+        serie._avanzar(1)
+        self.repositorio.guardar_serie(serie)
+
+        guardada, = self.repositorio.listar_series()
+        self.assertEqual(guardada.obtener_clave(), ("MN1234", self.fecha))
+        self.assertEqual(guardada.obtener_excluidas(), frozenset({2}))
+        self.assertEqual(guardada.obtener_materializadas(), 1)
+        self.assertEqual(guardada.obtener_duracion(), serie.obtener_duracion())
+        self.assertTrue(self.repositorio.eliminar_serie("MN1234", self.fecha))
+        self.assertEqual(list(self.repositorio.listar_series()), [])
+
+    def test_existe_superposicion_con_ocurrencias_de_series(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", self.fecha, cantidad=4, excluidas=[2])
+        serie._avanzar(1)
+        self.repositorio.guardar_serie(serie)
+        media_hora = timedelta(minutes=30)
+
+        semana_2 = self.fecha + timedelta(weeks=1)
+        self.assertTrue(self.repositorio.existe_superposicion("MN1234", semana_2 + timedelta(minutes=15), semana_2 + timedelta(minutes=45)))
+        self.assertFalse(self.repositorio.existe_superposicion("MN1234", semana_2 + media_hora, semana_2 + 2 * media_hora))
+        self.assertFalse(self.repositorio.existe_superposicion("MN1234", semana_2, semana_2 + media_hora, excepto=semana_2))
+        # LA PRIMERA YA ES UN TURNO (MATERIALIZADA), LA TERCERA ESTA EXCLUIDA Y NO HAY QUINTA
+        for semanas in (0, 2, 4):
+            fecha = self.fecha + timedelta(weeks=semanas)
+            self.assertFalse(self.repositorio.existe_superposicion("MN1234", fecha, fecha + media_hora))
+
+    def test_listar_intervalos_turnos_incluye_el_que_empieza_antes(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        for hora, minutos in ((9, 90), (11, 30), (13, 30)):
+            self.repositorio.guardar_turno(Turno(self.paciente, self.medico, datetime(2025, 6, 16, hora, 0), "cardiologia", timedelta(minutes=minutos)))
+
+        intervalos = self.repositorio.listar_intervalos_turnos("MN1234", datetime(2025, 6, 16, 10, 0), datetime(2025, 6, 16, 13, 0))
+
+        self.assertEqual(intervalos, [
+            (datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 16, 10, 30)),
+            (datetime(2025, 6, 16, 11, 0), datetime(2025, 6, 16, 11, 30)),
+        ])
+        self.assertEqual(self.repositorio.listar_intervalos_turnos("MN1234", datetime(2025, 6, 16, 10, 30), datetime(2025, 6, 16, 11, 0)), [])
+
+    def test_turnos_libres_con_una_consulta_por_dia(self):
+        """Test los turnos de sesiones anteriores se descartan sin consultar hueco por hueco"""
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, datetime(2025, 6, 16, 8, 0), "cardiologia", timedelta(hours=1)))
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio)
+
+        with mock.patch.object(self.repositorio, "existe_superposicion", side_effect=AssertionError("consulta por hueco")), \
+             mock.patch.object(self.repositorio, "listar_intervalos_turnos", wraps=self.repositorio.listar_intervalos_turnos) as consulta:
+            libres = clinica.buscar_turnos_libres("cardiologia", datetime(2025, 6, 16, 8, 0), datetime(2025, 6, 16, 18, 0), cantidad=2)
+
+        self.assertEqual([fecha for fecha, _ in libres], [datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 16, 9, 30)])
+        self.assertEqual(consulta.call_count, 1)
+
+    def test_agendar_serie_consulta_el_repositorio_una_vez(self):
+        """Test las ocurrencias se validan contra una sola consulta por todo el rango de la serie"""
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha + timedelta(weeks=3, minutes=15), "cardiologia"))
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio)
+
+        with mock.patch.object(self.repositorio, "existe_superposicion", side_effect=AssertionError("consulta por ocurrencia")), \
+             mock.patch.object(self.repositorio, "listar_intervalos_turnos", wraps=self.repositorio.listar_intervalos_turnos) as consulta:
+            resultados = clinica.agendar_serie(SerieTurnos("12345678", "MN1234", "cardiologia", self.fecha, cantidad=52), atomica=False)
+
+        self.assertEqual(consulta.call_count, 1)
+        self.assertEqual([i for i, r in enumerate(resultados) if not r], [3])
+
+    def test_obtener_y_eliminar_turno(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha, "cardiologia"))
+
+        turno = self.repositorio.obtener_turno("MN1234", self.fecha, lambda dni: self.paciente, lambda matricula: self.medico)
+        self.assertEqual(turno.obtener_especialidad(), "cardiologia")
+        corrido = datetime(2025, 6, 16, 10, 15)
+        self.assertFalse(self.repositorio.existe_superposicion("MN1234", corrido, datetime(2025, 6, 16, 10, 45), excepto=self.fecha))
+
+        self.assertTrue(self.repositorio.eliminar_turno("MN1234", self.fecha))
+        self.assertFalse(self.repositorio.eliminar_turno("MN1234", self.fecha))
+        self.assertIsNone(self.repositorio.obtener_turno("MN1234", self.fecha, lambda dni: self.paciente, lambda matricula: self.medico))
+
+    def test_listar_turnos_por_dni_y_entre_fechas(self):
+        otro = Paciente("Ana Lopez", "20000000", "01/01/1990")
+        for paciente in (self.paciente, otro):
+            self.repositorio.guardar_paciente(paciente)
+        self.repositorio.guardar_medico(self.medico)
+        pacientes = {"12345678": self.paciente, "20000000": otro}
+        for paciente, fecha in ((self.paciente, datetime(2025, 6, 18, 9, 0)), (otro, self.fecha), (self.paciente, self.fecha.replace(hour=11))):
+            self.repositorio.guardar_turno(Turno(paciente, self.medico, fecha, "cardiologia"))
+
+        por_dni = self.repositorio.listar_turnos_por_dni("12345678", pacientes.get, lambda matricula: self.medico)
+        self.assertEqual([t.obtener_fecha_hora() for t in por_dni], [self.fecha.replace(hour=11), datetime(2025, 6, 18, 9, 0)])
+        del_dia = self.repositorio.listar_turnos_entre(datetime(2025, 6, 16), datetime(2025, 6, 17), pacientes.get, lambda matricula: self.medico)
+        self.assertEqual([t.obtener_paciente().obtener_dni() for t in del_dia], ["20000000", "12345678"])
+
+    def test_cargar_historia(self):
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.assertIsNone(self.repositorio.cargar_historia(self.paciente, lambda m: self.medico))
+
+        self.repositorio.guardar_historia("12345678")
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha, "cardiologia"))
+        self.repositorio.guardar_receta(Receta(self.paciente, self.medico, ["Aspirina"], datetime(2025, 6, 16, 10, 30)))
+
+        historia = self.repositorio.cargar_historia(self.paciente, lambda m: self.medico)
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Aspirina"])
+
+    def test_listados_retoman_despues_del_cursor(self):
+        for dni in ("30000000", "10000000", "20000000"):
+            self.repositorio.guardar_paciente(Paciente("Paciente", dni, "01/01/1990"))
+        self.repositorio.guardar_paciente(self.paciente)
+        self.repositorio.guardar_medico(self.medico)
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha, "cardiologia"))
+        self.repositorio.guardar_turno(Turno(self.paciente, self.medico, self.fecha.replace(hour=11), "cardiologia"))
+
+        self.assertEqual([p.obtener_dni() for p in self.repositorio.listar_pacientes("12345678")], ["20000000", "30000000"])
+        self.assertEqual(list(self.repositorio.listar_medicos("MN1234")), [])
+        turnos = self.repositorio.listar_turnos(lambda dni: self.paciente, lambda matricula: self.medico, (self.fecha, "MN1234"))
+        self.assertEqual([t.obtener_fecha_hora().hour for t in turnos], [11])
+
+    def test_clinica_recupera_datos_tras_reinicio(self):
+        """Test una clínica nueva sobre la misma base ve los datos de la anterior"""
+        directorio = tempfile.mkdtemp()
+        ruta = os.path.join(directorio, "clinica.db")
+
+        repositorio = RepositorioSQLite(ruta)
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=repositorio)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        clinica.emitir_receta("12345678", "MN1234", ["Aspirina"])
+        repositorio.cerrar()
+
+        repositorio = RepositorioSQLite(ruta)
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=repositorio)
+        try:
+            self.assertTrue(clinica.validar_existencia_paciente("12345678"))
+            self.assertEqual(len(clinica.obtener_medicos()), 1)
+            self.assertEqual(len(clinica.obtener_turnos()), 1)
+            self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos_por_dni("12345678")], [self.fecha])
+            self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos_por_fecha(self.fecha.date())], [self.fecha])
+            self.assertEqual(clinica.obtener_turnos_por_fecha(date(2025, 6, 17)), [])
+            self.assertEqual(clinica.obtener_tabla_turnos().contar_por_medico(), {"MN1234": 1})
+            self.assertEqual(len(clinica.obtener_historia_clinica_por_DNI("12345678").obtener_recetas()), 1)
+            with self.assertRaises(TurnoOcupadoException):
+                clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+            # UN TURNO DE UNA SESION ANTERIOR SE CANCELA EN LA BASE
+            self.assertTrue(clinica.cancelar_turno("MN1234", self.fecha))
+            self.assertFalse(repositorio.existe_turno("MN1234", self.fecha))
+            self.assertTrue(clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha))
+        finally:
+            repositorio.cerrar()
+            for nombre in os.listdir(directorio):
+                os.remove(os.path.join(directorio, nombre))
+            os.rmdir(directorio)
+
+    def test_arranque_no_carga_turnos_ni_pacientes(self):
+        """Test la tabla de turnos y el índice de nombres se arman recién cuando se usan"""
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+
+        with mock.patch.object(self.repositorio, "listar_filas_turnos", wraps=self.repositorio.listar_filas_turnos) as filas, \
+             mock.patch.object(self.repositorio, "listar_pacientes", wraps=self.repositorio.listar_pacientes) as pacientes:
+            clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio)
+            self.assertEqual(filas.call_count, 0)
+            self.assertEqual(pacientes.call_count, 0)
+            clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha + timedelta(days=2))
+
+            self.assertEqual(clinica.obtener_tabla_turnos().contar_por_medico(), {"MN1234": 2})
+            self.assertEqual(clinica.obtener_tabla_turnos().contar_por_medico(), {"MN1234": 2})
+            self.assertEqual(filas.call_count, 1)
+            self.assertEqual([p.obtener_dni() for p in clinica.buscar_pacientes("carl")], ["12345678"])
+            clinica.buscar_pacientes("rodri")
+            self.assertEqual(pacientes.call_count, 1)
+
+        # YA ARMADOS, SIGUEN AL DIA CON LAS ALTAS Y CANCELACIONES
+        clinica.agregar_paciente(Paciente("Carla Gomez", "87654321", "20/10/1975"))
+        self.assertEqual(len(clinica.buscar_pacientes("carl", aproximado=False)), 2)
+        clinica.cancelar_turno("MN1234", self.fecha)
+        self.assertEqual(clinica.obtener_tabla_turnos().contar_por_medico(), {"MN1234": 1})
+
+    def test_especialidad_agregada_persiste_tras_reinicio(self):
+        """Test una especialidad agregada a un médico ya guardado queda en la base"""
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio)
+        clinica.agregar_medico(self.medico)
+        neurologia = Especialidad("neurologia", ["viernes"])
+        self.assertTrue(clinica.agregar_especialidad_a_medico("MN1234", neurologia))
+        self.assertTrue(clinica.agregar_especialidad_a_medico("MN1234", Especialidad("neurologia", ["viernes"])))
+        self.assertFalse(clinica.agregar_especialidad_a_medico("MN9999", neurologia))
+
+        medico = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=self.repositorio).obtener_medico_por_matricula("MN1234")
+        self.assertEqual([e.obtener_especialidad() for e in medico.obtener_especialidades()], ["cardiologia", "neurologia"])
+        self.assertEqual(medico.obtener_especialidad_para_dia("viernes"), "neurologia")
+
+    def test_series_persisten_tras_reinicio(self):
+        """Test una serie agendada en una sesión anterior sigue ocupando sus horarios"""
+        directorio = tempfile.mkdtemp()
+        ruta = os.path.join(directorio, "clinica.db")
+        otro_paciente = Paciente("Maria Gonzalez", "87654321", "20/10/1975")
+
+        repositorio = RepositorioSQLite(ruta)
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=repositorio)
+        clinica.agregar_medico(self.medico)
+        clinica.agregar_paciente(self.paciente)
+        clinica.agregar_paciente(otro_paciente)
+        clinica.agendar_serie(SerieTurnos("12345678", "MN1234", "cardiologia", self.fecha, cantidad=3))
+        repositorio.cerrar()
+
+        repositorio = RepositorioSQLite(ruta)
+        clinica = Clinica({}, {}, [], {}, registro=RegistroNulo(), repositorio=repositorio)
+        try:
+            self.assertEqual(len(clinica.obtener_series("MN1234")), 1)
+            semana_2 = self.fecha + timedelta(weeks=1)
+            self.assertTrue(repositorio.existe_superposicion("MN1234", semana_2, semana_2 + timedelta(minutes=30)))
+            with self.assertRaises(TurnoOcupadoException):
+                clinica.agendar_turno("87654321", "MN1234", "cardiologia", semana_2)
+
+            # MATERIALIZAR Y CANCELAR ACTUALIZAN LA FILA; SIN PENDIENTES SE BORRA
+            self.assertEqual(clinica.materializar_series(semana_2), 1)
+            guardada, = repositorio.listar_series()
+            self.assertEqual(guardada.obtener_materializadas(), 1)
+            self.assertTrue(clinica.cancelar_turno("MN1234", semana_2))
+            guardada, = repositorio.listar_series()
+            self.assertEqual(guardada.obtener_excluidas(), frozenset({1}))
+            self.assertTrue(clinica.agendar_turno("87654321", "MN1234", "cardiologia", semana_2))
+            self.assertTrue(clinica.cancelar_turno("MN1234", self.fecha + timedelta(weeks=2)))
+            self.assertEqual(list(repositorio.listar_series()), [])
+            self.assertEqual(clinica.obtener_series(), [])
+        finally:
+            repositorio.cerrar()
+            for nombre in os.listdir(directorio):
+                os.remove(os.path.join(directorio, nombre))
+            os.rmdir(directorio)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from src.resultado import ResultadoOperacion, TURNO_OCUPADO
+
+
+class TestResultadoOperacion(unittest.TestCase):
+
+    def test_resultado_exitoso(self):
+        resultado = ResultadoOperacion(True, "Turno agendado correctamente", objeto="turno")
+        self.assertTrue(resultado)
+        self.assertTrue(resultado.obtener_exito())
+        self.assertIsNone(resultado.obtener_motivo())
+        self.assertEqual(resultado.obtener_objeto(), "turno")
+
+    def test_resultado_fallido(self):
+        resultado = ResultadoOperacion(False, "Turno ocupado", TURNO_OCUPADO)
+        self.assertFalse(resultado)
+        self.assertEqual(resultado.obtener_motivo(), TURNO_OCUPADO)
+        self.assertIsNone(resultado.obtener_objeto())
+
+    def test_str_representation(self):
+        resultado = ResultadoOperacion(False, "Turno ocupado", TURNO_OCUPADO)
+        self.assertEqual(str(resultado), "Turno ocupado")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+from datetime import datetime, date, timedelta
+from src.serie_turnos import SerieTurnos
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.historia_clinica import HistoriaClinica
+from src.eventos import RegistroNulo
+from src.resultado import DIA_NO_DISPONIBLE, TURNO_OCUPADO, SERIE_RECHAZADA
+from src.excepciones import TurnoOcupadoException
+
+
+class TestSerieTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.inicio = datetime(2025, 6, 16, 10, 0)  # LUNES
+
+    def test_ocurrencias_semanales_y_quincenales(self):
+        semanal = SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, cantidad=3)
+        self.assertEqual(list(semanal.fechas()), [self.inicio + timedelta(weeks=i) for i in range(3)])
+        quincenal = SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, "quincenal", cantidad=2)
+        self.assertEqual(quincenal.ocurrencia(1), datetime(2025, 6, 30, 10, 0))
+
+    def test_hasta_fecha_inclusive(self):
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, hasta=date(2025, 7, 7))
+        self.assertEqual(len(serie), 4)
+        self.assertEqual(serie.ocurrencia(3), datetime(2025, 7, 7, 10, 0))
+
+    def test_parametros_invalidos_error(self):
+        with self.assertRaises(ValueError):
+            SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio)
+        with self.assertRaises(ValueError):
+            SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, cantidad=2, hasta=date(2025, 7, 7))
+        with self.assertRaises(ValueError):
+            SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, "mensual", cantidad=2)
+        with self.assertRaises(ValueError):
+            SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, hasta=date(2025, 6, 1))
+
+    def test_superpone_solo_ocurrencias_pendientes(self):
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, cantidad=4, excluidas=[2])
+        semana = timedelta(weeks=1)
+        self.assertTrue(serie.superpone(self.inicio + semana + timedelta(minutes=15), self.inicio + semana + timedelta(minutes=45)))
+        self.assertFalse(serie.superpone(self.inicio + timedelta(minutes=30), self.inicio + timedelta(hours=1)))
+        self.assertFalse(serie.superpone(self.inicio + 2 * semana, self.inicio + 2 * semana + timedelta(minutes=30)))
+        self.assertFalse(serie.superpone(self.inicio + 4 * semana, self.inicio + 4 * semana + timedelta(minutes=30)))
+        self.assertTrue(serie.contiene(self.inicio))
+        serie._avanzar(2)
+        self.assertFalse(serie.contiene(self.inicio))
+        self.assertEqual([indice for indice, _ in serie.pendientes()], [3])
+        self.assertEqual(serie.cantidad_pendientes(), 1)
+
+    def test_ocurrencias_antes_de(self):
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, cantidad=10)
+        self.assertEqual(serie.ocurrencias_antes_de(self.inicio), 0)
+        self.assertEqual(serie.ocurrencias_antes_de(datetime(2025, 7, 1)), 3)
+        self.assertEqual(serie.ocurrencias_antes_de(datetime(2030, 1, 1)), 10)
+
+
+class TestClinicaSeries(unittest.TestCase):
+
+    def setUp(self):
+        self.medico = Medico("Dr. Juan Perez", "MN1234", [Especialidad("cardiologia", ["lunes", "miercoles"])])
+        self.paciente = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.otro_paciente = Paciente("Maria Gonzalez", "87654321", "20/10/1975")
+        self.clinica = Clinica(
+            {"MN1234": self.medico},
+            {"12345678": self.paciente, "87654321": self.otro_paciente},
+            [],
+            {"12345678": HistoriaClinica(self.paciente)},
+            registro=RegistroNulo()
+        )
+        self.inicio = datetime(2025, 6, 16, 10, 0)  # LUNES
+
+    def _serie(self, cantidad: int = 8) -> SerieTurnos:
+        return SerieTurnos("12345678", "MN1234", "cardiologia", self.inicio, cantidad=cantidad)
+
+    def test_serie_se_guarda_como_regla(self):
+        resultados = self.clinica.agendar_serie(self._serie())
+        self.assertEqual(len(resultados), 8)
+        self.assertTrue(all(resultados))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 0)
+        self.assertEqual(len(self.clinica.obtener_series(dni="12345678")), 1)
+        # LAS OCURRENCIAS PENDIENTES OCUPAN EL HORARIO
+        self.assertTrue(self.clinica.validar_turno_duplicado("MN1234", self.inicio + timedelta(weeks=3)))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.inicio + timedelta(weeks=2))
+
+    def test_dia_no_atendido_rechaza_toda_la_serie(self):
+        serie = SerieTurnos("12345678", "MN1234", "cardiologia", datetime(2025, 6, 17, 10, 0), cantidad=5)
+        resultados = self.clinica.agendar_serie(serie)
+        self.assertEqual([r.obtener_motivo() for r in resultados], [DIA_NO_DISPONIBLE] * 5)
+        self.assertEqual(self.clinica.obtener_series(), [])
+
+    def test_serie_atomica_con_conflicto_no_agenda_nada(self):
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.inicio + timedelta(weeks=2))
+        resultados = self.clinica.agendar_serie(self._serie(4))
+        self.assertEqual([r.obtener_motivo() for r in resultados], [SERIE_RECHAZADA, SERIE_RECHAZADA, TURNO_OCUPADO, SERIE_RECHAZADA])
+        self.assertEqual(self.clinica.obtener_series(), [])
+        self.assertFalse(self.clinica.validar_turno_duplicado("MN1234", self.inicio))
+
+    def test_serie_parcial_agenda_las_libres(self):
+        self.clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.inicio + timedelta(weeks=2, minutes=15))
+        resultados = self.clinica.agendar_serie(self._serie(4), atomica=False)
+        self.assertEqual([bool(r) for r in resultados], [True, True, False, True])
+        serie = self.clinica.obtener_series()[0]
+        self.assertEqual(serie.obtener_excluidas(), frozenset({2}))
+        self.assertEqual(self.clinica.materializar_series(datetime(2026, 1, 1)), 3)
+
+    def test_series_del_mismo_medico_no_se_superponen(self):
+        self.clinica.agendar_serie(self._serie(4))
+        otra = SerieTurnos("87654321", "MN1234", "cardiologia", self.inicio + timedelta(weeks=2), "quincenal", cantidad=3)
+        resultados = self.clinica.agendar_serie(otra)
+        self.assertEqual(resultados[0].obtener_motivo(), TURNO_OCUPADO)
+
+    def test_materializar_crea_turnos_hasta_la_fecha(self):
+        self.clinica.agendar_serie(self._serie())
+        self.assertEqual(self.clinica.materializar_series(self.inicio + timedelta(weeks=3)), 3)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica_por_DNI("12345678").obtener_turnos()), 3)
+        self.assertEqual(self.clinica.materializar_series(self.inicio + timedelta(weeks=3)), 0)
+        # LOS HUECOS LIBRES RESPETAN LAS OCURRENCIAS MATERIALIZADAS Y LAS PENDIENTES
+        libres = self.clinica.buscar_turnos_libres("cardiologia", self.inicio + timedelta(weeks=5), self.inicio + timedelta(weeks=5, hours=1), cantidad=2)
+        self.assertEqual([fecha for fecha, _ in libres], [self.inicio + timedelta(weeks=5, minutes=30)])
+
+        self.assertEqual(self.clinica.materializar_series(datetime(2026, 1, 1)), 5)
+        self.assertEqual(self.clinica.obtener_series(), [])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import os
+import pickle
+import tempfile
+from datetime import datetime, timedelta
+from src.snapshot import guardar_snapshot, cargar_snapshot, MAGIA, VERSION
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.historia_clinica import HistoriaClinica
+from src.eventos import RegistroNulo
+from src.serie_turnos import SerieTurnos
+from src.excepciones import SnapshotInvalidoException, TurnoOcupadoException
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.snap")
+
+        especialidades = [Especialidad("cardiologia", ["lunes"]), Especialidad("clinica", ["martes"])]
+        self.medico = Medico("Dr. Juan Perez", "MN1234", especialidades)
+        self.paciente1 = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.paciente2 = Paciente("Maria Gonzalez", "87654321", "20/10/1975")
+        self.clinica = Clinica(
+            {"MN1234": self.medico},
+            {"12345678": self.paciente1, "87654321": self.paciente2},
+            [],
+            {"12345678": HistoriaClinica(self.paciente1)},
+            registro=RegistroNulo()
+        )
+        self.fecha = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MN1234", "cardiologia", self.fecha)
+        self.clinica.agendar_turno("87654321", "MN1234", "clinica", datetime(2025, 6, 17, 10, 0))
+        self.clinica.emitir_receta("12345678", "MN1234", ["Aspirina", "Ibuprofeno"])
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_guardar_y_cargar_conserva_estado(self):
+        guardar_snapshot(self.clinica, self.ruta)
+        clinica = cargar_snapshot(self.ruta, registro=RegistroNulo())
+
+        self.assertEqual(set(clinica.obtener_pacientes_dict()), {"12345678", "87654321"})
+        medico = clinica.obtener_medico_por_matricula("MN1234")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "clinica")
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+
+        historia = clinica.obtener_historia_clinica_por_DNI("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        receta = historia.obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medicamentos(), ["Aspirina", "Ibuprofeno"])
+        self.assertEqual(receta.obtener_fecha(), self.clinica.obtener_historia_clinica_por_DNI("12345678").obtener_recetas()[0].obtener_fecha())
+
+    def test_objetos_compartidos_por_referencia(self):
+        guardar_snapshot(self.clinica, self.ruta)
+        clinica = cargar_snapshot(self.ruta, registro=RegistroNulo())
+
+        turno_agenda = clinica.obtener_turnos_por_dni("12345678")[0]
+        turno_historia = clinica.obtener_historia_clinica_por_DNI("12345678").obtener_turnos()[0]
+        self.assertIs(turno_agenda, turno_historia)
+        self.assertIs(turno_agenda.obtener_medico(), clinica.obtener_medico_por_matricula("MN1234"))
+
+    def test_indices_reconstruidos(self):
+        guardar_snapshot(self.clinica, self.ruta)
+        clinica = cargar_snapshot(self.ruta, registro=RegistroNulo())
+
+        self.assertTrue(clinica.validar_turno_duplicado("MN1234", self.fecha))
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("87654321", "MN1234", "cardiologia", self.fecha)
+
+    def test_series_pendientes_se_conservan(self):
+        serie = SerieTurnos("87654321", "MN1234", "cardiologia", datetime(2025, 6, 23, 10, 0), cantidad=4)
+        self.clinica.agendar_serie(serie)
+        self.clinica.materializar_series(datetime(2025, 7, 1))
+        guardar_snapshot(self.clinica, self.ruta)
+        clinica = cargar_snapshot(self.ruta, registro=RegistroNulo())
+
+        restaurada = clinica.obtener_series()[0]
+        self.assertEqual(restaurada.obtener_materializadas(), 2)
+        self.assertEqual(len(clinica.obtener_turnos()), 4)
+        self.assertTrue(clinica.validar_turno_duplicado("MN1234", datetime(2025, 7, 14, 10, 0)))
+        self.assertEqual(clinica.materializar_series(datetime(2026, 1, 1)), 2)
+
+    def test_archivo_no_snapshot_error(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es un snapshot")
+        with self.assertRaises(SnapshotInvalidoException):
+            cargar_snapshot(self.ruta)
+
+    def test_snapshot_con_clases_rechazado(self):
+        import zlib
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(MAGIA + bytes([VERSION]) + zlib.compress(pickle.dumps(self.paciente1)))
+        with self.assertRaises(SnapshotInvalidoException):
+            cargar_snapshot(self.ruta)
+
+
+if __name__ == '__main__':
+    unittest.main()
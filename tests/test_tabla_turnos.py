@@ -0,0 +1,86 @@
+import unittest
+from array import array
+from datetime import datetime, date, timedelta
+from src.tabla_turnos import TablaTurnos, a_minutos, desde_minutos
+from src.turno import Turno
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestTablaTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.cardiologia = Especialidad("cardiologia", ["lunes", "martes"])
+        self.pediatria = Especialidad("pediatria", ["lunes"])
+        self.medico1 = Medico("Dr. Juan Perez", "MN1234", [self.cardiologia])
+        self.medico2 = Medico("Dra. Ana Gomez", "MP5678", [self.pediatria])
+        self.paciente1 = Paciente("Carlos Rodriguez", "12345678", "15/05/1980")
+        self.paciente2 = Paciente("Maria Gonzalez", "87654321", "20/10/1975")
+
+        self.tabla = TablaTurnos()
+        self.tabla.agregar(Turno(self.paciente1, self.medico1, datetime(2025, 6, 16, 10, 0), "cardiologia"))
+        self.tabla.agregar(Turno(self.paciente2, self.medico1, datetime(2025, 6, 17, 10, 0), "cardiologia"))
+        self.tabla.agregar(Turno(self.paciente1, self.medico2, datetime(2025, 6, 16, 11, 0), "pediatria", timedelta(minutes=45)))
+
+    def test_minutos_desde_epoca(self):
+        fecha = datetime(2025, 6, 16, 10, 30)
+        self.assertEqual(desde_minutos(a_minutos(fecha)), fecha)
+
+    def test_tabla_vacia(self):
+        tabla = TablaTurnos()
+        self.assertEqual(len(tabla), 0)
+        self.assertEqual(tabla.contar_por_medico(), {})
+        self.assertEqual(tabla.contar_por_dia(), {})
+
+    def test_codigos_enteros(self):
+        columnas = self.tabla.obtener_columnas()
+        self.assertEqual(list(columnas["medico"]), [0, 0, 1])
+        self.assertEqual(list(columnas["paciente"]), [0, 1, 0])
+        self.assertEqual(list(columnas["duracion"]), [30, 30, 45])
+        self.assertEqual(self.tabla.obtener_medicos().obtener_texto(1), "MP5678")
+        self.assertEqual(self.tabla.obtener_especialidades().obtener_codigo("pediatria"), 1)
+
+    def test_columnas_son_copias(self):
+        columnas = self.tabla.obtener_columnas()
+        self.tabla.agregar_fila("MN1234", "12345678", "cardiologia", datetime(2025, 6, 23, 9, 0), timedelta(minutes=30))
+        self.assertEqual(len(columnas["medico"]), 3)
+        self.assertEqual(len(self.tabla), 4)
+
+    def test_contar_por_medico(self):
+        self.assertEqual(self.tabla.contar_por_medico(), {"MN1234": 2, "MP5678": 1})
+
+    def test_contar_por_especialidad(self):
+        self.assertEqual(self.tabla.contar_por_especialidad(), {"cardiologia": 2, "pediatria": 1})
+
+    def test_contar_por_paciente(self):
+        self.assertEqual(self.tabla.contar_por_paciente(), {"12345678": 2, "87654321": 1})
+
+    def test_contar_por_dia(self):
+        self.assertEqual(self.tabla.contar_por_dia(), {date(2025, 6, 16): 2, date(2025, 6, 17): 1})
+
+    def test_desactivar_excluye_de_los_conteos(self):
+        self.tabla.desactivar(1)
+        self.assertEqual(len(self.tabla), 3)
+        self.assertEqual(self.tabla.cantidad_activos(), 2)
+        self.assertEqual(self.tabla.contar_por_medico(), {"MN1234": 1, "MP5678": 1})
+        self.assertEqual(self.tabla.contar_por_dia(), {date(2025, 6, 16): 2})
+
+    def test_desactivar_turno_por_medico_y_fecha(self):
+        self.assertTrue(self.tabla.desactivar_turno("MN1234", datetime(2025, 6, 17, 10, 0)))
+        self.assertFalse(self.tabla.desactivar_turno("MN1234", datetime(2025, 6, 17, 10, 0)))
+        self.assertFalse(self.tabla.desactivar_turno("MN9999", datetime(2025, 6, 16, 10, 0)))
+        self.assertEqual(self.tabla.contar_por_medico(), {"MN1234": 1, "MP5678": 1})
+
+    def test_desactivar_turno_vuelto_a_agendar(self):
+        fecha = datetime(2025, 6, 16, 10, 0)
+        self.assertTrue(self.tabla.desactivar_turno("MN1234", fecha))
+        self.tabla.agregar_fila("MN1234", "87654321", "cardiologia", fecha, timedelta(minutes=30))
+        self.assertTrue(self.tabla.desactivar_turno("MN1234", fecha))
+        self.assertFalse(self.tabla.desactivar_turno("MN1234", fecha))
+        self.assertEqual(self.tabla.contar_por_medico(), {"MN1234": 1, "MP5678": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 import sys
 import os
-from datetime import datetime
-from src.turno import Turno
+from datetime import datetime, timedelta
+from src.turno import Turno, DURACION_TURNO_POR_DEFECTO
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
@@ -43,6 +43,19 @@ class TestTurno(unittest.TestCase):
         self.assertEqual(fecha_obtenida.month, 6)
         self.assertEqual(fecha_obtenida.day, 16)
     
+    def test_duracion_por_defecto(self):
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "cardiologia")
+        self.assertEqual(turno.obtener_duracion(), DURACION_TURNO_POR_DEFECTO)
+        self.assertEqual(turno.obtener_fin(), self.fecha_hora + DURACION_TURNO_POR_DEFECTO)
+    
+    def test_duracion_personalizada(self):
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "cardiologia", timedelta(minutes=45))
+        self.assertEqual(turno.obtener_fin(), datetime(2025, 6, 16, 10, 45))
+    
+    def test_duracion_no_positiva_error(self):
+        with self.assertRaises(ValueError):
+            Turno(self.paciente, self.medico, self.fecha_hora, "cardiologia", timedelta(0))
+    
     def test_str_representation(self):
         turno = Turno(self.paciente, self.medico, self.fecha_hora, "cardiologia")
         str_turno = str(turno)
@@ -0,0 +1,47 @@
+import unittest
+from src.validaciones import normalizar_dni, normalizar_matricula, validar_dnis
+from src.excepciones import DNIInvalidoException, MatriculaInvalidaException
+
+
+class TestNormalizarDNI(unittest.TestCase):
+
+    def test_dni_normalizado_se_devuelve_igual(self):
+        dni = "12345678"
+        self.assertIs(normalizar_dni(dni), dni)
+
+    def test_dni_con_separadores(self):
+        self.assertEqual(normalizar_dni("12.345.678"), "12345678")
+        self.assertEqual(normalizar_dni(" 1 234 567 "), "1234567")
+
+    def test_dni_invalido_error(self):
+        for dni in ("", "123456", "123456789", "12a45678", "12-345-678"):
+            with self.assertRaises(DNIInvalidoException):
+                normalizar_dni(dni)
+
+    def test_validar_dnis_en_lote(self):
+        self.assertEqual(
+            validar_dnis(["12345678", "12.345.678", "abc", "", "1234567"]),
+            ["12345678", "12345678", None, None, "1234567"]
+        )
+
+    def test_validar_dnis_acepta_generadores(self):
+        self.assertEqual(validar_dnis(str(n) for n in (10000000, 99)), ["10000000", None])
+
+
+class TestNormalizarMatricula(unittest.TestCase):
+
+    def test_matricula_normalizada_se_devuelve_igual(self):
+        self.assertEqual(normalizar_matricula("MN1234"), "MN1234")
+        self.assertEqual(normalizar_matricula("MP123456"), "MP123456")
+
+    def test_matricula_en_minusculas_con_espacios(self):
+        self.assertEqual(normalizar_matricula("  mp12345 "), "MP12345")
+
+    def test_matricula_invalida_error(self):
+        for matricula in ("", "MX1234", "MN123", "MN1234567", "M1234", "MN12a4"):
+            with self.assertRaises(MatriculaInvalidaException):
+                normalizar_matricula(matricula)
+
+
+if __name__ == '__main__':
+    unittest.main()